@@ -13,7 +13,7 @@ Connection responsibilities:
 """
 
 __author__ = 'Grzegorz Latuszek, Marcin Usielski, Michal Ernst'
-__copyright__ = 'Copyright (C) 2018-2022, Nokia'
+__copyright__ = 'Copyright (C) 2018-2026, Nokia'
 __email__ = 'grzegorz.latuszek@nokia.com, marcin.usielski@nokia.com, michal.ernst@nokia.com'
 
 import logging
@@ -22,6 +22,8 @@ import six
 from moler.config.loggers import RAW_DATA, TRACE
 from moler.exceptions import WrongUsage
 from moler.helpers import instance_id
+from moler.util.connection_metrics import ConnectionMetrics
+from moler.util.observer_cpu_accounting import ObserverCpuAccounting
 from moler.util.loghelper import log_into_logger
 
 
@@ -58,6 +60,7 @@ class AbstractMolerConnection:
         self.logger = AbstractMolerConnection._select_logger(logger_name, self._name)
         self._is_open = True
         self._enabled_logging = True  # Set True to log incoming data. False to not log incoming data.
+        self.metrics = ConnectionMetrics(name=self._name)
 
     @property
     def name(self):
@@ -78,6 +81,7 @@ class AbstractMolerConnection:
         if self._using_default_logger():
             self.logger = AbstractMolerConnection._select_logger(logger_name="", connection_name=value)
         self._name = value
+        self.metrics.name = value
 
     def set_data_logger(self, logger):
         """
@@ -165,6 +169,7 @@ class AbstractMolerConnection:
         encoded_data = self.encode(data)
         # noinspection PyArgumentList
         self.how2send(encoded_data)
+        self.metrics.data_sent(encoded_data)
 
     def change_newline_seq(self, newline_seq="\n"):
         r"""
@@ -282,6 +287,41 @@ class AbstractMolerConnection:
             self._log_data(level=logging.INFO, msg=msg)
             self._log(level=logging.INFO, msg=msg)
 
+    def get_metrics(self):
+        """
+        Get snapshot of metrics of data flowing through connection.
+
+        :return: Dict with counters of data in and out, queues of observers and dispatch latency.
+        """
+        return self.metrics.snapshot()
+
+    def enable_observers_cpu_accounting(self, warning_threshold=0.1):
+        """
+        Enable accounting of thread CPU time and wall time spent by observers of this connection.
+
+        :param warning_threshold: Wall time in seconds of single call of observer to log warning. None to not warn.
+        :return: None
+        """
+        self.metrics.cpu_accounting = ObserverCpuAccounting(warning_threshold=warning_threshold)
+
+    def disable_observers_cpu_accounting(self):
+        """
+        Disable accounting of CPU time of observers of this connection (global accounting is still used if enabled).
+
+        :return: None
+        """
+        self.metrics.cpu_accounting = None
+
+    def get_observers_cpu_usage(self):
+        """
+        Get CPU time and wall time spent by observers per class of observer.
+
+        :return: Dict with name of class as key and dict with calls, cpu_time, wall_time, max_wall_time and
+         slow_calls as value. Empty dict if accounting is disabled.
+        """
+        accounting = self.metrics.cpu_accounting or ObserverCpuAccounting.global_accounting
+        return accounting.snapshot() if accounting is not None else {}
+
     def get_runner(self):
         """
         Get runner instance for the connection.
@@ -32,6 +32,7 @@ from moler.io.raw import TillDoneThread
 from moler.runner import ConnectionObserverRunner
 from moler.runner import result_for_runners, time_out_observer, his_remaining_time, await_future_or_eol
 from moler.util.loghelper import debug_into_logger
+from moler.util import tracked_thread
 
 
 current_process = psutil.Process()
@@ -849,7 +850,8 @@ class AsyncioLoopThread(TillDoneThread):
                                                 done_event=self.ev_loop_done,
                                                 kwargs={'loop': self.ev_loop,
                                                         'loop_started': self.ev_loop_started,
-                                                        'loop_done': self.ev_loop_done})
+                                                        'loop_done': self.ev_loop_done},
+                                                role=tracked_thread.ROLE_ASYNCIO_LOOP)
         # Thread-3  -->  [Thread, 3]
         name_parts = self.name.split('-')
         self.name = f"{name}-{name_parts[-1]}"
@@ -4,22 +4,57 @@ Package for implementing different commands based on Moler Command.
 """
 
 __author__ = 'Grzegorz Latuszek, Marcin Usielski'
-__copyright__ = 'Copyright (C) 2018-2023, Nokia'
+__copyright__ = 'Copyright (C) 2018-2026, Nokia'
 __email__ = 'grzegorz.latuszek@nokia.com, marcin.usielski@nokia.com'
 
 from re import search, match
+from typing import Optional
 from moler.exceptions import WrongUsage
+from moler.util.regex_profiler import RegexProfiler
 
 
 class RegexHelper:
     """
     Class to help with working with regular expressions.
     """
-    def __init__(self):
+
+    profiler = None  # RegexProfiler used by all objects when profiling is enabled, None when disabled.
+
+    def __init__(self, owner=None):
         """
         Initializes internal variables.
+
+        :param owner: Object which uses this helper (command or event). Used only to group profiling statistics.
         """
         self._match = None
+        self._owner_class = owner.__class__ if owner is not None else None
+
+    @classmethod
+    def enable_profiling(cls, long_line_length: int = 200, backtracking_factor: float = 10.0,
+                         slow_call_time: float = 0.001) -> RegexProfiler:
+        """
+        Enable profiling of regular expressions of all RegexHelper objects.
+
+        :param long_line_length: Strings with this length or longer are treated as long.
+        :param backtracking_factor: How many times time per character of long strings must be higher than of short
+         strings to report backtracking candidate.
+        :param slow_call_time: Minimal time in seconds of the slowest call of backtracking candidate.
+        :return: Profiler collecting statistics.
+        """
+        cls.profiler = RegexProfiler(long_line_length=long_line_length, backtracking_factor=backtracking_factor,
+                                     slow_call_time=slow_call_time)
+        return cls.profiler
+
+    @classmethod
+    def disable_profiling(cls) -> Optional[RegexProfiler]:
+        """
+        Disable profiling of regular expressions.
+
+        :return: Profiler which was collecting statistics or None if profiling was disabled.
+        """
+        profiler = cls.profiler
+        cls.profiler = None
+        return profiler
 
     def search(self, pattern, string, flags=0):
         """
@@ -30,7 +65,11 @@ class RegexHelper:
         :param flags: Flags for search.
         :return: Match object.
         """
-        self._match = search(pattern, string, flags)
+        profiler = RegexHelper.profiler
+        if profiler is None:
+            self._match = search(pattern, string, flags)
+        else:
+            self._match = profiler.measure(self._owner_class, pattern, string, search, pattern, string, flags)
         return self._match
 
     def search_compiled(self, compiled, string, raise_if_compiled_is_none=False):
@@ -49,7 +88,11 @@ class RegexHelper:
             else:
                 return None
 
-        self._match = compiled.search(string)
+        profiler = RegexHelper.profiler
+        if profiler is None:
+            self._match = compiled.search(string)
+        else:
+            self._match = profiler.measure(self._owner_class, compiled, string, compiled.search, string)
         return self._match
 
     def match(self, pattern, string, flags=0):
@@ -61,7 +104,11 @@ class RegexHelper:
         :param flags: Flags for search.
         :return: Match object.
         """
-        self._match = match(pattern, string, flags)
+        profiler = RegexHelper.profiler
+        if profiler is None:
+            self._match = match(pattern, string, flags)
+        else:
+            self._match = profiler.measure(self._owner_class, pattern, string, match, pattern, string, flags)
         return self._match
 
     def match_compiled(self, compiled, string, raise_if_compiled_is_none=False):
@@ -79,7 +126,11 @@ class RegexHelper:
                 raise exp
             else:
                 return None
-        self._match = compiled.match(string)
+        profiler = RegexHelper.profiler
+        if profiler is None:
+            self._match = compiled.match(string)
+        else:
+            self._match = profiler.measure(self._owner_class, compiled, string, compiled.match, string)
         return self._match
 
     def get_match(self):
@@ -4,15 +4,17 @@ Generic class for all command with textual output.
 """
 
 __author__ = "Marcin Usielski, Michal Ernst"
-__copyright__ = "Copyright (C) 2018-2024, Nokia"
+__copyright__ = "Copyright (C) 2018-2026, Nokia"
 __email__ = "marcin.usielski@nokia.com, michal.ernst@nokia.com"
 
 import abc
 import datetime
 import logging
+import queue
 import re
+import time
 from threading import Lock
-from typing import Optional, Pattern, Tuple, Union, Sequence
+from typing import Callable, Iterator, Optional, Pattern, Tuple, Union, Sequence
 
 import six
 
@@ -22,6 +24,9 @@ from moler.command import Command
 from moler.exceptions import CommandFailure
 from moler.helpers import regexp_without_anchors
 from moler.runner import ConnectionObserverRunner
+from moler.util.command_latency import CommandLatencyStatistics, calculate_phases_durations
+from moler.util.partial_line import PartialLine
+from moler.util.spilled_lines import SpilledLines
 
 r_default_prompt: str = r"^[^<]*[$%#>~]\s*$"  # When user provides no prompt
 
@@ -35,6 +40,14 @@ class CommandTextualGeneric(Command):
         "\n",
         "\r",
     )  # New line chars on device, not system with script!
+    _line_classifiers = {}  # Fused regexes of prompt, failure and break patterns shared by all commands
+    _line_classifiers_lock = Lock()
+    _max_line_classifiers = 256
+    # Backreferences, conditional groups and global inline flags (i.e. '(?i)', inside alternative they would apply to
+    # whole fused regex or be an error).
+    _re_not_fusable_pattern = re.compile(r"\\[1-9]|\(\?P=|\(\?\(|\(\?[aiLmsux]+\)")
+    # Anchors of whole string and lookarounds (they would see other lines when lines are joined).
+    _re_not_line_local_pattern = re.compile(r"\\[AZz]|\(\?<?[=!]")
 
     def __init__(
         self,
@@ -69,10 +82,15 @@ class CommandTextualGeneric(Command):
         #                                 anything if timeout.
         self.current_ret = {}  # Placeholder for result as-it-grows, before final write into self._result
         self._cmd_output_started = False  # If false parsing is not passed to command
-        self._regex_helper = RegexHelper()  # Object to regular expression matching
+        self._regex_helper = RegexHelper(owner=self)  # Object to regular expression matching
         self.ret_required = True  # # Set False for commands not returning parsed result
         self.break_on_timeout = True  # If True then Ctrl+c on timeout
-        self._last_not_full_line = None  # Part of line
+        self._partial_line = PartialLine()  # Not full line, chunks joined when line is complete
+        self.partial_line_window = 4096  # While line is not full on_new_line gets the newest chunk and this number
+        # of previous chars of line (whole line if it is shorter), so parsing of long output without new line chars
+        # is linear. Full line is always passed as a whole.
+        self.max_partial_line_length = None  # If not None then not full line longer than this is passed to
+        # on_new_line as full line (with warning in log) to bound memory. None for no limit.
         self._last_chunk = None  # Stored last chunk of data from connection
         self._re_prompt = CommandTextualGeneric._calculate_prompt(
             prompt
@@ -114,6 +132,10 @@ class CommandTextualGeneric(Command):
             False  # Set True to try to match prompt in line without ^ and $.
         )
         self.debug_data_received = False  # Set True to log as hex all data received by command in data_received
+        self.prompt_only_in_last_line_of_chunk = False  # Set True to check prompt only in the last line of every
+        # chunk of data for commands which do not parse output (do not override on_new_line). Other lines are not
+        # processed if re_fail and break_exec_regex are not set, otherwise they are checked in one search of joined
+        # lines and processed one by one only if any may fail or break. The prompt is expected as the last line.
         self.re_fail = (
             None  # Regex to failure the command if it occurs in the command output
         )
@@ -123,6 +145,18 @@ class CommandTextualGeneric(Command):
 
         self._re_prompt_without_anchors = regexp_without_anchors(self._re_prompt)
         self._re_failure_exception = None
+        self._output_line_callbacks = []  # Functions called with every line of output stored by _add_output_line.
+        self._store_output_lines = True  # If False then lines passed to _add_output_line are not stored in current_ret.
+        self._max_output_bytes_in_memory = None  # If not None then lines of output are moved to temporary file
+        # when they take more bytes.
+        self._lifecycle_times = {"sent": None, "echo": None, "first_output": None, "done": None}  # time.monotonic()
+        self._line_classifier = None  # One regex fused from prompt, re_fail and break_exec_regex. Rebuilt when
+        # any of them changes.
+        self._line_classifier_key = None  # Patterns the current _line_classifier was built from.
+        self._classified_line = None  # The last line checked by _line_classifier.
+        self._classified_line_may_match = True  # Result of check of _classified_line.
+        self._lines_classifier = None  # re_fail and break_exec_regex fused to search in many joined lines.
+        self._lines_classifier_key = None  # Patterns the current _lines_classifier was built from.
 
     @property
     def break_exec_regex(self) -> Pattern:
@@ -235,6 +269,7 @@ class CommandTextualGeneric(Command):
                     exception=exception
                 )
             if value and not self._is_done:
+                self._record_lifecycle_done()
                 self.on_done()
                 if self._stored_exception or self.cancelled():
                     self.on_failure()
@@ -282,6 +317,9 @@ class CommandTextualGeneric(Command):
         self._last_chunk = data
         try:
             lines = data.splitlines(True)
+            if self._cmd_output_started and self.prompt_only_in_last_line_of_chunk and self._is_pass_through():
+                self._process_last_line_of_chunk(lines=lines)
+                lines = []
             for current_chunk in lines:
                 if self.__class__.__name__ == "CmConnect":  # pragma: no cover
                     self.logger.debug(
@@ -333,6 +371,68 @@ class CommandTextualGeneric(Command):
                 )
 
     # pylint: disable=unused-argument
+    def _is_pass_through(self) -> bool:
+        """
+        Checks if command only waits for prompt and does not parse output.
+
+        :return: True if on_new_line is not overridden, False otherwise.
+        """
+        return type(self).on_new_line is CommandTextualGeneric.on_new_line
+
+    def _process_last_line_of_chunk(self, lines: list) -> None:
+        """
+        Processes only the last line of chunk of data from connection. Previous lines are checked only against
+        failure indication and break regex if set.
+
+        :param lines: Lines (with new line chars) of one chunk of data.
+        :return: None
+        """
+        if not lines:
+            return
+        if len(lines) > 1 and self._full_lines_may_fail_or_break(lines=lines[:-1]):
+            for current_chunk in lines[:-1]:
+                line, is_full_line = self._update_from_cached_incomplete_line(current_chunk=current_chunk)
+                decoded_line = self._decode_line(line=line)
+                self.failure_indiction(line=decoded_line, is_full_line=is_full_line)
+                self._break_exec_on_regex(line=decoded_line, is_full_line=is_full_line)
+        elif len(lines) > 1:
+            self._partial_line.clear()  # Part of the first line, all lines but the last are full lines.
+        line, is_full_line = self._update_from_cached_incomplete_line(current_chunk=lines[-1])
+        self._process_line_from_command(line=line, current_chunk=lines[-1], is_full_line=is_full_line)
+
+    def _full_lines_may_fail_or_break(self, lines: list) -> bool:
+        """
+        Checks in one search of joined lines if any line may match the failure indication or the break regex.
+
+        :param lines: Full lines (with new line chars) of one chunk. The first one ends not full line cached before.
+        :return: False if no line matches, True if any line may match or patterns cannot be searched in joined lines.
+        """
+        key = (self.re_fail, self.break_exec_regex)
+        if key == (None, None):
+            return False
+        if key != self._lines_classifier_key:
+            self._lines_classifier = CommandTextualGeneric._get_lines_classifier(patterns=key)
+            self._lines_classifier_key = key
+        if self._lines_classifier is None:
+            return True
+        text = self._decode_line(line=self._partial_line.get_line() + "".join(lines))
+        return self._lines_classifier.search("\n".join(text.splitlines())) is not None
+
+    @staticmethod
+    def _get_lines_classifier(patterns: Tuple[Optional[Pattern], ...]) -> Optional[Pattern]:
+        """
+        Gets regex which matches many lines joined by new line char if and only if any of passed patterns matches any
+        of the lines (or lines are joined by the match itself).
+
+        :param patterns: Compiled regexes (or None) to fuse.
+        :return: Compiled regex object or None if patterns cannot be fused or searched in joined lines.
+        """
+        for pattern in patterns:
+            if pattern is not None and (not isinstance(pattern.pattern, str) or
+                                        CommandTextualGeneric._re_not_line_local_pattern.search(pattern.pattern)):
+                return None
+        return CommandTextualGeneric._get_line_classifier(patterns=patterns, flags=re.MULTILINE)
+
     def _process_line_from_command(
         self, current_chunk: str, line: str, is_full_line: bool
     ) -> None:
@@ -344,6 +444,8 @@ class CommandTextualGeneric(Command):
         :param is_full_line: True if line had newline char(s). False otherwise.
         :return: None
         """
+        if self._lifecycle_times["first_output"] is None:
+            self._lifecycle_times["first_output"] = time.monotonic()
         decoded_line = self._decode_line(line=line)
         if self.__class__.__name__ == "CmConnect":  # pragma: no cover
             self.logger.debug(
@@ -360,7 +462,7 @@ class CommandTextualGeneric(Command):
         :return: None
         """
         if self._concatenate_before_command_starts and not self._cmd_output_started and is_full_line:
-            self._last_not_full_line = line
+            self._partial_line.set(line)
 
     def _update_from_cached_incomplete_line(
         self, current_chunk: str
@@ -372,16 +474,19 @@ class CommandTextualGeneric(Command):
         :return: Concatenated (if necessary) line from connection without newline char(s). Flag: True if line had
          newline char(s), False otherwise.
         """
-        line = current_chunk
-        if self._last_not_full_line is not None:
-            line = f"{self._last_not_full_line}{line}"
-            self._last_not_full_line = None
-        is_full_line = self.has_endline_char(line)
+        is_full_line = self.has_endline_char(current_chunk)
         if is_full_line:
-            line = self._strip_new_lines_chars(line)
-        else:
-            self._last_not_full_line = line
-        return line, is_full_line
+            line = current_chunk
+            if not self._partial_line.is_empty():
+                self._partial_line.append(current_chunk)
+                line = self._partial_line.pop_line()
+            return self._strip_new_lines_chars(line), is_full_line
+        self._partial_line.append(current_chunk)
+        if self.max_partial_line_length is not None and len(self._partial_line) > self.max_partial_line_length:
+            self._log(lvl=logging.WARNING,
+                      msg=f"Not full line longer than {self.max_partial_line_length} chars passed as full line.")
+            return self._partial_line.pop_line(), True
+        return self._partial_line.get_tail(len(current_chunk) + self.partial_line_window), is_full_line
 
     @abc.abstractmethod
     def build_command_string(self) -> str:
@@ -423,7 +528,7 @@ class CommandTextualGeneric(Command):
         :param line: Line from device.
         :return: True if end of command is reached, False otherwise.
         """
-        if self._regex_helper.search_compiled(self._re_prompt, line):
+        if self._line_may_match_classifier(line) and self._regex_helper.search_compiled(self._re_prompt, line):
             return True
         # when command is broken via Ctrl-C then ^C may be appended to start of prompt
         # if prompt regexp requires "at start of line" via r'^' then such ^C concatenation will falsify prompt
@@ -434,7 +539,7 @@ class CommandTextualGeneric(Command):
             ):
                 return True
         if self.enter_on_prompt_without_anchors is True:
-            if self._regex_helper.search_compiled(
+            if self._line_may_match_classifier(line) and self._regex_helper.search_compiled(
                 self._re_prompt_without_anchors, line
             ):
                 self.logger.info(
@@ -444,6 +549,72 @@ class CommandTextualGeneric(Command):
                 self.enter_on_prompt_without_anchors = False
         return False
 
+    def _line_may_match_classifier(self, line: str) -> bool:
+        """
+        Checks in one search of fused regex if line may match the prompt, the failure indication or the break regex.
+        Result for the last line is kept, so every check of the same line costs no more regex search.
+
+        :param line: Line from device.
+        :return: False if none of the patterns matches the line, True otherwise.
+        """
+        key = (self._re_prompt, self.re_fail, self._break_exec_regex,
+               self._re_prompt_without_anchors if self.enter_on_prompt_without_anchors is True else None)
+        if key != self._line_classifier_key:
+            self._line_classifier = CommandTextualGeneric._get_line_classifier(patterns=key)
+            self._line_classifier_key = key
+            self._classified_line = None
+        elif line is self._classified_line:
+            return self._classified_line_may_match
+        may_match = self._line_classifier is None or self._line_classifier.search(line) is not None
+        self._classified_line = line
+        self._classified_line_may_match = may_match
+        return may_match
+
+    @staticmethod
+    def _get_line_classifier(patterns: Tuple[Optional[Pattern], ...], flags: int = 0) -> Optional[Pattern]:
+        """
+        Gets regex which matches a line if and only if any of passed patterns matches it.
+
+        :param patterns: Compiled regexes (or None) to fuse.
+        :param flags: Flags added to flags of every pattern.
+        :return: Compiled regex object or None if patterns cannot be fused.
+        """
+        patterns_key = tuple((pattern.pattern, pattern.flags | flags) for pattern in patterns if pattern is not None)
+        with CommandTextualGeneric._line_classifiers_lock:
+            if patterns_key in CommandTextualGeneric._line_classifiers:
+                return CommandTextualGeneric._line_classifiers[patterns_key]
+        classifier = CommandTextualGeneric._fuse_patterns(patterns_key=patterns_key)
+        with CommandTextualGeneric._line_classifiers_lock:
+            if len(CommandTextualGeneric._line_classifiers) >= CommandTextualGeneric._max_line_classifiers:
+                CommandTextualGeneric._line_classifiers.clear()
+            CommandTextualGeneric._line_classifiers[patterns_key] = classifier
+        return classifier
+
+    @staticmethod
+    def _fuse_patterns(patterns_key: Tuple[Tuple[str, int], ...]) -> Optional[Pattern]:
+        """
+        Fuses patterns into one alternative. Flags of every pattern are kept as scoped inline flags.
+
+        :param patterns_key: Tuple of pairs: regex string, regex flags.
+        :return: Compiled regex object or None if patterns cannot be fused.
+        """
+        inline_flags = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"))
+        alternatives = []
+        for pattern, flags in patterns_key:
+            if not isinstance(pattern, str) or CommandTextualGeneric._re_not_fusable_pattern.search(pattern):
+                return None
+            flags &= ~re.UNICODE
+            scoped_flags = "".join(letter for flag, letter in inline_flags if flags & flag)
+            if flags & ~(re.IGNORECASE | re.MULTILINE | re.DOTALL):
+                return None
+            alternatives.append(f"(?{scoped_flags}:{pattern})")
+        if not alternatives:
+            return None
+        try:
+            return re.compile("|".join(alternatives))
+        except re.error:
+            return None
+
     def _strip_new_lines_chars(self, line: str) -> str:
         """
         Removes new line char(s) from line.
@@ -474,6 +645,7 @@ class CommandTextualGeneric(Command):
         ) or not self.newline_after_command_string:
             if self._regex_helper.search_compiled(self._cmd_escaped, line):
                 self._cmd_output_started = True
+                self._lifecycle_times["echo"] = time.monotonic()
         if self.__class__.__name__ == "CmConnect":  # pragma: no cover
             self.logger.debug(
                 f"{self} line = '{line}', is_full_line={is_full_line}, _cmd_output_started={self._cmd_output_started}"
@@ -571,17 +743,102 @@ class CommandTextualGeneric(Command):
             is_ret = True
         return is_ret
 
+    def set_output_streaming(self, line_callback: Optional[Callable[[str], None]] = None,
+                             max_bytes_in_memory: Optional[int] = None, store_lines: bool = True) -> None:
+        """
+        Sets how lines of output are passed by commands returning output lines (like cat, tail, dmesg, find). Call
+        before the command is started.
+
+        :param line_callback: Function called with every line of output as soon as it is parsed.
+        :param max_bytes_in_memory: If not None then lines are moved to temporary file when they take more bytes
+         and are read lazily from result. None to keep all lines in memory.
+        :param store_lines: Set False to not store lines in result at all (only line_callback gets them).
+        :return: None
+        """
+        if line_callback is not None:
+            self._output_line_callbacks.append(line_callback)
+        self._max_output_bytes_in_memory = max_bytes_in_memory
+        self._store_output_lines = store_lines
+
+    def output_lines(self, tick: float = 0.05) -> Iterator[str]:
+        """
+        Returns generator of lines of output. Lines are yielded as they are parsed, generator stops when command is
+        done. Call before the command is started.
+
+        :param tick: Time in seconds between checks if command is done.
+        :return: Generator of lines.
+        """
+        lines_queue = queue.Queue()
+        self._output_line_callbacks.append(lines_queue.put)
+
+        def _output_lines_generator():
+            while True:
+                try:
+                    yield lines_queue.get(timeout=tick)
+                except queue.Empty:
+                    if self.done() and lines_queue.empty():
+                        break
+
+        return _output_lines_generator()
+
+    def _add_output_line(self, line: str, key: str = "LINES") -> None:
+        """
+        Adds line of output to current_ret[key] and passes it to line callbacks.
+
+        :param line: Line of output.
+        :param key: Key in current_ret with list of lines.
+        :return: None
+        """
+        for line_callback in self._output_line_callbacks:
+            line_callback(line)
+        if self._store_output_lines:
+            lines = self.current_ret[key]
+            if self._max_output_bytes_in_memory is not None and not isinstance(lines, SpilledLines):
+                lines = SpilledLines(max_bytes_in_memory=self._max_output_bytes_in_memory, lines=lines)
+                self.current_ret[key] = lines
+            lines.append(line)
+
     def send_command(self) -> None:
         """
         Sends command string over connection.
 
         :return: None
         """
+        self._lifecycle_times["sent"] = time.monotonic()
         if self.newline_after_command_string:
             self.connection.sendline(self.command_string)
         else:
             self.connection.send(self.command_string)
 
+    def get_lifecycle_times(self) -> dict:
+        """
+        Gets moments of command lifecycle and durations of its phases.
+
+        :return: Dict with monotonic times of moments (enqueued, submitted, sent, echo, first_output, done; None if
+         not reached) and durations of phases in seconds (queue_wait, echo, first_output, prompt, total).
+        """
+        times = {
+            "enqueued": self.life_status.enqueued_time,
+            "submitted": self.life_status.submitted_time,
+        }
+        times.update(self._lifecycle_times)
+        return {"times": times, "durations": calculate_phases_durations(times)}
+
+    def _record_lifecycle_done(self) -> None:
+        """
+        Records the moment command is done and passes durations of phases to statistics. Called once, when command
+        becomes done.
+
+        :return: None
+        """
+        self._lifecycle_times["done"] = time.monotonic()
+        if self._lifecycle_times["sent"] is None or not CommandLatencyStatistics.enabled:
+            return  # Command was not started.
+        device = self.connection.name if self.connection is not None else None
+        CommandLatencyStatistics.record(device=device,
+                                        command_class=f"{self.__class__.__module__}.{self.__class__.__name__}",
+                                        durations=self.get_lifecycle_times()["durations"])
+
     def send_enter(self) -> None:
         """
         Sends enter over connection.
@@ -608,7 +865,7 @@ class CommandTextualGeneric(Command):
         """
         if self.break_exec_only_full_line and not is_full_line:
             return
-        if self.break_exec_regex is not None and self._regex_helper.search_compiled(
+        if self.break_exec_regex is not None and self._line_may_match_classifier(line) and self._regex_helper.search_compiled(
             self.break_exec_regex, line
         ):
             self.break_cmd()
@@ -629,8 +886,8 @@ class CommandTextualGeneric(Command):
         :param is_full_line: Indicates if the line is a full line or a partial line.
         :return: True if the line is a failure indication, False otherwise.
         """
-        if self.re_fail is not None and is_full_line and self._regex_helper.search_compiled(
-                compiled=self.re_fail, string=line):
+        if self.re_fail is not None and is_full_line and self._line_may_match_classifier(line) and \
+                self._regex_helper.search_compiled(compiled=self.re_fail, string=line):
             return True
         return False
 
@@ -10,7 +10,7 @@ from moler.exceptions import CommandTimeout
 import re
 
 __author__ = 'Sylwester Golonka, Marcin Usielski'
-__copyright__ = 'Copyright (C) 2018-2023, Nokia'
+__copyright__ = 'Copyright (C) 2018-2026, Nokia'
 __email__ = 'sylwester.golonka@nokia.com, marcin.usielski@nokia.com'
 
 
@@ -92,7 +92,7 @@ class Cat(GenericUnixCommand):
 
     def _parse_line(self, line):
         if not line == "":
-            self.current_ret["LINES"].append(line)
+            self._add_output_line(line=line)
         raise ParsingDone
 
 
@@ -4,7 +4,7 @@ cut command module.
 """
 
 __author__ = "Marcin Szlapa"
-__copyright__ = "Copyright (C) 2019, Nokia"
+__copyright__ = "Copyright (C) 2019-2026, Nokia"
 __email__ = "marcin.szlapa@nokia.com"
 
 import re
@@ -87,7 +87,7 @@ class Cut(GenericUnixCommand):
 
     def _parse_cut(self, line):
         if line:
-            self.current_ret["LINES"].append(line)
+            self._add_output_line(line=line)
             raise ParsingDone
 
 
@@ -6,7 +6,7 @@ from moler.cmd.unix.genericunix import GenericUnixCommand
 from moler.exceptions import ParsingDone
 
 __author__ = 'Sylwester Golonka'
-__copyright__ = 'Copyright (C) 2018, Nokia'
+__copyright__ = 'Copyright (C) 2018-2026, Nokia'
 __email__ = 'sylwester.golonka@nokia.com'
 
 
@@ -32,7 +32,7 @@ class Dmesg(GenericUnixCommand):
 
     def _parse_line(self, line):
         if not line == "":
-            self.current_ret["LINES"].append(line)
+            self._add_output_line(line=line)
         raise ParsingDone
 
 
@@ -4,7 +4,7 @@ Find command module.
 """
 
 __author__ = "Adrianna Pienkowska, Marcin Usielski"
-__copyright__ = "Copyright (C) 2018, Nokia"
+__copyright__ = "Copyright (C) 2018-2026, Nokia"
 __email__ = "adrianna.pienkowska@nokia.com, marcin.usielski@nokia.com"
 
 import re
@@ -111,7 +111,7 @@ class Find(GenericUnixCommand):
         :param line: Line from device
         :return: None but raises ParsingDone
         """
-        self.current_ret["RESULT"].append(line)
+        self._add_output_line(line=line, key="RESULT")
         raise ParsingDone()
 
 
@@ -4,7 +4,7 @@ Generic Unix/Linux module
 """
 
 __author__ = 'Marcin Usielski', 'Jakub Kochaniak'
-__copyright__ = 'Copyright (C) 2018-2024, Nokia'
+__copyright__ = 'Copyright (C) 2018-2026, Nokia'
 __email__ = 'marcin.usielski@nokia.com', 'jakub.kochaniak@nokia.com'
 
 import re
@@ -70,6 +70,14 @@ class GenericUnixCommand(CommandTextualGeneric):
                 pass
         return super(GenericUnixCommand, self).on_new_line(line, is_full_line)
 
+    def _is_pass_through(self) -> bool:
+        """
+        Checks if command only waits for prompt and does not parse output.
+
+        :return: True if on_new_line is not overridden and Ctrl+z is not sent, False otherwise.
+        """
+        return type(self).on_new_line is GenericUnixCommand.on_new_line and not self._ctrl_z_sent
+
     def on_timeout(self) -> None:
         """
         Callback called by framework when timeout occurs.
@@ -8,7 +8,7 @@ from moler.exceptions import ParsingDone
 import re
 
 __author__ = 'Mateusz Szczurek, Sylwester Golonka'
-__copyright__ = 'Copyright (C) 2019, Nokia'
+__copyright__ = 'Copyright (C) 2019-2026, Nokia'
 __email__ = 'mateusz.m.szczurek@nokia.com, sylwester.golonka@nokia.com'
 
 
@@ -80,7 +80,7 @@ class Head(GenericUnixCommand):
         :param line: Line to process.
         :return: None but raises ParsingDone if line has the information to handle by this method.
         """
-        self.current_ret["LINES"].append(line)
+        self._add_output_line(line=line)
         raise ParsingDone
 
 
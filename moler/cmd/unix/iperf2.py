@@ -17,17 +17,23 @@ Important changes:
 """
 
 __author__ = "Grzegorz Latuszek, Marcin Usielski"
-__copyright__ = "Copyright (C) 2019-2024, Nokia"
+__copyright__ = "Copyright (C) 2019-2026, Nokia"
 __email__ = "grzegorz.latuszek@nokia.com, marcin.usielski@nokia.com"
 
 
 import re
+from collections import deque, namedtuple
 
 from moler.cmd.unix.genericunix import GenericUnixCommand
 from moler.exceptions import CommandFailure, ParsingDone
 from moler.publisher import Publisher
 from moler.util.converterhelper import ConverterHelper
 
+# Compact interval record published in streaming mode. Transfer and bandwidth in Bytes and Bytes/sec, fields not
+# present in iperf output are None.
+IperfIntervalRecord = namedtuple("IperfIntervalRecord", ["start", "end", "transfer", "bandwidth", "jitter",
+                                                         "lost_datagrams", "total_datagrams"])
+
 
 class Iperf2(GenericUnixCommand, Publisher):
     """
@@ -63,10 +69,15 @@ class Iperf2(GenericUnixCommand, Publisher):
 
       ("192.168.0.10", "5016@192.168.0.12"): {'report': {<report dict here>}}
 
+    In streaming mode (for long runs) only two last statistics dicts are kept per connection, interval records are
+    published to subscribers as IperfIntervalRecord tuples and multiport summaries are calculated from per-interval
+    accumulators.
     """
 
+    _max_pending_multiport_intervals = 4  # Per client host, in streaming mode
+
     def __init__(
-        self, connection, options, prompt=None, newline_chars=None, runner=None
+        self, connection, options, prompt=None, newline_chars=None, runner=None, streaming=False
     ):
         """
         Create iperf2 command
@@ -76,6 +87,8 @@ class Iperf2(GenericUnixCommand, Publisher):
         :param prompt: prompt (regexp) where iperf starts from, if None - default prompt regexp used
         :param newline_chars: expected newline characters of iperf output
         :param runner: runner used for command
+        :param streaming: Set True to keep bounded memory: only two last records per connection are stored and
+         interval records are published as IperfIntervalRecord.
         """
         super(Iperf2, self).__init__(
             connection=connection,
@@ -86,6 +99,7 @@ class Iperf2(GenericUnixCommand, Publisher):
         self.port, self.options = self._validate_options(options)
         self.current_ret["CONNECTIONS"] = {}
         self.current_ret["INFO"] = []
+        self.streaming = streaming
 
         # private values
         self._connection_dict = {}
@@ -95,6 +109,7 @@ class Iperf2(GenericUnixCommand, Publisher):
         self._got_server_report = False
         self._stopping_server = False
         self._output_parsed = False
+        self._multiport_intervals = {}  # (client_host, interval) -> {connection_name: record}, in streaming mode
 
     def __str__(self):
         str_base_value = super(Iperf2, self).__str__()
@@ -385,7 +400,9 @@ class Iperf2(GenericUnixCommand, Publisher):
             if self._need_add_multiport_summary_record_of_interval(
                 connection_name, normalized_iperf_record
             ):
-                self._calculate_multiport_summary_record_of_interval(connection_name)
+                self._calculate_multiport_summary_record_of_interval(
+                    connection_name, interval_records=self._pop_multiport_interval_records(connection_name)
+                )
             self._parse_final_record(connection_name)
             if self.protocol == "udp" and self._got_server_report_hdr:
                 self._got_server_report = True
@@ -408,7 +425,8 @@ class Iperf2(GenericUnixCommand, Publisher):
         if connection_name in self.current_ret["CONNECTIONS"]:
             self.current_ret["CONNECTIONS"][connection_name].append(info_dict)
         else:
-            connection_dict = {connection_name: [info_dict]}
+            records = deque([info_dict], maxlen=2) if self.streaming else [info_dict]
+            connection_dict = {connection_name: records}
             self.current_ret["CONNECTIONS"].update(connection_dict)
 
     def _all_multiport_records_of_interval(self, connection_name):
@@ -443,46 +461,64 @@ class Iperf2(GenericUnixCommand, Publisher):
             return False
         if self._is_final_record(last_iperf_record):
             return False
+        if self.streaming:
+            return self._add_multiport_interval_record(connection_name, last_iperf_record)
         if not self._all_multiport_records_of_interval(connection_name):
             return False
         return True
 
-    def _calculate_multiport_summary_record_of_interval(self, connection_name):
+    def _add_multiport_interval_record(self, connection_name, iperf_record):
+        """
+        Adds record to accumulator of its interval.
+
+        :param connection_name: Connection of record.
+        :param iperf_record: Record of interval.
+        :return: True if all connections of the same client host have record of this interval, False otherwise.
+        """
+        client_host = self._split_connection_name(connection_name)[0]
+        key = (client_host, iperf_record["Interval"])
+        if key not in self._multiport_intervals:
+            self._multiport_intervals[key] = {}
+            max_pending = Iperf2._max_pending_multiport_intervals * len(self._same_host_connections)
+            while len(self._multiport_intervals) > max_pending:  # intervals never completed, connection lost
+                del self._multiport_intervals[next(iter(self._multiport_intervals))]
+        interval_records = self._multiport_intervals[key]
+        interval_records[connection_name] = iperf_record
+        return len(interval_records) >= len(self._same_host_connections[client_host])
+
+    def _pop_multiport_interval_records(self, connection_name):
+        """
+        Removes accumulator of the last interval of connection.
+
+        :param connection_name: Connection of the last record.
+        :return: Records of interval in order of connections of client host or None if not in streaming mode.
+        """
+        if not self.streaming:
+            return None
+        client_host = self._split_connection_name(connection_name)[0]
+        interval = self.current_ret["CONNECTIONS"][connection_name][-1]["Interval"]
+        interval_records = self._multiport_intervals.pop((client_host, interval))
+        return [interval_records[conn] for conn in self._same_host_connections[client_host]]
+
+    def _calculate_multiport_summary_record_of_interval(self, connection_name, interval_records=None):
         client, server = connection_name
         # pylint: disable-next=unused-variable
         client_port, client_host = client.split("@")
         connections = self._same_host_connections[client_host]
 
         interval = self.current_ret["CONNECTIONS"][connection_name][-1]["Interval"]
-        if interval == (4.0, 5.0):
-            pass
-        transfers = [
-            self._get_last_record_of_interval(conn, interval)["Transfer"]
-            for conn in connections
-        ]
-        raw_transfers = [
-            self._get_last_record_of_interval(conn, interval)["Transfer Raw"]
-            for conn in connections
-        ]
-        bandwidths = [
-            self._get_last_record_of_interval(conn, interval)["Bandwidth"]
-            for conn in connections
-        ]
-        raw_bandwidths = [
-            self._get_last_record_of_interval(conn, interval)["Bandwidth Raw"]
-            for conn in connections
-        ]
-        if self.protocol == "udp":
-            jitters = [
-                self._get_last_record_of_interval(conn, interval)["Jitter"]
-                for conn in connections
-            ]
-            ltds = [
-                self._get_last_record_of_interval(conn, interval)[
-                    "Lost_vs_Total_Datagrams"
-                ]
+        if interval_records is None:
+            interval_records = [
+                self._get_last_record_of_interval(conn, interval)
                 for conn in connections
             ]
+        transfers = [record["Transfer"] for record in interval_records]
+        raw_transfers = [record["Transfer Raw"] for record in interval_records]
+        bandwidths = [record["Bandwidth"] for record in interval_records]
+        raw_bandwidths = [record["Bandwidth Raw"] for record in interval_records]
+        if self.protocol == "udp":
+            jitters = [record["Jitter"] for record in interval_records]
+            ltds = [record["Lost_vs_Total_Datagrams"] for record in interval_records]
 
             jitter_unit = jitters[0].split()[1]  # 'Jitter': '0.821 ms'
             jitter_values = [float(jit.split()[0]) for jit in jitters]
@@ -546,6 +582,30 @@ class Iperf2(GenericUnixCommand, Publisher):
                 from_client=from_client, to_server=to_server, data_record=last_record
             )
 
+    def notify_subscribers(self, *args, **kwargs):
+        """
+        Notify all subscribers passing them notification parameters. In streaming mode data_record is passed as
+        IperfIntervalRecord.
+        """
+        if self.streaming and kwargs.get("data_record") is not None:
+            kwargs["data_record"] = self._compact_record(kwargs["data_record"])
+        super(Iperf2, self).notify_subscribers(*args, **kwargs)
+
+    @staticmethod
+    def _compact_record(iperf_record):
+        """
+        Converts record to compact tuple.
+
+        :param iperf_record: dict with record of interval.
+        :return: IperfIntervalRecord
+        """
+        start, end = iperf_record["Interval"]
+        bandwidth = iperf_record.get("Bandwidth", iperf_record.get("Bitrate"))
+        lost_datagrams, total_datagrams = iperf_record.get("Lost_vs_Total_Datagrams",
+                                                           (None, iperf_record.get("Total_Datagrams")))
+        return IperfIntervalRecord(start, end, iperf_record["Transfer"], bandwidth, iperf_record.get("Jitter"),
+                                   lost_datagrams, total_datagrams)
+
     def _is_final_record(self, last_record):
         start, end = last_record["Interval"]
         if self.interval and (self.interval < self.time):  # interval reports
@@ -14,7 +14,7 @@ Important changes (in comparison to Iperf2) to note:
 """
 
 __author__ = "Kacper Kozik,Marcin Usielski"
-__copyright__ = "Copyright (C) 2023-2024, Nokia"
+__copyright__ = "Copyright (C) 2023-2026, Nokia"
 __email__ = "kacper.kozik@nokia.com, marcin.usielski@nokia.com"
 
 
@@ -59,7 +59,7 @@ class Iperf3(Iperf2):
 
     """
 
-    def __init__(self, connection, options, prompt=None, newline_chars=None, runner=None):
+    def __init__(self, connection, options, prompt=None, newline_chars=None, runner=None, streaming=False):
         """
         Create iperf3 command
 
@@ -68,12 +68,15 @@ class Iperf3(Iperf2):
         :param prompt: prompt (regexp) where iperf3 starts from, if None - default prompt regexp used
         :param newline_chars: expected newline characters of iperf3 output
         :param runner: runner used for command
+        :param streaming: Set True to keep bounded memory: only two last records per connection are stored and
+         interval records are published as IperfIntervalRecord.
         """
         super(Iperf3, self).__init__(connection=connection,
                                      prompt=prompt,
                                      newline_chars=newline_chars,
                                      runner=runner,
-                                     options=options)
+                                     options=options,
+                                     streaming=streaming)
 
     def _validate_options(self, options):
         client_only_options = [
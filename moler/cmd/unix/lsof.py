@@ -4,7 +4,7 @@ lsof command module.
 """
 
 __author__ = "Marcin Usielski"
-__copyright__ = "Copyright (C) 2019, Nokia"
+__copyright__ = "Copyright (C) 2019-2026, Nokia"
 __email__ = "marcin.usielski@nokia.com"
 
 import re
@@ -12,6 +12,7 @@ import sys
 
 from moler.cmd.unix.genericunix import GenericUnixCommand
 from moler.exceptions import ParsingDone
+from moler.util.columnar_table import ColumnarTable
 
 
 class Lsof(GenericUnixCommand):
@@ -19,7 +20,7 @@ class Lsof(GenericUnixCommand):
     """Unix lsof command"""
 
     def __init__(
-        self, connection, prompt=None, newline_chars=None, runner=None, options=None
+        self, connection, prompt=None, newline_chars=None, runner=None, options=None, columnar=False
     ):
         """
         Unix lsof command
@@ -29,6 +30,8 @@ class Lsof(GenericUnixCommand):
         :param newline_chars: Characters to split lines - list.
         :param runner: Runner to run command.
         :param options: Options for command lsof
+        :param columnar: Set True to return VALUES as ColumnarTable (rows available as dicts) instead of list of
+         dicts.
         """
         super(Lsof, self).__init__(
             connection=connection,
@@ -37,6 +40,7 @@ class Lsof(GenericUnixCommand):
             runner=runner,
         )
         self.options = options
+        self.columnar = columnar
         self._headers = []
         self._header_pos = []
         self.current_ret["VALUES"] = []
@@ -97,6 +101,8 @@ class Lsof(GenericUnixCommand):
                 position = line.find(header, last_pos)
                 last_pos = position + len(header)
                 self._header_pos.append(position)
+            if self.columnar:
+                self.current_ret["VALUES"] = ColumnarTable(columns=self._headers, convert_numbers=False)
             raise ParsingDone()
 
     def _parse_data(self, line):
@@ -117,7 +123,10 @@ class Lsof(GenericUnixCommand):
                         item[header] = value
                         data_index += 1
                         last_value_position = value_position
-                self.current_ret["VALUES"].append(item)
+                if self.columnar:
+                    self.current_ret["VALUES"].append([item[header] for header in self._headers])
+                else:
+                    self.current_ret["VALUES"].append(item)
                 self.current_ret["NUMBER"] += 1
                 raise ParsingDone()
 
@@ -1,13 +1,14 @@
 # -*- coding: utf-8 -*-
 
 __author__ = "Dariusz Rosinski, Marcin Usielski"
-__copyright__ = "Copyright (C) 2018-2020, Nokia"
+__copyright__ = "Copyright (C) 2018-2026, Nokia"
 __email__ = "dariusz.rosinski@nokia.com, marcin.usielski@nokia.com"
 
 import re
 
 from moler.cmd.unix.genericunix import GenericUnixCommand
 from moler.exceptions import ParsingDone
+from moler.util.columnar_table import ColumnarTable
 from moler.util.converterhelper import ConverterHelper
 
 
@@ -26,7 +27,7 @@ class Ps(GenericUnixCommand):
     """Unix command ps."""
 
     def __init__(
-        self, connection=None, options="", prompt=None, newline_chars=None, runner=None
+        self, connection=None, options="", prompt=None, newline_chars=None, runner=None, columnar=False
     ):
         """
         Represents Unix command ps.
@@ -36,6 +37,7 @@ class Ps(GenericUnixCommand):
         :param prompt: prompt (on system where command runs).
         :param newline_chars: characters to split lines
         :param runner: Runner to run command
+        :param columnar: Set True to return ColumnarTable (rows available as dicts) instead of list of dicts.
         """
         super(Ps, self).__init__(
             connection=connection,
@@ -48,6 +50,7 @@ class Ps(GenericUnixCommand):
         self._headers = None
         self._header_pos = None
         self.ret_required = False
+        self.columnar = columnar
         self._converter_helper = ConverterHelper.get_converter_helper()
 
     def on_new_line(self, line, is_full_line):
@@ -87,6 +90,8 @@ class Ps(GenericUnixCommand):
                         position = line.find(header, previous_pos)
                         self._header_pos.append(position)
                         previous_pos = position + len(header)
+                    if self.columnar:
+                        self.current_ret = ColumnarTable(columns=self._headers)
                     raise ParsingDone()
 
     # 123
@@ -104,6 +109,7 @@ class Ps(GenericUnixCommand):
         """
         if self._headers:
             item = {}
+            values = []
             max_column = len(self._headers)
             previous_end_pos = 0
             for column_nr in range(max_column):
@@ -119,6 +125,10 @@ class Ps(GenericUnixCommand):
 
                 content = line[start_pos:end_pos]
                 content = content.strip()
+                previous_end_pos = end_pos
+                if self.columnar:
+                    values.append(content)  # Converted by ColumnarTable for whole column.
+                    continue
                 try:
                     content = self._converter_helper.to_number(
                         value=content, raise_exception=True
@@ -126,8 +136,7 @@ class Ps(GenericUnixCommand):
                 except ValueError:
                     pass
                 item[self._headers[column_nr]] = content
-                previous_end_pos = end_pos
-            self.current_ret.append(item)
+            self.current_ret.append(values if self.columnar else item)
             raise ParsingDone()
 
     def build_command_string(self):
@@ -4,7 +4,7 @@ Top command module.
 """
 
 __author__ = "Adrianna Pienkowska, Michal Ernst, Marcin Usielski"
-__copyright__ = "Copyright (C) 2018-2020, Nokia"
+__copyright__ = "Copyright (C) 2018-2026, Nokia"
 __email__ = (
     "adrianna.pienkowska@nokia.com, michal.ernst@nokia.com, marcin.usielski@nokia.com"
 )
@@ -13,6 +13,7 @@ import re
 
 from moler.cmd.unix.genericunix import GenericUnixCommand
 from moler.exceptions import CommandFailure, ParsingDone
+from moler.util.columnar_table import ColumnarTable
 from moler.util.converterhelper import ConverterHelper
 
 
@@ -25,6 +26,7 @@ class Top(GenericUnixCommand):
         newline_chars=None,
         runner=None,
         n=1,
+        columnar=False,
     ):
         """
         Top command.
@@ -34,6 +36,8 @@ class Top(GenericUnixCommand):
         :param newline_chars: characters to split lines.
         :param runner: Runner to run command.
         :param n: Specifies number of measurements.
+        :param columnar: Set True to return processes as ColumnarTable (rows available as dicts) instead of list
+         of dicts.
         """
         super(Top, self).__init__(
             connection=connection,
@@ -45,6 +49,7 @@ class Top(GenericUnixCommand):
         self._processes_list_headers = []
         self.current_ret = {}
         self.n = n
+        self.columnar = columnar
         self._converter_helper = ConverterHelper.get_converter_helper()
 
     def build_command_string(self):
@@ -231,7 +236,10 @@ class Top(GenericUnixCommand):
         """
         if self._regex_helper.search_compiled(Top._re_processes_header, line) and not self._processes_list_headers:
             self._processes_list_headers.extend(line.strip().split())
-            self.current_ret.update({"processes": []})
+            if self.columnar:
+                self.current_ret.update({"processes": ColumnarTable(columns=self._processes_list_headers)})
+            else:
+                self.current_ret.update({"processes": []})
             raise ParsingDone
 
     def _parse_processes_list(self, line):
@@ -242,6 +250,9 @@ class Top(GenericUnixCommand):
         """
         if self._processes_list_headers:
             processes_info = line.strip().split()
+            if self.columnar:
+                self.current_ret["processes"].append(processes_info)  # Converted by ColumnarTable for whole column.
+                return
             processes_info = [
                 self._if_number_convert_to_int_or_float(process_info)
                 for process_info in processes_info
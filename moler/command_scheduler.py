@@ -3,7 +3,7 @@
 """Scheduler for commands and events."""
 
 __author__ = "Marcin Usielski"
-__copyright__ = "Copyright (C) 2019-2025, Nokia"
+__copyright__ = "Copyright (C) 2019-2026, Nokia"
 __email__ = "marcin.usielski@nokia.com"
 
 import logging
@@ -12,6 +12,8 @@ import time
 from threading import Thread
 
 from moler.exceptions import CommandTimeout
+from moler.util import tracked_thread
+from moler.util.trace_recorder import TraceRecorder
 
 
 class CommandScheduler:
@@ -27,6 +29,7 @@ class CommandScheduler:
         :return: None
         """
         scheduler = CommandScheduler._get_scheduler()
+        connection_observer.life_status.enqueued_time = time.monotonic()
         if not connection_observer.is_command():  # Passed observer, not command.
             scheduler._submit(connection_observer)  # pylint: disable=protected-access
             return
@@ -42,6 +45,7 @@ class CommandScheduler:
             name="CommandScheduler",
         )
         t1.daemon = True
+        tracked_thread.register_thread(role=tracked_thread.ROLE_COMMAND_SCHEDULER, thread=t1)
         t1.start()
         connection_observer._log(logging.WARNING, f"Requested to execute command ({connection_observer}) but the other "
                                  "command is running. Waiting for a free slot.")
@@ -107,7 +111,15 @@ class CommandScheduler:
             if wait_for_slot:
                 self._add_command_to_queue(cmd=cmd)
                 start_time = cmd.life_status.start_time
-                if self._wait_for_slot_for_command(cmd=cmd):
+                wait_start_time = time.monotonic()
+                got_slot = self._wait_for_slot_for_command(cmd=cmd)
+                recorder = TraceRecorder.active
+                if recorder is not None:
+                    recorder.complete(name=f"queue wait {cmd.__class__.__name__}", category="scheduler",
+                                      start_time=wait_start_time,
+                                      args={"command": str(cmd), "connection": cmd.connection.name,
+                                            "got_slot": got_slot})
+                if got_slot:
                     self._submit(connection_observer=cmd)
                     return True
                 # If we are here it means command timeout before it really starts.
@@ -245,4 +257,5 @@ class CommandScheduler:
         """
         runner = connection_observer.runner
         if not connection_observer._is_done and not runner.is_in_shutdown():  # pylint: disable=protected-access
+            connection_observer.life_status.submitted_time = time.monotonic()
             connection_observer._future = runner.submit(connection_observer)  # pylint: disable=protected-access
@@ -16,6 +16,7 @@ from moler.config import devices as dev_cfg
 from moler.config import loggers as log_cfg
 from moler.exceptions import MolerException, WrongUsage
 from moler.helpers import compare_objects, copy_dict
+from moler.util.observer_cpu_accounting import ObserverCpuAccounting
 
 loaded_config = ["NOT_LOADED_YET"]
 
@@ -117,6 +118,7 @@ def load_config(config=None, from_env_var=None, *args, **kwargs):
     if add_devices_only is False:
         load_logger_from_config(config)
         load_connection_from_config(config)
+        load_observers_cpu_accounting_from_config(config)
     load_device_from_config(config=config, add_only=add_devices_only)
 
 
@@ -132,6 +134,25 @@ def load_connection_from_config(config):
                 conn_cfg.set_default_variant(io_type, variant)
 
 
+def load_observers_cpu_accounting_from_config(config):
+    """
+    Enable accounting of CPU time of observers for all connections.
+
+    OBSERVERS_CPU_ACCOUNTING:
+      ENABLED: True
+      WARNING_THRESHOLD: 0.1  # seconds of single call of observer to log warning, null to not warn
+
+    :param config: moler config as dict.
+    :return: None
+    """
+    if "OBSERVERS_CPU_ACCOUNTING" in config:
+        accounting_config = config["OBSERVERS_CPU_ACCOUNTING"] or {}
+        if accounting_config.get("ENABLED", True):
+            ObserverCpuAccounting.enable_globally(warning_threshold=accounting_config.get("WARNING_THRESHOLD", 0.1))
+        else:
+            ObserverCpuAccounting.disable_globally()
+
+
 def _load_topology(topology):
     """
     Loads topology from passed dict.
@@ -259,6 +280,9 @@ def load_logger_from_config(config):
         if "RAW_LOG" in config["LOGGER"]:
             if config["LOGGER"]["RAW_LOG"] is True:
                 log_cfg.raw_logs_active = True
+        if "BINARY_RAW_LOG" in config["LOGGER"]:
+            if config["LOGGER"]["BINARY_RAW_LOG"] is True:
+                log_cfg.binary_raw_logs_active = True
         if "DEBUG_LEVEL" in config["LOGGER"]:
             log_cfg.configure_debug_level(level=config["LOGGER"]["DEBUG_LEVEL"])
         if "DATE_FORMAT" in config["LOGGER"]:
@@ -322,5 +346,6 @@ def clear():
     """Cleanup Moler's configuration"""
     global loaded_config  # pylint: disable=global-statement
     loaded_config = ["NOT_LOADED_YET"]
+    ObserverCpuAccounting.disable_globally()
     conn_cfg.clear()
     dev_cfg.clear()
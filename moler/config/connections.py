@@ -49,6 +49,7 @@ def set_defaults():
     """Set defaults for connections configuration"""
     set_default_variant(io_type="terminal", variant="threaded")
     set_default_variant(io_type="sshshell", variant="threaded")
+    set_default_variant(io_type="replay", variant="threaded")
 
 
 supported_unix_systems = ['Linux', "FreeBSD", "Darwin", "SunOS"]
@@ -124,6 +125,7 @@ def _register_builtin_connections(connection_factory, moler_conn_class):
     from moler.io.raw.memory import ThreadedFifoBuffer
     from moler.io.raw.tcp import ThreadedTcp
     from moler.io.raw.sshshell import ThreadedSshShell
+    from moler.io.raw.replay import ThreadedReplay
 
     def mem_thd_conn(name=None, echo=True, **kwargs):  # kwargs to pass  logger_name
         mlr_conn = mlr_conn_utf8(moler_conn_class, name=name)
@@ -158,6 +160,13 @@ def _register_builtin_connections(connection_factory, moler_conn_class):
                                        **kwargs)  # receive_buffer_size, logger_name, other login credentials
         return io_conn
 
+    def replay_thd_conn(path, trace_path=None, mode="fast", speed=1.0, wait_for_send=True, name=None,
+                        **kwargs):  # kwargs to pass logger_name
+        mlr_conn = mlr_conn_utf8(moler_conn_class, name=name)
+        io_conn = ThreadedReplay(moler_connection=mlr_conn, path=path, trace_path=trace_path, mode=mode,
+                                 speed=speed, wait_for_send=wait_for_send, name=name, **kwargs)
+        return io_conn
+
     # TODO: unify passing logger to io_conn (logger/logger_name - see above comments)
     connection_factory.register_construction(io_type="memory",
                                              variant="threaded",
@@ -168,6 +177,9 @@ def _register_builtin_connections(connection_factory, moler_conn_class):
     connection_factory.register_construction(io_type="sshshell",
                                              variant="threaded",
                                              constructor=sshshell_thd_conn)
+    connection_factory.register_construction(io_type="replay",
+                                             variant="threaded",
+                                             constructor=replay_thd_conn)
 
 
 def _register_python3_builtin_connections(connection_factory, moler_conn_class):
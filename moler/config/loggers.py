@@ -4,7 +4,7 @@ Configure logging for Moler's needs
 """
 
 __author__ = "Grzegorz Latuszek, Marcin Usielski, Michal Ernst"
-__copyright__ = "Copyright (C) 2018-2025, Nokia"
+__copyright__ = "Copyright (C) 2018-2026, Nokia"
 __email__ = (
     "grzegorz.latuszek@nokia.com, marcin.usielski@nokia.com, michal.ernst@nokia.com"
 )
@@ -27,6 +27,7 @@ from moler.util.compressed_rotating_file_handler import CompressedRotatingFileHa
 from moler.util.compressed_timed_rotating_file_handler import (
     CompressedTimedRotatingFileHandler,
 )
+from moler.util.session_recording import SessionRecordingWriter
 
 _logging_path = os.getcwd()  # Logging path that is used as a prefix for log file paths
 _logging_suffixes = {}  # Suffix for log files. None for nothing.
@@ -42,6 +43,7 @@ TEST_CASE = 45
 
 debug_level = None  # means: inactive
 raw_logs_active = False
+binary_raw_logs_active = False  # True to record data of connections in binary session recordings
 write_mode = "a"
 _kind = (
     None  # None for plain logger, 'time' to time rotating, 'size' for size rotating.
@@ -267,6 +269,10 @@ def want_raw_logs():
     return raw_logs_active
 
 
+def want_binary_raw_logs():
+    return binary_raw_logs_active
+
+
 def change_logging_suffix(suffix=None, logger_name=None):
     """
     Change logging suffix.
@@ -574,6 +580,20 @@ def _add_raw_trace_file_handler(logger_name, log_file):
     logger.addHandler(trace_rfh)
 
 
+def _add_session_recording_handler(logger_name, log_file):
+    """
+    Add binary session recording writer into Logger
+    :param logger_name: Logger name
+    :param log_file: Path to recording file. Final file location is logging_path + log_file
+    :return: None
+    """
+    global write_mode  # pylint: disable=global-statement, global-variable-not-assigned # noqa: F824
+    logfile_full_path = os.path.join(_logging_path, log_file)
+    _prepare_logs_folder(logfile_full_path)
+    logger = logging.getLogger(logger_name)
+    logger.addHandler(SessionRecordingHandler(filename=logfile_full_path, mode=write_mode))
+
+
 def create_logger(
     name,
     log_file=None,
@@ -776,6 +796,11 @@ def configure_device_logger(connection_name, propagate=False):
                     logger_name=logger_name,
                     log_file=f"{logger_name}.raw.trace.log",
                 )
+        if want_binary_raw_logs():
+            logger.setLevel(min(RAW_DATA, TRACE))
+            _add_session_recording_handler(
+                logger_name=logger_name, log_file=f"{logger_name}.raw.rec"
+            )
     else:
         logger = logging.getLogger(logger_name)
     return logger
@@ -920,6 +945,30 @@ class RawFileHandler(logging.FileHandler):
             self.handleError(record)
 
 
+class SessionRecordingHandler(logging.FileHandler):
+    def __init__(self, filename, mode="a"):
+        """SessionRecordingHandler writes RAW_DATA records into binary session recording (see SessionRecordingWriter)"""
+        super(SessionRecordingHandler, self).__init__(filename=filename, mode=f"{mode[0]}b")
+        self._moler_owned = True
+        self.setFormatter(RawDataFormatter())
+        self.setLevel(RAW_DATA)
+        self.addFilter(SpecificLevelFilter(RAW_DATA))
+
+    def _open(self):
+        """Stream of handler is writer of recording"""
+        return SessionRecordingWriter(path=self.baseFilename, mode=self.mode[0])
+
+    def emit(self, record):
+        """Write data of record with its transfer direction"""
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            direction = record.transfer_direction if hasattr(record, "transfer_direction") else "<"
+            self.stream.write(direction=direction, data=self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
 class MultilineWithDirectionFormatter(logging.Formatter):
     """
     We want logs to have non-overlapping areas.
@@ -31,7 +31,6 @@ from moler.exceptions import (
 from moler.helpers import (
     ClassProperty,
     camel_case_to_lower_case_underscore,
-    copy_list,
     instance_id,
 )
 from moler.runner import ConnectionObserverRunner
@@ -39,6 +38,7 @@ from moler.runner_factory import get_runner
 from moler.util.connection_observer import exception_stored_if_not_main_thread
 from moler.util.connection_observer_life_status import ConnectionObserverLifeStatus
 from moler.util.loghelper import log_into_logger
+from moler.util.unraised_exceptions import UnraisedExceptions
 
 
 @add_metaclass(ABCMeta)
@@ -46,8 +46,9 @@ class ConnectionObserver:
 
     """Base class for all events and commands that are to be observed on connection."""
 
-    _not_raised_exceptions = []  # list of dict: "exception" and "time"
+    _not_raised_exceptions = UnraisedExceptions()  # exceptions set in observers and not raised yet
     _exceptions_lock = threading.Lock()
+    max_logged_unraised_exceptions = 10  # How many the most recent not raised exceptions are logged.
 
     def __init__(
         self,
@@ -59,6 +60,8 @@ class ConnectionObserver:
         :param connection: connection used to receive data awaited for
         """
         super(ConnectionObserver, self).__init__()
+        self._done_callbacks = []
+        self._done_callbacks_lock = threading.Lock()
         self.life_status: ConnectionObserverLifeStatus = ConnectionObserverLifeStatus()
         self.connection: AbstractMolerConnection = connection
         self.runner: ConnectionObserverRunner = self._get_runner(runner=runner)
@@ -131,9 +134,39 @@ class ConnectionObserver:
     @_is_done.setter
     def _is_done(self, value: bool):
         """Set if observer is done."""
+        was_done = self.life_status.is_done
         self.life_status.is_done = value
         if value:
             CommandScheduler.dequeue_running_on_connection(connection_observer=self)
+            if not was_done:
+                self._call_done_callbacks()
+
+    def add_done_callback(self, fn) -> None:
+        """
+        Attach callable to be called when connection-observer is done (the same way as concurrent.futures.Future
+         does). Callable is called at once if connection-observer is already done.
+
+        :param fn: callable taking connection-observer as the only argument.
+        :return: None
+        """
+        with self._done_callbacks_lock:
+            if not self.done():
+                self._done_callbacks.append(fn)
+                return
+        self._call_done_callback(fn)
+
+    def _call_done_callbacks(self) -> None:
+        with self._done_callbacks_lock:
+            callbacks = self._done_callbacks
+            self._done_callbacks = []
+        for fn in callbacks:
+            self._call_done_callback(fn)
+
+    def _call_done_callback(self, fn) -> None:
+        try:
+            fn(self)
+        except Exception as exc:
+            self._log(logging.WARNING, f"Done callback {fn!r} of {self} raised {exc!r}")
 
     @property
     def _is_cancelled(self) -> bool:
@@ -402,8 +435,7 @@ class ConnectionObserver:
             ConnectionObserver._log_unraised_exceptions(self)
             if self._exception is not None:
                 exception = self._exception
-                if exception in ConnectionObserver._not_raised_exceptions:
-                    ConnectionObserver._not_raised_exceptions.remove(exception)
+                ConnectionObserver._not_raised_exceptions.discard(exception)
                 self._log(
                     logging.INFO,
                     f"Stack stored with the exception: {self._exception_stack_msg}",
@@ -478,13 +510,21 @@ class ConnectionObserver:
         :return: list of unraised exceptions.
         """
         with ConnectionObserver._exceptions_lock:
+            list_of_exceptions = ConnectionObserver._not_raised_exceptions.get_exceptions()
             if remove:
-                list_of_exceptions = ConnectionObserver._not_raised_exceptions
-                ConnectionObserver._not_raised_exceptions = []
-            else:
-                list_of_exceptions = copy_list(ConnectionObserver._not_raised_exceptions)
+                ConnectionObserver._not_raised_exceptions.clear()
             return list_of_exceptions
 
+    @staticmethod
+    def get_unraised_exceptions_summary() -> dict:
+        """
+        Return counts of unraised exceptions grouped by class of observer.
+
+        :return: Dict {full name of observer class: {name of exception class: count}}.
+        """
+        with ConnectionObserver._exceptions_lock:
+            return ConnectionObserver._not_raised_exceptions.get_summary()
+
     @staticmethod
     def _change_unraised_exception(new_exception: Exception, observer, stack_msg: str) -> None:
         """
@@ -504,35 +544,43 @@ class ConnectionObserver:
                     logging.DEBUG,
                     f"{observer} has overwritten exception. From {old_exception!r} to {new_exception!r}",
                 )
-                if old_exception in ConnectionObserver._not_raised_exceptions:
-                    ConnectionObserver._not_raised_exceptions.remove(old_exception)
-                else:
+                if not ConnectionObserver._not_raised_exceptions.discard(old_exception):
                     observer._log(  # pylint: disable=protected-access
                         logging.DEBUG,
                         f"{observer}: cannot find exception {old_exception!r} in _not_raised_exceptions.",
                     )
-                    ConnectionObserver._log_unraised_exceptions(observer)
 
-            ConnectionObserver._not_raised_exceptions.append(new_exception)
+            ConnectionObserver._not_raised_exceptions.add(
+                new_exception, observer_class=f"{observer.__class__.__module__}.{observer.__class__.__name__}"
+            )
             observer._exception = new_exception  # pylint: disable=protected-access
             observer._exception_stack_msg = stack_msg  # pylint: disable=protected-access
 
     @staticmethod
     def _log_unraised_exceptions(observer) -> None:
         """
-        Logs the unraised exceptions for the observer.
-
+        Logs the summary and the most recent unraised exceptions for the observer.
 
         :param observer: The observer object (command or event).
         :return: None
         """
-        for i, item in enumerate(ConnectionObserver._not_raised_exceptions):
+        not_raised_exceptions = ConnectionObserver._not_raised_exceptions
+        if not not_raised_exceptions:
+            return
+        observer._log(  # pylint: disable=protected-access
+            logging.DEBUG,
+            f"{len(not_raised_exceptions)} NOT RAISED exceptions per observer class: "
+            f"{not_raised_exceptions.get_summary()}",
+            levels_to_go_up=2,
+        )
+        last_exceptions = not_raised_exceptions.get_last(ConnectionObserver.max_logged_unraised_exceptions)
+        first_number = len(not_raised_exceptions) - len(last_exceptions) + 1
+        for i, (exception, _) in enumerate(last_exceptions, start=first_number):
             observer._log(  # pylint: disable=protected-access
                 logging.DEBUG,
-                f"{i + 1:4d} NOT RAISED: {item!r}",
+                f"{i:4d} NOT RAISED: {exception!r}",
                 levels_to_go_up=2,
             )
-            observer._log(logging.DEBUG, observer._exception_stack_msg)  # pylint: disable=protected-access
 
     def get_long_desc(self) -> str:
         """
@@ -579,3 +627,13 @@ class ConnectionObserver:
         :return: True if the observer is currently being executed by a runner, False otherwise.
         """
         return self.runner.is_connection_observer_running(self)
+
+    def wait_for_in_runner(self, in_runner: bool = True, timeout: float = 10.0) -> bool:
+        """
+        Wait till the observer is (or is not) executed by a runner.
+
+        :param in_runner: True to wait till the observer is in the runner, False to wait till it leaves the runner.
+        :param timeout: max time in seconds to wait.
+        :return: True if the observer reached expected state, False if timeout occurred.
+        """
+        return self.runner.wait_for_running_state(self, running=in_runner, timeout=timeout)
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+Pool of pre-connected devices.
+
+Pool keeps devices cloned from one source device, already connected and in target state. Devices are handed out
+ via context manager and reset to target state (goto_state) when given back. Devices which cannot be reset are
+ removed from the pool and replaced by new clones.
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+from moler.device.device import DeviceFactory
+from moler.exceptions import MolerTimeout, WrongUsage
+
+
+class DevicePool:
+    """Pool of devices cloned from source device and kept in target state."""
+
+    def __init__(self, source_device, size: int, target_state: Optional[str] = None, name_prefix: Optional[str] = None,
+                 reset_timeout: float = -1, is_healthy: Optional[Callable] = None, lazy_cmds_events: bool = False,
+                 additional_params: Optional[dict] = None) -> None:
+        """
+        Create pool and all its devices.
+
+        :param source_device: reference to base device or name of base device.
+        :param size: number of devices in the pool.
+        :param target_state: state of devices handed out by the pool. If None then current state of source device.
+        :param name_prefix: prefix of names of pool devices. If None then name of source device is used.
+        :param reset_timeout: timeout for goto_state when device is given back. -1 means default device timeout.
+        :param is_healthy: optional callable(device) -> bool to check device before it is put back to the pool.
+        :param lazy_cmds_events: passed to DeviceFactory.get_cloned_device.
+        :param additional_params: passed to DeviceFactory.get_cloned_device.
+        """
+        if size < 1:
+            raise WrongUsage(f"Size of device pool must be at least 1 but is {size}.")
+        if isinstance(source_device, str):
+            source_device = DeviceFactory.get_device(name=source_device)
+        self.source_device = source_device
+        self.size = size
+        self.target_state = target_state if target_state is not None else source_device.current_state
+        self.name_prefix = name_prefix if name_prefix is not None else f"{source_device.name}_POOL"
+        self.reset_timeout = reset_timeout
+        self.evicted = 0
+        self._is_healthy = is_healthy
+        self._lazy_cmds_events = lazy_cmds_events
+        self._additional_params = additional_params
+        self._free_devices = deque()
+        self._all_devices = []
+        self._checked_out_devices = set()  # Devices handed out and not given back yet.
+        self._lock = threading.Lock()
+        self._free_devices_changed = threading.Condition(self._lock)  # Notified on release and close.
+        self._created = 0
+        self._missing_devices = 0  # Evicted devices which replacement failed, created again by acquire().
+        self._closed = False
+        self.logger = logging.getLogger('moler.device_pool')
+        for _ in range(size):
+            self._free_devices.append(self._create_device())
+
+    @contextmanager
+    def device(self, timeout: Optional[float] = None):
+        """
+        Context manager to hand out device from the pool.
+
+        :param timeout: max time in seconds to wait for free device. None means wait forever.
+        :return: device in target state.
+        """
+        dev = self.acquire(timeout=timeout)
+        try:
+            yield dev
+        except BaseException:
+            try:
+                self.release(dev)
+            except Exception as exc:  # don't mask exception raised when device was used
+                self.logger.warning(f"Cannot give back device '{dev.name}' to pool '{self.name_prefix}': {exc!r}")
+            raise
+        self.release(dev)
+
+    def acquire(self, timeout: Optional[float] = None):
+        """
+        Take device from the pool. Device must be given back by release().
+
+        :param timeout: max time in seconds to wait for free device. None means wait forever.
+        :return: device in target state.
+        :raise WrongUsage: if the pool is closed, also when it is closed while waiting.
+        :raise MolerTimeout: if no device is given back within timeout.
+        Device evicted without replacement is created here, exception of its creation is raised.
+        """
+        start_time = time.monotonic()
+        with self._free_devices_changed:
+            if not self._free_devices_changed.wait_for(
+                    lambda: self._closed or self._free_devices or self._missing_devices, timeout=timeout):
+                raise MolerTimeout(timeout=timeout, kind=f"Waiting for device from pool '{self.name_prefix}'",
+                                   passed_time=time.monotonic() - start_time)
+            if self._closed:
+                raise WrongUsage(f"Device pool '{self.name_prefix}' is closed.")
+            if self._free_devices:
+                device = self._free_devices.popleft()
+                self._checked_out_devices.add(device)
+                return device
+            self._missing_devices -= 1
+        try:
+            device = self._create_device()
+        except Exception:
+            with self._free_devices_changed:
+                self._missing_devices += 1
+                self._free_devices_changed.notify()
+            raise
+        with self._free_devices_changed:
+            closed = self._closed
+            if not closed:
+                self._checked_out_devices.add(device)
+        if closed:
+            self._remove_device(device)
+            raise WrongUsage(f"Device pool '{self.name_prefix}' is closed.")
+        return device
+
+    def release(self, device) -> None:
+        """
+        Give back device to the pool. Device is reset to target state. Unhealthy device is replaced by new one. If
+         replacement cannot be created it is logged and created again by acquire(). Device given back to closed pool
+         (also closed during reset) is removed.
+
+        :param device: device taken from the pool.
+        :return: None
+        :raise WrongUsage: if device doesn't belong to the pool or is already given back.
+        """
+        with self._lock:
+            if device not in self._checked_out_devices:
+                if device in self._all_devices:
+                    raise WrongUsage(f"Device '{device.name}' is already given back to pool '{self.name_prefix}'.")
+                raise WrongUsage(f"Device '{device.name}' does not belong to pool '{self.name_prefix}'.")
+            self._checked_out_devices.remove(device)
+            closed = self._closed
+        if not closed and not self._reset_device(device):
+            self._evict(device)
+            device = self._replace_device()
+            if device is None:
+                return
+        with self._free_devices_changed:
+            closed = self._closed
+            if not closed:
+                self._free_devices.append(device)
+                self._free_devices_changed.notify()
+        if closed:
+            self._remove_device(device)
+
+    def free_devices_count(self) -> int:
+        """
+        Get number of devices ready to hand out.
+
+        :return: number of free devices.
+        """
+        with self._lock:
+            return len(self._free_devices)
+
+    def close(self) -> None:
+        """
+        Remove all devices of the pool. Devices which are handed out are removed when given back. Threads waiting in
+        acquire() are woken up with WrongUsage.
+
+        :return: None
+        """
+        with self._free_devices_changed:
+            self._closed = True
+            free_devices = list(self._free_devices)
+            self._free_devices.clear()
+            self._free_devices_changed.notify_all()
+        for device in free_devices:
+            self._remove_device(device)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False  # reraise exceptions if any
+
+    def _create_device(self):
+        with self._lock:
+            self._created += 1
+            new_name = f"{self.name_prefix}_{self._created}"
+        device = DeviceFactory.get_cloned_device(source_device=self.source_device, new_name=new_name,
+                                                 initial_state=self.target_state,
+                                                 lazy_cmds_events=self._lazy_cmds_events,
+                                                 additional_params=self._additional_params)
+        with self._lock:
+            self._all_devices.append(device)
+        return device
+
+    def _reset_device(self, device) -> bool:
+        try:
+            device.goto_state(state=self.target_state, timeout=self.reset_timeout)
+            if device.current_state != self.target_state:
+                return False
+            if self._is_healthy is not None and not self._is_healthy(device):
+                return False
+        except Exception as exc:
+            self.logger.warning(f"Cannot reset device '{device.name}' to state '{self.target_state}': {exc!r}")
+            return False
+        return True
+
+    def _replace_device(self):
+        try:
+            return self._create_device()
+        except Exception as exc:
+            self.logger.warning(f"Cannot create device to replace evicted one in pool '{self.name_prefix}': {exc!r}")
+            with self._free_devices_changed:
+                self._missing_devices += 1
+                self._free_devices_changed.notify()
+            return None
+
+    def _evict(self, device) -> None:
+        self.logger.warning(f"Device '{device.name}' evicted from pool '{self.name_prefix}'.")
+        self.evicted += 1
+        self._remove_device(device)
+
+    def _remove_device(self, device) -> None:
+        with self._lock:
+            if device in self._all_devices:
+                self._all_devices.remove(device)
+        try:
+            DeviceFactory.remove_device(device=device)
+        except Exception as exc:
+            self.logger.warning(f"Cannot remove device '{device.name}': {exc!r}")
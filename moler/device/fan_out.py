@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+"""
+Fan-out of one command (or state change) over many devices.
+
+Command is started on every selected device via its own runner (the same way as cmd.start() does),
+at most max_concurrency commands are running at the same time. Results are available as soon as
+they are completed.
+State of many devices may be changed concurrently inside one asyncio event loop.
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+import asyncio
+import concurrent.futures
+import logging
+import queue
+import threading
+import time
+from typing import Dict, Iterator, List, Optional
+
+from moler.device.device import DeviceFactory
+from moler.exceptions import CancelledError, MolerTimeout, NoResultSinceCancelCalled, WrongUsage
+
+
+class FanOutResult:
+    """Outcome of the command on one device."""
+
+    def __init__(self, device_name: str) -> None:
+        """
+        Create outcome for device.
+
+        :param device_name: name of the device.
+        """
+        self.device_name = device_name
+        self.command = None
+        self.result = None
+        self.exception: Optional[Exception] = None
+        self.start_time: Optional[float] = None
+        self.end_time: Optional[float] = None
+
+    @property
+    def succeeded(self) -> bool:
+        """
+        Check if command finished with result.
+
+        :return: True if command returned result, False otherwise.
+        """
+        return self.exception is None and self.end_time is not None
+
+    @property
+    def duration(self) -> Optional[float]:
+        """
+        Time of command execution.
+
+        :return: seconds between start and end of the command or None if command was not started or not finished.
+        """
+        if self.start_time is None or self.end_time is None:
+            return None
+        return self.end_time - self.start_time
+
+    def __str__(self) -> str:
+        if self.succeeded:
+            outcome = "result"
+        else:
+            outcome = f"exception {self.exception!r}"
+        return f"FanOutResult(device='{self.device_name}', {outcome}, duration={self.duration})"
+
+
+class DevicesFanOut:
+    """Runs one command concurrently on many devices."""
+
+    def __init__(self, cmd_name: str, cmd_params: Optional[dict] = None, devices: Optional[list] = None,
+                 device_names: Optional[List[str]] = None, device_type: Optional[type] = None,
+                 max_concurrency: int = 10, timeout: Optional[float] = None, cmd_timeout: Optional[float] = None,
+                 check_state: bool = True) -> None:
+        """
+        Create fan-out. Devices are selected by objects, names and/or type. If none of them is given then all devices
+         from DeviceFactory are selected.
+
+        :param cmd_name: name of the command to run on every device.
+        :param cmd_params: parameters of the command.
+        :param devices: list of device objects.
+        :param device_names: list of device names (devices are taken from DeviceFactory).
+        :param device_type: type of devices (devices are taken from DeviceFactory).
+        :param max_concurrency: max number of commands running at the same time.
+        :param timeout: global deadline in seconds for the whole fan-out. None means no deadline.
+        :param cmd_timeout: timeout for every command. None means the default timeout of the command.
+        :param check_state: passed to device.get_cmd.
+        """
+        if max_concurrency < 1:
+            raise WrongUsage(f"max_concurrency must be at least 1 but is {max_concurrency}.")
+        self.cmd_name = cmd_name
+        self.cmd_params = cmd_params
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.cmd_timeout = cmd_timeout
+        self.check_state = check_state
+        self.devices = self._select_devices(devices=devices, device_names=device_names, device_type=device_type)
+        self.results: Dict[str, FanOutResult] = {}
+        self._completed = queue.Queue()  # Outcomes of done commands, None to wake up on cancel.
+        self._cancelled = threading.Event()
+        self._started = False
+        self.logger = logging.getLogger('moler.fan_out')
+
+    def run(self) -> Dict[str, FanOutResult]:
+        """
+        Run command on all devices and wait for all outcomes.
+
+        :return: dict device name -> FanOutResult.
+        """
+        for _ in self.as_completed():
+            pass
+        return self.results
+
+    def as_completed(self) -> Iterator[FanOutResult]:
+        """
+        Run command on all devices and yield outcomes as they are completed.
+
+        :return: generator of FanOutResult.
+        """
+        if self._started:
+            raise WrongUsage(f"Fan-out of '{self.cmd_name}' can be run only once.")
+        self._started = True
+        start_time = time.monotonic()
+        waiting = list(self.devices)
+        running: List[FanOutResult] = []
+        while waiting or running:
+            if self._cancelled.is_set() or self._is_deadline_passed(start_time):
+                for outcome in self._stop_all(waiting=waiting, running=running, start_time=start_time):
+                    yield outcome
+                break
+            while waiting and len(running) < self.max_concurrency:
+                outcome = self._start_on_device(waiting.pop(0))
+                if outcome.end_time is None:
+                    running.append(outcome)
+                else:
+                    yield outcome
+            if not running:
+                continue
+            try:
+                outcome = self._completed.get(timeout=self._get_remaining_time(start_time))
+            except queue.Empty:
+                continue  # Deadline passed.
+            if outcome is None:
+                continue  # Woken up by cancel.
+            running.remove(outcome)
+            self._collect(outcome)
+            yield outcome
+
+    def cancel(self) -> None:
+        """
+        Cancel fan-out. Running commands are cancelled and not started commands will not be started.
+
+        :return: None
+        """
+        self._cancelled.set()
+        self._completed.put(None)
+
+    def _select_devices(self, devices: Optional[list], device_names: Optional[List[str]],
+                        device_type: Optional[type]) -> list:
+        selected = list(devices) if devices else []
+        if device_names:
+            for device_name in device_names:
+                selected.append(DeviceFactory.get_device(name=device_name))
+        if device_type is not None:
+            selected.extend(DeviceFactory.get_devices_by_type(device_type=device_type))
+        if devices is None and device_names is None and device_type is None:
+            selected = DeviceFactory.get_devices_by_type(device_type=None)
+        unique_devices = []
+        for device in selected:
+            if device not in unique_devices:
+                unique_devices.append(device)
+        return unique_devices
+
+    def _start_on_device(self, device) -> FanOutResult:
+        outcome = FanOutResult(device_name=device.name)
+        self.results[device.name] = outcome
+        outcome.start_time = time.monotonic()
+        try:
+            outcome.command = device.get_cmd(cmd_name=self.cmd_name, cmd_params=self.cmd_params,
+                                             check_state=self.check_state)
+            if self.cmd_timeout is not None:
+                outcome.command.timeout = self.cmd_timeout
+            outcome.command.start()
+            outcome.command.add_done_callback(lambda command: self._completed.put(outcome))
+        except Exception as exc:
+            outcome.exception = exc
+            outcome.end_time = time.monotonic()
+            self.logger.warning(f"Cannot start '{self.cmd_name}' on device '{device.name}': {exc!r}")
+        return outcome
+
+    def _collect(self, outcome: FanOutResult) -> None:
+        try:
+            outcome.result = outcome.command.result()
+        except Exception as exc:
+            outcome.exception = exc
+        outcome.end_time = time.monotonic()
+
+    def _is_deadline_passed(self, start_time: float) -> bool:
+        return self.timeout is not None and time.monotonic() - start_time >= self.timeout
+
+    def _get_remaining_time(self, start_time: float) -> Optional[float]:
+        if self.timeout is None:
+            return None
+        return max(0.0, self.timeout - (time.monotonic() - start_time))
+
+    def _stop_all(self, waiting: list, running: List[FanOutResult], start_time: float) -> Iterator[FanOutResult]:
+        passed_time = time.monotonic() - start_time
+        for outcome in running:
+            if not outcome.command.done():
+                outcome.command.cancel()
+                if self._cancelled.is_set():
+                    outcome.exception = NoResultSinceCancelCalled(outcome.command)
+                else:
+                    outcome.exception = MolerTimeout(timeout=self.timeout, kind=f"Fan-out of '{self.cmd_name}'",
+                                                     passed_time=passed_time)
+                outcome.end_time = time.monotonic()
+            else:
+                self._collect(outcome)
+            yield outcome
+        running.clear()
+        for device in waiting:
+            outcome = FanOutResult(device_name=device.name)
+            if self._cancelled.is_set():
+                outcome.exception = CancelledError(f"Fan-out of '{self.cmd_name}' cancelled before start on device.")
+            else:
+                outcome.exception = MolerTimeout(timeout=self.timeout, kind=f"Fan-out of '{self.cmd_name}'",
+                                                 passed_time=passed_time)
+            self.results[device.name] = outcome
+            yield outcome
+        waiting.clear()
+
+
+async def goto_state_on_devices_async(devices: list, state: str, max_concurrency: int = 10,
+                                      timeout: Optional[float] = None, **goto_state_kwargs) -> Dict[str, FanOutResult]:
+    """
+    Change state of many devices concurrently inside one asyncio event loop.
+
+    :param devices: list of devices.
+    :param state: destination state for all devices.
+    :param max_concurrency: max number of devices changing state at the same time.
+    :param timeout: global deadline in seconds. None means no deadline. At deadline changes not started yet are
+     dropped and changes in progress are stopped before their next hop. The coroutine returns when hops in progress
+     are finished, so no device changes its state after the coroutine returns.
+    :param goto_state_kwargs: other parameters passed to goto_state.
+    :return: dict device name -> FanOutResult (result is None, exception is set if state was not changed).
+    """
+    if max_concurrency < 1:
+        raise WrongUsage(f"max_concurrency must be at least 1 but is {max_concurrency}.")
+    results = {device.name: FanOutResult(device_name=device.name) for device in devices}
+    if not devices:
+        return results
+    start_time = time.monotonic()
+
+    async def change_state(device, executor):
+        outcome = results[device.name]
+        outcome.start_time = time.monotonic()
+        try:
+            await device.goto_state_async(state=state, executor=executor, **goto_state_kwargs)
+        except Exception as exc:
+            outcome.exception = exc
+        outcome.end_time = time.monotonic()
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=min(max_concurrency, len(devices)),
+                                                     thread_name_prefix="GotoStateAsync")
+    try:
+        tasks = [asyncio.ensure_future(change_state(device, executor)) for device in devices]
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)  # Wait for hops in progress.
+    finally:
+        executor.shutdown(wait=False)
+    passed_time = time.monotonic() - start_time
+    for outcome in results.values():
+        if outcome.end_time is None:
+            outcome.exception = MolerTimeout(timeout=timeout, kind=f"Changing state to '{state}'",
+                                             passed_time=passed_time)
+    return results
+
+
+def goto_state_on_devices(devices: list, state: str, max_concurrency: int = 10, timeout: Optional[float] = None,
+                          **goto_state_kwargs) -> Dict[str, FanOutResult]:
+    """
+    Change state of many devices concurrently. Blocking call, state changes are driven by one new asyncio event loop.
+    If called from a running event loop then the new loop runs in a separate thread and the calling loop is blocked
+    till the end. To not block running loop await goto_state_on_devices_async() there.
+
+    :param devices: list of devices.
+    :param state: destination state for all devices.
+    :param max_concurrency: max number of devices changing state at the same time.
+    :param timeout: global deadline in seconds. None means no deadline.
+    :param goto_state_kwargs: other parameters passed to goto_state.
+    :return: dict device name -> FanOutResult (result is None, exception is set if state was not changed).
+    """
+    coroutine = goto_state_on_devices_async(devices=devices, state=state, max_concurrency=max_concurrency,
+                                            timeout=timeout, **goto_state_kwargs)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:  # No running loop in this thread.
+        return asyncio.run(coroutine)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="GotoStateOnDevices") as executor:
+        return executor.submit(asyncio.run, coroutine).result()
@@ -0,0 +1,546 @@
+# -*- coding: utf-8 -*-
+"""
+Devices hosted in worker processes.
+
+Groups of devices (shards) are created in separate worker processes so parsing of output of many devices is not
+limited by one Python interpreter (GIL). Main process gets lightweight proxies of devices with API of device:
+get_cmd/get_event/goto_state/run. Commands and events live in worker process, proxies of them return picklable
+results and occurrences.
+
+Groups may be defined in moler config file:
+
+PROCESS_SHARDS:
+  SHARD_1:
+    - UNIX_LOCAL_1
+    - UNIX_LOCAL_2
+  SHARD_2:
+    - UNIX_REMOTE_1
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+import concurrent.futures
+import itertools
+import logging
+import multiprocessing
+import pickle
+import threading
+import traceback
+import weakref
+from typing import Dict, List, Optional, Union
+
+from moler.exceptions import MolerException, MolerTimeout, WrongUsage
+
+
+class RemoteObserverProxy:
+    """
+    Proxy of command or event living in worker process. Observer is kept in worker process until proxy is released
+    (explicitly by release() or when proxy is garbage collected).
+    """
+
+    def __init__(self, shard: 'DeviceShard', observer_id: int, name: str) -> None:
+        """
+        Create proxy of observer.
+
+        :param shard: shard hosting the observer.
+        :param observer_id: id of observer in worker process.
+        :param name: name of command or event.
+        """
+        self._shard = shard
+        self._observer_id = observer_id
+        self.name = name
+        self._finalizer = weakref.finalize(self, shard.notify, "release", observer_id)
+        self._finalizer.atexit = False
+
+    def start(self, timeout: Optional[float] = None) -> 'RemoteObserverProxy':
+        """
+        Start observer in worker process.
+
+        :param timeout: timeout of observer. None means default timeout of observer.
+        :return: self
+        """
+        self._shard.call("start", self._observer_id, timeout)
+        return self
+
+    def await_done(self, timeout: Optional[float] = None):
+        """
+        Wait till observer is done.
+
+        :param timeout: max time to wait. None means timeout of observer.
+        :return: result of observer.
+        """
+        return self._shard.call("await_done", self._observer_id, timeout)
+
+    def result(self):
+        """
+        Get result of observer.
+
+        :return: result of observer.
+        """
+        return self._shard.call("result", self._observer_id)
+
+    def done(self) -> bool:
+        """
+        Check if observer is done.
+
+        :return: True if done, False otherwise.
+        """
+        return self._shard.call("done", self._observer_id)
+
+    def cancel(self) -> bool:
+        """
+        Cancel observer.
+
+        :return: value returned by cancel of observer.
+        """
+        return self._shard.call("cancel", self._observer_id)
+
+    def get_last_occurrence(self):
+        """
+        Get last occurrence of event.
+
+        :return: last occurrence or None.
+        """
+        return self._shard.call("get_last_occurrence", self._observer_id)
+
+    def release(self) -> None:
+        """
+        Remove observer from worker process. Proxy cannot be used after release.
+
+        :return: None
+        """
+        self._finalizer()
+
+    def __call__(self, timeout: Optional[float] = None):
+        self.start(timeout=timeout)
+        return self.await_done()
+
+    def __str__(self) -> str:
+        return f"RemoteObserverProxy('{self.name}', id:{self._observer_id}, shard:'{self._shard.name}')"
+
+
+class DeviceProxy:
+    """Proxy of device living in worker process."""
+
+    def __init__(self, shard: 'DeviceShard', name: str) -> None:
+        """
+        Create proxy of device.
+
+        :param shard: shard hosting the device.
+        :param name: name of device.
+        """
+        self._shard = shard
+        self.name = name
+
+    @property
+    def current_state(self) -> str:
+        """
+        Get current state of device.
+
+        :return: name of state.
+        """
+        return self._shard.call("current_state", self.name)
+
+    def goto_state(self, state: str, **kwargs) -> None:
+        """
+        Go to specific state. Parameters as for TextualDevice.goto_state.
+
+        :param state: name of state.
+        :return: None
+        """
+        self._shard.call("goto_state", self.name, state, kwargs)
+
+    def get_cmd(self, cmd_name: str, cmd_params: Optional[dict] = None, check_state: bool = True,
+                for_state: Optional[str] = None) -> RemoteObserverProxy:
+        """
+        Create command in worker process.
+
+        :param cmd_name: name of command.
+        :param cmd_params: parameters of command.
+        :param check_state: passed to device.get_cmd.
+        :param for_state: passed to device.get_cmd.
+        :return: proxy of command.
+        """
+        observer_id = self._shard.call("get_cmd", self.name, cmd_name, cmd_params, check_state, for_state)
+        return RemoteObserverProxy(shard=self._shard, observer_id=observer_id, name=cmd_name)
+
+    def get_event(self, event_name: str, event_params: Optional[dict] = None, check_state: bool = True,
+                  for_state: Optional[str] = None) -> RemoteObserverProxy:
+        """
+        Create event in worker process.
+
+        :param event_name: name of event.
+        :param event_params: parameters of event.
+        :param check_state: passed to device.get_event.
+        :param for_state: passed to device.get_event.
+        :return: proxy of event.
+        """
+        observer_id = self._shard.call("get_event", self.name, event_name, event_params, check_state, for_state)
+        return RemoteObserverProxy(shard=self._shard, observer_id=observer_id, name=event_name)
+
+    def run(self, cmd_name: str, **kwargs):
+        """
+        Run command and return its result. Parameters as for TextualDevice.run.
+
+        :param cmd_name: name of command.
+        :return: result of command.
+        """
+        return self._shard.call("run", self.name, cmd_name, kwargs)
+
+    def __str__(self) -> str:
+        return f"DeviceProxy('{self.name}', shard:'{self._shard.name}')"
+
+
+class DeviceShard:
+    """Group of devices hosted in one worker process."""
+
+    _ctx = multiprocessing.get_context("spawn")
+
+    def __init__(self, config: Union[str, dict], device_names: List[str], name: Optional[str] = None,
+                 start_timeout: float = 120) -> None:
+        """
+        Start worker process and create devices in it.
+
+        :param config: moler config (absolute path to file or dict) to load in worker process.
+        :param device_names: names of devices (from config) to create in worker process.
+        :param name: name of shard.
+        :param start_timeout: max time in seconds to wait for worker process to create all devices.
+        """
+        self.name = name if name is not None else f"shard_{'_'.join(device_names)}"
+        self.device_names = list(device_names)
+        self.logger = logging.getLogger(f"moler.shard.{self.name}")
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, concurrent.futures.Future] = {}
+        self._pending_lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._closed = False
+        self._connection, child_connection = DeviceShard._ctx.Pipe()
+        self._process = DeviceShard._ctx.Process(target=_shard_worker_main, name=f"MolerShard-{self.name}",
+                                                 args=(child_connection, config, self.device_names), daemon=True)
+        self._process.start()
+        child_connection.close()
+        self._receiver = threading.Thread(target=self._receive_replies, name=f"MolerShardReceiver-{self.name}",
+                                          daemon=True)
+        self._receiver.start()
+        try:
+            self.call("ping", timeout=start_timeout)
+        except Exception:
+            self.close()
+            raise
+        self.devices = {device_name: DeviceProxy(shard=self, name=device_name) for device_name in self.device_names}
+
+    def get_device(self, name: str) -> DeviceProxy:
+        """
+        Get proxy of device.
+
+        :param name: name of device.
+        :return: proxy of device.
+        """
+        return self.devices[name]
+
+    def call(self, method: str, *args, timeout: Optional[float] = None):
+        """
+        Call method in worker process and wait for its return value.
+
+        :param method: name of method in worker process.
+        :param args: picklable arguments of method.
+        :param timeout: max time to wait for reply. None means wait forever.
+        :return: value returned by method in worker process.
+        """
+        if self._closed:
+            raise WrongUsage(f"Shard '{self.name}' is closed.")
+        request_id = next(self._ids)
+        future = concurrent.futures.Future()
+        with self._pending_lock:
+            self._pending[request_id] = future
+        with self._send_lock:
+            self._connection.send((request_id, method, args))
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            raise MolerTimeout(timeout=timeout, kind=f"Call of '{method}' in shard '{self.name}'") from None
+        finally:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+
+    def notify(self, method: str, *args) -> None:
+        """
+        Call method in worker process without waiting for its return value. Does nothing if shard is closed.
+
+        :param method: name of method in worker process.
+        :param args: picklable arguments of method.
+        :return: None
+        """
+        if self._closed:
+            return
+        request_id = next(self._ids)  # Reply to id without pending future is dropped by receiver.
+        try:
+            with self._send_lock:
+                self._connection.send((request_id, method, args))
+        except (OSError, EOFError):
+            pass
+
+    def close(self, timeout: float = 30) -> None:
+        """
+        Remove devices and stop worker process.
+
+        :param timeout: max time in seconds to wait for worker process.
+        :return: None
+        """
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            with self._send_lock:
+                self._connection.send((0, "close", ()))
+        except (OSError, EOFError):
+            pass
+        self._process.join(timeout=timeout)
+        if self._process.is_alive():
+            self.logger.warning(f"Worker process of shard '{self.name}' is still alive, terminating it.")
+            self._process.terminate()
+            self._process.join(timeout=timeout)
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False  # reraise exceptions if any
+
+    def _receive_replies(self) -> None:
+        while True:
+            try:
+                request_id, is_ok, value = self._connection.recv()
+            except (EOFError, OSError):
+                break
+            with self._pending_lock:
+                future = self._pending.get(request_id)
+            if future is None:
+                continue
+            if is_ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+        with self._pending_lock:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(MolerException(f"Worker process of shard '{self.name}' finished."))
+
+
+class ShardedDevices:
+    """Devices split into groups, every group hosted in own worker process."""
+
+    def __init__(self, config: Union[str, dict], groups: Dict[str, List[str]], start_timeout: float = 120) -> None:
+        """
+        Start worker process for every group of devices.
+
+        :param config: moler config (absolute path to file or dict) to load in worker processes.
+        :param groups: dict shard name -> list of names of devices.
+        :param start_timeout: max time in seconds to wait for every worker process to create its devices.
+        """
+        self.shards: Dict[str, DeviceShard] = {}
+        try:
+            for shard_name, device_names in groups.items():
+                self.shards[shard_name] = DeviceShard(config=config, device_names=device_names, name=shard_name,
+                                                      start_timeout=start_timeout)
+        except Exception:
+            self.close()
+            raise
+
+    @classmethod
+    def from_config(cls, config: Union[str, dict], start_timeout: float = 120) -> 'ShardedDevices':
+        """
+        Start worker processes for groups defined in section PROCESS_SHARDS of moler config.
+
+        :param config: moler config (absolute path to file or dict).
+        :param start_timeout: max time in seconds to wait for every worker process to create its devices.
+        :return: instance of ShardedDevices.
+        """
+        from moler.config import read_yaml_configfile
+        config_dict = read_yaml_configfile(config) if isinstance(config, str) else config
+        if "PROCESS_SHARDS" not in config_dict:
+            raise WrongUsage("No section 'PROCESS_SHARDS' in config.")
+        return cls(config=config, groups=config_dict["PROCESS_SHARDS"], start_timeout=start_timeout)
+
+    def get_device(self, name: str) -> DeviceProxy:
+        """
+        Get proxy of device from any shard.
+
+        :param name: name of device.
+        :return: proxy of device.
+        """
+        for shard in self.shards.values():
+            if name in shard.devices:
+                return shard.devices[name]
+        raise KeyError(f"No device '{name}' in any shard.")
+
+    def close(self) -> None:
+        """
+        Stop all worker processes.
+
+        :return: None
+        """
+        for shard in self.shards.values():
+            shard.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False  # reraise exceptions if any
+
+
+class _ShardWorker:
+    """Part of shard working in worker process."""
+
+    # Methods which may block for long time get own thread so they do not starve pool of quick calls.
+    _blocking_methods = ("await_done", "goto_state", "run")
+
+    def __init__(self, connection, config: Union[str, dict], device_names: List[str]) -> None:
+        from moler.config import load_config
+        from moler.device.device import DeviceFactory
+        self._connection = connection
+        self._send_lock = threading.Lock()
+        self._observers = {}
+        self._observer_ids = itertools.count(1)
+        self._device_factory = DeviceFactory
+        self._startup_exception = None
+        self._devices = {}
+        try:
+            load_config(config=config)
+            for device_name in device_names:
+                self._devices[device_name] = DeviceFactory.get_device(name=device_name)
+        except Exception as exc:
+            self._startup_exception = exc
+
+    def serve(self) -> None:
+        with concurrent.futures.ThreadPoolExecutor(thread_name_prefix="MolerShardWorker") as executor:
+            while True:
+                try:
+                    request_id, method, args = self._connection.recv()
+                except (EOFError, OSError):
+                    break
+                if method == "close":
+                    break
+                if method in _ShardWorker._blocking_methods:
+                    threading.Thread(target=self._handle, args=(request_id, method, args),
+                                     name=f"MolerShardWorker-{method}-{request_id}", daemon=True).start()
+                else:
+                    executor.submit(self._handle, request_id, method, args)
+        for device in self._devices.values():
+            try:
+                self._device_factory.remove_device(device=device)
+            except Exception:
+                pass
+        self._connection.close()
+
+    def _handle(self, request_id: int, method: str, args: tuple) -> None:
+        try:
+            if self._startup_exception is not None:
+                raise self._startup_exception
+            reply = (request_id, True, getattr(self, f"_do_{method}")(*args))
+        except Exception as exc:
+            reply = (request_id, False, _picklable_exception(exc))
+        with self._send_lock:
+            try:
+                try:
+                    self._connection.send(reply)  # Reply is pickled before anything is written to pipe.
+                except (pickle.PicklingError, TypeError, AttributeError) as exc:
+                    self._connection.send((request_id, False,
+                                           MolerException(f"Not picklable result {reply[2]!r}: {exc!r}")))
+            except (EOFError, OSError):
+                pass
+
+    def _add_observer(self, observer) -> int:
+        observer_id = next(self._observer_ids)
+        self._observers[observer_id] = observer
+        return observer_id
+
+    def _get_observer(self, observer_id: int):
+        try:
+            return self._observers[observer_id]
+        except KeyError:
+            raise WrongUsage(f"Observer id:{observer_id} is not in worker process (proxy released).") from None
+
+    def _do_ping(self) -> bool:
+        return True
+
+    def _do_current_state(self, device_name: str) -> str:
+        return self._devices[device_name].current_state
+
+    def _do_goto_state(self, device_name: str, state: str, kwargs: dict) -> None:
+        self._devices[device_name].goto_state(state=state, **kwargs)
+
+    def _do_run(self, device_name: str, cmd_name: str, kwargs: dict):
+        return self._devices[device_name].run(cmd_name, **kwargs)
+
+    def _do_get_cmd(self, device_name: str, cmd_name: str, cmd_params: Optional[dict], check_state: bool,
+                    for_state: Optional[str]) -> int:
+        cmd = self._devices[device_name].get_cmd(cmd_name=cmd_name, cmd_params=cmd_params, check_state=check_state,
+                                                 for_state=for_state)
+        return self._add_observer(cmd)
+
+    def _do_get_event(self, device_name: str, event_name: str, event_params: Optional[dict], check_state: bool,
+                      for_state: Optional[str]) -> int:
+        event = self._devices[device_name].get_event(event_name=event_name, event_params=event_params,
+                                                     check_state=check_state, for_state=for_state)
+        return self._add_observer(event)
+
+    def _do_start(self, observer_id: int, timeout: Optional[float]) -> None:
+        self._get_observer(observer_id).start(timeout=timeout)
+
+    def _do_await_done(self, observer_id: int, timeout: Optional[float]):
+        return self._get_observer(observer_id).await_done(timeout=timeout)
+
+    def _do_result(self, observer_id: int):
+        return self._get_observer(observer_id).result()
+
+    def _do_done(self, observer_id: int) -> bool:
+        observer = self._observers.get(observer_id)
+        return True if observer is None else observer.done()
+
+    def _do_cancel(self, observer_id: int) -> bool:
+        observer = self._observers.get(observer_id)
+        return False if observer is None else observer.cancel()
+
+    def _do_release(self, observer_id: int) -> None:
+        observer = self._observers.pop(observer_id, None)
+        if observer is not None and not observer.done():
+            observer.cancel()
+
+    def _do_get_last_occurrence(self, observer_id: int):
+        return self._get_observer(observer_id).get_last_occurrence()
+
+
+def _picklable_exception(exc: Exception) -> Exception:
+    """
+    Make sure that exception can be sent to main process. Exceptions which cannot be recreated from pickle are
+    replaced by MolerException with description. Checked only for exceptions, results are sent without check.
+
+    :param exc: exception raised in worker process.
+    :return: picklable exception.
+    """
+    try:
+        pickle.loads(pickle.dumps(exc))
+        return exc
+    except Exception:
+        trace = ''.join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+        return MolerException(f"{exc.__class__.__name__}: {exc}\n{trace}")
+
+
+def _shard_worker_main(connection, config: Union[str, dict], device_names: List[str]) -> None:
+    """
+    Entry point of worker process.
+
+    :param connection: end of pipe to communicate with main process.
+    :param config: moler config.
+    :param device_names: names of devices to create.
+    :return: None
+    """
+    worker = _ShardWorker(connection=connection, config=config, device_names=device_names)
+    worker.serve()
@@ -11,6 +11,7 @@ __email__ = (
 )
 
 import abc
+import asyncio
 import functools
 import importlib
 import inspect
@@ -21,6 +22,7 @@ import re
 import threading
 import time
 import traceback
+from collections import OrderedDict
 
 from moler.config.loggers import change_logging_suffix, configure_device_logger
 from moler.connection_factory import get_connection
@@ -35,6 +37,8 @@ from moler.exceptions import (
 )
 from moler.helpers import copy_dict, copy_list, update_dict
 from moler.instance_loader import create_instance_from_class_fullname
+from moler.util import tracked_thread
+from moler.util.trace_recorder import TraceRecorder
 from pprint import pformat
 
 
@@ -43,6 +47,12 @@ class TextualDevice(AbstractDevice):
     cmds = "cmd"
     events = "event"
 
+    # Validated prompts tables (prompt -> state, compiled prompt -> state) shared by devices with the same state
+    # prompts configuration. The least recently used table is removed when there are too many tables.
+    _validated_prompts_tables = OrderedDict()
+    _validated_prompts_tables_lock = threading.Lock()
+    _max_validated_prompts_tables = 256
+
     not_connected = "NOT_CONNECTED"
     connection_hops = "CONNECTION_HOPS"
 
@@ -107,6 +117,7 @@ class TextualDevice(AbstractDevice):
         self._state_prompts = {}
         self._state_prompts_lock = threading.Lock()
         self._reverse_state_prompts_dict = {}
+        self._compiled_reverse_state_prompts = None  # Compiled prompt -> state, None if not prepared.
         self._prompts_event = None
         self._kept_state = None
         self._configurations = {}
@@ -145,6 +156,7 @@ class TextualDevice(AbstractDevice):
         self._warning_was_sent = False
         self._goto_state_lock = threading.Lock()
         self._goto_state_thread_manipulation_lock = threading.Lock()
+        self._goto_state_stop = threading.local()  # Event to stop goto_state before next hop, per thread.
         self._queue_states = queue.Queue()
         self._thread_for_goto_state = None
         self.SM.state_change_log_callable = self._log
@@ -154,7 +166,8 @@ class TextualDevice(AbstractDevice):
         self.last_wrong_wait4_occurrence = None  # Last occurrence from Wait4prompts if at least 2 prompts matched the
         # same line.
         self._sleep_after_state_change = 0.5
-        self._tick_to_check_runner = 0.1
+        self._timeout_to_check_runner = 10
+        self.prompts_event_max_stored_occurrences = 1  # Only last occurrence of prompt is used by device.
 
     def _prepare_sm_data(self, sm_params):
         self._prepare_transitions()
@@ -515,6 +528,66 @@ class TextualDevice(AbstractDevice):
             device_name=self.name,
         )
 
+    async def goto_state_async(
+        self,
+        state,
+        timeout=-1,
+        rerun=0,
+        send_enter_after_changed_state=False,
+        log_stacktrace_on_fail=True,
+        keep_state=False,
+        timeout_multiply=1.0,
+        sleep_after_changed_state=0.5,
+        executor=None,
+    ):
+        """
+        Go to specific state. Coroutine to await inside asyncio event loop. Parameters as for goto_state.
+        Blocking goto_state is run in a thread of executor, the loop is not blocked. If the coroutine is cancelled
+        then no next hop is started and the coroutine awaits the hop in progress, so the state of device doesn't
+        change after cancellation is propagated.
+
+        :param executor: concurrent.futures.Executor to run state change. If None then default executor of the loop is
+         used.
+        :return: None
+        :raise: DeviceChangeStateFailure if cannot change the state of device.
+        """
+        loop = asyncio.get_running_loop()
+        stop_event = threading.Event()
+        state_change_done = asyncio.Event()
+        start_lock = threading.Lock()
+        started = []
+
+        def change_state():
+            with start_lock:
+                if stop_event.is_set():
+                    return  # Cancelled before start.
+                started.append(True)
+            self._goto_state_stop.event = stop_event
+            try:
+                self.goto_state(
+                    state=state,
+                    timeout=timeout,
+                    rerun=rerun,
+                    send_enter_after_changed_state=send_enter_after_changed_state,
+                    log_stacktrace_on_fail=log_stacktrace_on_fail,
+                    keep_state=keep_state,
+                    timeout_multiply=timeout_multiply,
+                    sleep_after_changed_state=sleep_after_changed_state,
+                )
+            finally:
+                self._goto_state_stop.event = None
+                loop.call_soon_threadsafe(state_change_done.set)
+
+        try:
+            await loop.run_in_executor(executor, change_state)
+        except asyncio.CancelledError:
+            with start_lock:
+                stop_event.set()
+                in_progress = bool(started)
+            if in_progress:
+                await state_change_done.wait()
+            raise
+
     def _recover_state(self, state, keep_state=True):
         if self._goto_state_in_production_mode is False:
             return
@@ -536,6 +609,7 @@ class TextualDevice(AbstractDevice):
                     name=f"GotoStateThread-{self.name}",
                 )
                 thread.daemon = True
+                tracked_thread.register_thread(role=tracked_thread.ROLE_GOTO_STATE, thread=thread)
                 thread.start()
                 self._thread_for_goto_state = thread
 
@@ -611,6 +685,7 @@ class TextualDevice(AbstractDevice):
         next_stage_timeout = final_timeout
 
         while (not is_dest_state) and (not is_timeout):
+            self._raise_if_goto_state_stopped(dest_state=dest_state)
             next_state = self._get_next_state(dest_state)
             if self.current_state != dest_state:
                 self._trigger_change_state(
@@ -634,6 +709,22 @@ class TextualDevice(AbstractDevice):
             self._kept_state = dest_state
         self._warning_was_sent = False
 
+    def _raise_if_goto_state_stopped(self, dest_state):
+        """
+        Raise if goto_state run in current thread was stopped (i.e. cancelled goto_state_async).
+
+        :param dest_state: destination state of goto_state.
+        :return: None
+        :raise: DeviceChangeStateFailure if goto_state was stopped.
+        """
+        stop_event = getattr(self._goto_state_stop, "event", None)
+        if stop_event is not None and stop_event.is_set():
+            raise DeviceChangeStateFailure(
+                device=self.__class__.__name__,
+                exception=f"Going to state '{dest_state}' stopped in state '{self.current_state}'.",
+                device_name=self.name,
+            )
+
     def _get_next_state(self, dest_state):
         next_state = None
         if self.current_state in self._state_hops.keys():
@@ -665,14 +756,23 @@ class TextualDevice(AbstractDevice):
                 change_state_method = getattr(self, goto_method)
 
         if change_state_method:
-            self._trigger_change_state_loop(
-                rerun=rerun,
-                next_state=next_state,
-                change_state_method=change_state_method,
-                timeout=timeout,
-                log_stacktrace_on_fail=log_stacktrace_on_fail,
-                send_enter_after_changed_state=send_enter_after_changed_state,
-            )
+            source_state = self.current_state
+            hop_start_time = time.monotonic()
+            try:
+                self._trigger_change_state_loop(
+                    rerun=rerun,
+                    next_state=next_state,
+                    change_state_method=change_state_method,
+                    timeout=timeout,
+                    log_stacktrace_on_fail=log_stacktrace_on_fail,
+                    send_enter_after_changed_state=send_enter_after_changed_state,
+                )
+            finally:
+                recorder = TraceRecorder.active
+                if recorder is not None:
+                    recorder.complete(name=f"{source_state} -> {next_state}", category="device",
+                                      start_time=hop_start_time,
+                                      args={"device": self.name, "state": self.current_state})
         else:
             exc = DeviceFailure(
                 device=self.__class__.__name__,
@@ -1072,18 +1172,19 @@ class TextualDevice(AbstractDevice):
     def _get_for_state_to_run_prompts_observers(self):
         for_state = None
         if self.current_state == "NOT_CONNECTED":
-            for state in self._state_hops:
+            states = list(self._state_hops.keys())
+            if not states:  # device without state hops
+                states = [state for state in self.states if state != TextualDevice.not_connected]
+            for state in states:
                 if state.find("UNIX") != -1 or state.find("LINUX") != -1:
                     for_state = state
                     break
-            if for_state is None:
-                # noinspection PyUnresolvedReferences
-                for_state = self._state_hops.keys()[0]
+            if for_state is None and states:
+                for_state = states[0]
         return for_state
 
     def _run_prompts_observers(self):
-        self._validate_prompts_uniqueness()
-        self._prepare_reverse_state_prompts_dict()
+        self._prepare_validated_reverse_state_prompts_dict()
 
         for_state = self._get_for_state_to_run_prompts_observers()
         if self._prompts_event is not None:
@@ -1091,7 +1192,7 @@ class TextualDevice(AbstractDevice):
         self._prompts_event = self.get_event(
             event_name="wait4prompts",
             event_params={
-                "prompts": self._reverse_state_prompts_dict,
+                "prompts": self._compiled_reverse_state_prompts,
                 "till_occurs_times": -1,
             },
             check_state=False,
@@ -1105,17 +1206,52 @@ class TextualDevice(AbstractDevice):
             },
         )
         self._prompts_event.check_against_all_prompts = self._check_all_prompts_on_line
+        self._prompts_event.set_occurrences_retention(max_stored=self.prompts_event_max_stored_occurrences)
         self._prompts_event.disable_log_occurrence()
         self._prompts_event.start()
         start_time = time.monotonic()
-        while self._prompts_event.is_in_runner() is False:
-            if time.monotonic() - start_time > 10:
-                self._log(
-                    logging.WARNING,
-                    f"Cannot start prompts observers properly. Still not in runner after {time.monotonic() - start_time} seconds.",
-                )
-                break
-            time.sleep(self._tick_to_check_runner)
+        if not self._prompts_event.wait_for_in_runner(in_runner=True, timeout=self._timeout_to_check_runner):
+            self._log(
+                logging.WARNING,
+                f"Cannot start prompts observers properly. Still not in runner after {time.monotonic() - start_time} seconds.",
+            )
+
+    def _prepare_validated_reverse_state_prompts_dict(self):
+        """
+        Validate prompts and prepare reverse dict (prompt -> state) and its compiled version for prompts observer.
+        Result of validation and compilation is cached for the same state prompts configuration so devices with the
+        same configuration (i.e. clones) don't repeat it.
+
+        :return: None
+        """
+        try:
+            prompts_key = (self.__class__, tuple(self._state_prompts.items()))
+            hash(prompts_key)
+        except TypeError:  # unhashable prompt, no caching
+            prompts_key = None
+        prompts_tables = None
+        if prompts_key is not None:
+            with TextualDevice._validated_prompts_tables_lock:
+                prompts_tables = TextualDevice._validated_prompts_tables.get(prompts_key)
+                if prompts_tables is not None:
+                    TextualDevice._validated_prompts_tables.move_to_end(prompts_key)
+        if prompts_tables is None:
+            self._validate_prompts_uniqueness()
+            reverse_prompts = {prompt: state for state, prompt in self._state_prompts.items()}
+            compiled_prompts = {re.compile(prompt) if not hasattr(prompt, "match") else prompt: state
+                                for prompt, state in reverse_prompts.items()}
+            prompts_tables = (reverse_prompts, compiled_prompts)
+            if prompts_key is not None:
+                with TextualDevice._validated_prompts_tables_lock:
+                    TextualDevice._validated_prompts_tables[prompts_key] = prompts_tables
+                    if len(TextualDevice._validated_prompts_tables) > TextualDevice._max_validated_prompts_tables:
+                        TextualDevice._validated_prompts_tables.popitem(last=False)
+        reverse_prompts, compiled_prompts = prompts_tables
+        self._reverse_state_prompts_dict.update(reverse_prompts)
+        if self._reverse_state_prompts_dict == reverse_prompts:
+            self._compiled_reverse_state_prompts = compiled_prompts
+        else:  # Prompts from previous configuration are kept too.
+            self._compiled_reverse_state_prompts = self._reverse_state_prompts_dict
 
     def _prepare_reverse_state_prompts_dict(self):
         for state in self._state_prompts.keys():
@@ -1149,14 +1285,11 @@ class TextualDevice(AbstractDevice):
                 self._prompts_event = None
                 event.cancel()
                 start_stop_event = time.monotonic()
-                while event.is_in_runner() is True:
-                    if time.monotonic() - start_stop_event > 10:
-                        self._log(
-                            logging.WARNING,
-                            f"Cannot stop prompts observers properly. Still in runner after {time.monotonic() - start_stop_event} seconds.",
-                        )
-                        break
-                    time.sleep(self._tick_to_check_runner)
+                if not event.wait_for_in_runner(in_runner=False, timeout=self._timeout_to_check_runner):
+                    self._log(
+                        logging.WARNING,
+                        f"Cannot stop prompts observers properly. Still in runner after {time.monotonic() - start_stop_event} seconds.",
+                    )
                 event.remove_event_occurred_callback()
         except Exception:
             pass
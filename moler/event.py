@@ -1,13 +1,14 @@
 # -*- coding: utf-8 -*-
 
 __author__ = "Michal Ernst, Marcin Usielski"
-__copyright__ = "Copyright (C) 2018-2024, Nokia"
+__copyright__ = "Copyright (C) 2018-2026, Nokia"
 __email__ = "michal.ernst@nokia.com, marcin.usielski@nokia.com"
 
 import abc
+import collections
 import functools
 import logging
-from typing import Optional
+from typing import Callable, Optional
 import six
 
 from moler.abstract_moler_connection import AbstractMolerConnection
@@ -33,6 +34,10 @@ class Event(ConnectionObserver):
         self.callback = None
         self.callback_params = {}
         self._occurred = None
+        self._occurrences_count = 0
+        self._last_occurrence = None
+        self._max_stored_occurrences = None  # None - store all, 0 - count only, N - store last N occurrences.
+        self._occurrence_stream_callback = None
         self.till_occurs_times = till_occurs_times
         self._log_every_occurrence = True
         self.event_name = Event.observer_name
@@ -65,6 +70,31 @@ class Event(ConnectionObserver):
                 f"Cannot assign a callback '{callback}' to event '{self}' when another callback '{self.callback}' is already assigned"
             )
 
+    def set_occurrences_retention(self, max_stored: Optional[int] = None,
+                                  stream_callback: Optional[Callable] = None) -> None:
+        """
+        Sets how occurrences are kept by the event. Call before the event is started.
+
+        :param max_stored: None to store all occurrences (default), 0 to only count occurrences, positive value to
+         store last max_stored occurrences (ring buffer).
+        :param stream_callback: callable called with event_data of every occurrence. Use with max_stored=0 to process
+         occurrences without storing them.
+        :return: None
+        """
+        if max_stored is not None and max_stored < 0:
+            raise MolerException(f"max_stored must be None or not negative but is {max_stored}.")
+        self._max_stored_occurrences = max_stored
+        self._occurrence_stream_callback = stream_callback
+
+    @property
+    def occurrences_count(self) -> int:
+        """
+        Number of occurrences of the event (also not stored ones).
+
+        :return: Number of occurrences.
+        """
+        return self._occurrences_count
+
     def enable_log_occurrence(self) -> None:
         """
         Enables to log every occurrence of the event.
@@ -109,10 +139,15 @@ class Event(ConnectionObserver):
         if self.done():
             raise ResultAlreadySet(self)
         self._prepare_result_from_occurred()
-        self._occurred.append(event_data)
+        self._occurrences_count += 1
+        self._last_occurrence = event_data
+        if self._max_stored_occurrences != 0:
+            self._occurred.append(event_data)
+        if self._occurrence_stream_callback:
+            self._occurrence_stream_callback(event_data)
         self._last_chunk_matched = True
         if self.till_occurs_times > 0:
-            if len(self._occurred) >= self.till_occurs_times:
+            if self._occurrences_count >= self.till_occurs_times:
                 self.break_event()
         self.notify()
 
@@ -123,7 +158,10 @@ class Event(ConnectionObserver):
         :return: None
         """
         if self._occurred is None:
-            self._occurred = []
+            if self._max_stored_occurrences:
+                self._occurred = collections.deque(maxlen=self._max_stored_occurrences)
+            else:
+                self._occurred = []
 
     def _get_module_class(self) -> str:
         return f"{self.__class__.__module__}.{self}"
@@ -150,10 +188,7 @@ class Event(ConnectionObserver):
 
         :return: ret value form last occurrence or None if there is no occurrence.
         """
-        if self._occurred:
-            return self._occurred[-1]
-        else:
-            return None
+        return self._last_occurrence
 
     def break_event(self, force=False) -> None:
         """
@@ -164,8 +199,10 @@ class Event(ConnectionObserver):
         """
         if not self.done():
             self._prepare_result_from_occurred()
-            if not force and len(self._occurred) < self.till_occurs_times:
-                self.set_exception(MolerException(f"Expected {self.till_occurs_times} occurrences but got {len(self._occurred)}."))
+            if not force and self._occurrences_count < self.till_occurs_times:
+                self.set_exception(MolerException(f"Expected {self.till_occurs_times} occurrences but got {self._occurrences_count}."))
+            elif isinstance(self._occurred, collections.deque):
+                self.set_result(list(self._occurred))
             else:
                 self.set_result(self._occurred)
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
 __author__ = 'Marcin Usielski, Michal Ernst'
-__copyright__ = 'Copyright (C) 2018-2024, Nokia'
+__copyright__ = 'Copyright (C) 2018-2026, Nokia'
 __email__ = 'marcin.usielski@nokia.com, michal.ernst@nokia.com'
 
 import abc
@@ -9,6 +9,7 @@ import six
 import logging
 from moler.event import Event
 from moler.cmd import RegexHelper
+from moler.util.partial_line import PartialLine
 
 
 @six.add_metaclass(abc.ABCMeta)
@@ -17,9 +18,9 @@ class TextualEvent(Event):
 
     def __init__(self, connection=None, till_occurs_times=-1, runner=None):
         super(TextualEvent, self).__init__(connection=connection, runner=runner, till_occurs_times=till_occurs_times)
-        self._last_not_full_line = None
+        self._partial_line = PartialLine()  # Not full line, chunks joined when line is complete
         self._newline_chars = TextualEvent._default_newline_chars
-        self._regex_helper = RegexHelper()  # Object to regular expression matching
+        self._regex_helper = RegexHelper(owner=self)  # Object to regular expression matching
         self._paused = False
         self._ignore_unicode_errors = True  # If True then UnicodeDecodeError will be logged not raised in data_received
         self._last_recv_time_data_read_from_connection = None  # Time moment when data was really received from
@@ -28,6 +29,11 @@ class TextualEvent(Event):
         # method. False to process from the last line, True from the newest.
         self._break_processing_when_found: bool = False  # Flag to break processing
         # line when the first line is found.
+        self.partial_line_window: int = 4096  # While line is not full on_new_line gets the newest chunk and this
+        # number of previous chars of line (whole line if it is shorter), so parsing of long output without new line
+        # chars is linear. Full line is always passed as a whole.
+        self.max_partial_line_length = None  # If not None then not full line longer than this is passed to
+        # on_new_line as full line (with warning in log) to bound memory. None for no limit.
 
     def event_occurred(self, event_data):
         self._consume_already_parsed_fragment()
@@ -68,7 +74,7 @@ class TextualEvent(Event):
                         self._process_line_from_output(line=line, current_chunk=current_chunk,
                                                        is_full_line=is_full_line)
                         if self._paused:
-                            self._last_not_full_line = None
+                            self._partial_line.clear()
                             break
                         if self._last_chunk_matched and self._break_processing_when_found:
                             break
@@ -100,16 +106,19 @@ class TextualEvent(Event):
         :return: Concatenated (if necessary) line from connection without newline char(s). Flag: True if line had
          newline char(s), False otherwise.
         """
-        line = current_chunk
-        if self._last_not_full_line is not None:
-            line = f"{self._last_not_full_line}{line}"
-            self._last_not_full_line = None
-        is_full_line = self.is_new_line(line)
+        is_full_line = self.is_new_line(current_chunk)
         if is_full_line:
-            line = self._strip_new_lines_chars(line)
-        else:
-            self._last_not_full_line = line
-        return line, is_full_line
+            line = current_chunk
+            if not self._partial_line.is_empty():
+                self._partial_line.append(current_chunk)
+                line = self._partial_line.pop_line()
+            return self._strip_new_lines_chars(line), is_full_line
+        self._partial_line.append(current_chunk)
+        if self.max_partial_line_length is not None and len(self._partial_line) > self.max_partial_line_length:
+            self._log(lvl=logging.WARNING,
+                      msg=f"Not full line longer than {self.max_partial_line_length} chars passed as full line.")
+            return self._partial_line.pop_line(), True
+        return self._partial_line.get_tail(len(current_chunk) + self.partial_line_window), is_full_line
 
     def is_new_line(self, line):
         """
@@ -135,7 +144,7 @@ class TextualEvent(Event):
         Clear already parsed fragment of line to not parse it twice when another fragment appears on device.
         :return: None
         """
-        self._last_not_full_line = None
+        self._partial_line.clear()
 
     def _decode_line(self, line):
         """
@@ -153,7 +162,7 @@ class TextualEvent(Event):
         :return: None
         """
         self._paused = True
-        self._last_not_full_line = None
+        self._partial_line.clear()
 
     def resume(self):
         """
@@ -12,17 +12,19 @@ The only 3 requirements for these connections is:
 """
 
 __author__ = 'Grzegorz Latuszek, Marcin Usielski'
-__copyright__ = 'Copyright (C) 2018-2021, Nokia'
+__copyright__ = 'Copyright (C) 2018-2026, Nokia'
 __email__ = 'grzegorz.latuszek@nokia.com, marcin.usielski@nokia.com'
 
 import threading
 
+from moler.util import tracked_thread
+
 
 class TillDoneThread(threading.Thread):
 
     _tdh_nr = 1
 
-    def __init__(self, done_event, target=None, name=None, kwargs=None):
+    def __init__(self, done_event, target=None, name=None, kwargs=None, role=tracked_thread.ROLE_IO_PULLER):
         if name is None:
             name = f"TillDoneThread-{TillDoneThread._tdh_nr}"
             TillDoneThread._tdh_nr += 1
@@ -30,6 +32,7 @@ class TillDoneThread(threading.Thread):
                                              kwargs=kwargs)
         self.done_event = done_event
         self.daemon = True
+        tracked_thread.register_thread(role=role, thread=self)
 
     def join(self, timeout=None):
         """
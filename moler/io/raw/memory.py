@@ -28,6 +28,7 @@ from moler.io.io_connection import IOConnection
 from moler.io.raw import TillDoneThread
 from moler.config.loggers import TRACE
 from moler.util import tracked_thread
+from moler.util.trace_recorder import TraceRecorder
 
 
 class FifoBuffer(IOConnection):
@@ -259,7 +260,13 @@ class ThreadedFifoBuffer(FifoBuffer):
         while not pulling_done.is_set():
             if next(heartbeat):
                 logging.getLogger("moler_threads").debug(f"ALIVE {self}")
-            self.read()  # internally forwards to embedded Moler connection
+            read_start_time = time.monotonic()
+            data = self.read()  # internally forwards to embedded Moler connection
+            if data:
+                recorder = TraceRecorder.active
+                if recorder is not None:
+                    recorder.complete(name="read", category="io", start_time=read_start_time,
+                                      args={"connection": self.moler_connection.name, "bytes": len(data)})
             try:
                 data, delay = self.injections.get_nowait()
                 if delay:
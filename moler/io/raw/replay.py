@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+"""
+External-IO connection replaying recorded session of device.
+
+Session is taken from raw log with its trace log (<logger>.raw.log + <logger>.raw.trace.log) or from binary
+session recording (<logger>.raw.rec). Received data of session is fed into Moler's connection, data sent by
+Moler's connection advances replay to the next recorded response (like RemoteConnection of devices_SM with its
+canned outputs).
+
+Replay modes:
+- fast - as fast as possible (CPU speed), time of recording is ignored,
+- original - original timing of recording,
+- scaled - timing of recording divided by speed (speed=10 plays recording 10 times faster).
+
+When waiting for send, timing is restarted at the moment of send so responses keep their original delays after
+request.
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+import datetime
+import logging
+import re
+import threading
+import time
+from typing import Iterator, Optional
+from six.moves.queue import Queue, Empty
+
+from moler.exceptions import WrongUsage
+from moler.io.raw import TillDoneThread
+from moler.io.raw.memory import FifoBuffer
+from moler.util import tracked_thread
+from moler.util.session_recording import SessionRecord, SessionRecordingReader, is_session_recording
+
+REPLAY_FAST = "fast"
+REPLAY_ORIGINAL = "original"
+REPLAY_SCALED = "scaled"
+_REPLAY_MODES = (REPLAY_FAST, REPLAY_ORIGINAL, REPLAY_SCALED)
+
+# - 1536862639.4494998: {time: '20:17:19.449', direction: <, bytesize: 17, offset: 17}
+_RAW_TRACE_RECORD = re.compile(r"^-\s+(?P<created>[\d.]+):\s+\{.*direction:\s+(?P<direction>\S+),\s+"
+                               r"bytesize:\s+(?P<bytesize>\d+)")
+
+
+def get_raw_trace_log_path(raw_log_path: str) -> str:
+    """
+    Get path of trace log written together with raw log.
+
+    :param raw_log_path: Path of raw log, for example logs/UNIX_LOCAL.raw.log.
+    :return: Path of trace log, for example logs/UNIX_LOCAL.raw.trace.log.
+    """
+    if ".raw." not in raw_log_path:
+        raise WrongUsage(f"Cannot find trace log of '{raw_log_path}'. Please pass trace_path.")
+    head, tail = raw_log_path.rsplit(".raw.", 1)
+    return f"{head}.raw.trace.{tail}"
+
+
+def read_raw_log_session(raw_log_path: str, trace_path: Optional[str] = None) -> Iterator[SessionRecord]:
+    """
+    Read session from raw log and its trace log. Both files are read lazily.
+
+    :param raw_log_path: Path of raw log.
+    :param trace_path: Path of trace log. None to take trace log written together with raw log.
+    :return: Iterator of records. Time of record is time from the first record.
+    """
+    reader = RawLogSessionReader(raw_log_path=raw_log_path, trace_path=trace_path)
+    try:
+        for record in reader.records():
+            yield record
+    finally:
+        reader.close()
+
+
+class RawLogSessionReader:
+    """
+    Lazy reader of raw log and its trace log.
+    """
+
+    def __init__(self, raw_log_path: str, trace_path: Optional[str] = None):
+        """
+        Open raw log and its trace log. Missing or unreadable file raises here, not while reading records.
+
+        :param raw_log_path: Path of raw log.
+        :param trace_path: Path of trace log. None to take trace log written together with raw log.
+        """
+        self.path = raw_log_path
+        self.trace_path = get_raw_trace_log_path(raw_log_path) if trace_path is None else trace_path
+        self._trace_file = open(self.trace_path, "r")
+        try:
+            self._raw_file = open(raw_log_path, "rb")
+        except Exception:
+            self._trace_file.close()
+            raise
+
+    def records(self) -> Iterator[SessionRecord]:
+        """
+        Iterate records.
+
+        :return: Iterator of records. Time of record is time from the first record.
+        """
+        start_time = None
+        offset = 0
+        for line in self._trace_file:
+            found = _RAW_TRACE_RECORD.match(line)
+            if found is None:
+                continue
+            bytesize = int(found.group("bytesize"))
+            data = self._raw_file.read(bytesize)  # Raw log is concatenation of records of trace log.
+            if len(data) < bytesize:
+                break  # Raw log cut while logging.
+            created = float(found.group("created"))
+            if start_time is None:
+                start_time = created
+            yield SessionRecord(time=created - start_time, direction=found.group("direction"), data=data,
+                                offset=offset)
+            offset += bytesize
+
+    def close(self) -> None:
+        """
+        Close raw log and trace log.
+
+        :return: None
+        """
+        self._trace_file.close()
+        self._raw_file.close()
+
+
+class ThreadedReplay(FifoBuffer):
+    """
+    Replay of recorded session inside dedicated thread.
+
+    Usable to regression test commands, events and state machines of devices against real captured traffic.
+    """
+
+    def __init__(self, moler_connection, path, trace_path=None, mode=REPLAY_FAST, speed=1.0, wait_for_send=True,
+                 name=None, logger_name=""):
+        """
+        Initialization of replay connection.
+
+        :param moler_connection: Moler's connection to join with
+        :param path: path of binary session recording (.raw.rec) or of raw log (.raw.log)
+        :param trace_path: path of trace log of raw log, None to take one written together with raw log
+        :param mode: 'fast', 'original' or 'scaled'
+        :param speed: how many times faster than original recording is played in 'scaled' mode
+        :param wait_for_send: True to stop replay on every recorded send until data is sent to connection,
+         False to replay received data only
+        :param name: name assigned to connection
+        :param logger_name: take that logger from logging
+        """
+        if mode not in _REPLAY_MODES:
+            raise WrongUsage(f"Mode of replay must be one of {_REPLAY_MODES}, not '{mode}'.")
+        if mode == REPLAY_SCALED and speed <= 0:
+            raise WrongUsage(f"Speed of scaled replay must be greater than 0, not '{speed}'.")
+        super(ThreadedReplay, self).__init__(moler_connection=moler_connection, echo=False, name=name,
+                                             logger_name=logger_name)
+        self.path = path
+        self.trace_path = trace_path
+        self.mode = mode
+        self.speed = speed if mode == REPLAY_SCALED else 1.0
+        self.wait_for_send = wait_for_send
+        self.replay_done = threading.Event()
+        self.replayed_records = 0
+        self.pulling_thread = None
+        self._sent = Queue()
+        self._reader = None
+
+    def open(self):
+        """Start thread replaying session."""
+        records = self._open_session() if self.pulling_thread is None else None  # Errors of files raise here.
+        ret = super(ThreadedReplay, self).open()
+        done = threading.Event()
+        if self.pulling_thread is None:
+            self.replay_done.clear()
+            self.replayed_records = 0
+            self.pulling_thread = TillDoneThread(target=self.pull_data,
+                                                 done_event=done,
+                                                 kwargs={'pulling_done': done,
+                                                         'records': records})
+            self._log(msg=f"open {self}", level=logging.INFO)
+            self._notify_on_connect()
+            self.moler_connection.open()  # Opened before replay since closed connection drops data.
+            self.pulling_thread.start()
+        return ret
+
+    def close(self):
+        """Stop replaying thread."""
+        if self.pulling_thread:
+            self.pulling_thread.join()
+            self.pulling_thread = None
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        super(ThreadedReplay, self).close()
+        self._log(msg=f"closed {self}", level=logging.INFO)
+        self._notify_on_disconnect()
+        self.moler_connection.shutdown()
+
+    def write(self, input_bytes):
+        """
+        Data sent to connection releases the next recorded response.
+        """
+        self._sent.put(input_bytes)
+
+    send = write  # just alias to make base class happy :-)
+
+    def wait_for_replay_end(self, timeout=None):
+        """
+        Wait until all records of session are replayed.
+
+        :param timeout: Max time to wait in seconds, None to wait without limit.
+        :return: True if replay is done, False on timeout.
+        """
+        return self.replay_done.wait(timeout=timeout)
+
+    @tracked_thread.log_exit_exception
+    def pull_data(self, pulling_done, records):
+        """Feed received data of session into Moler's connection."""
+        logging.getLogger("moler_threads").debug(f"ENTER {self}")
+        heartbeat = tracked_thread.report_alive()
+        start_time = time.monotonic()
+        record_start_time = None
+        for record in records:
+            if next(heartbeat):
+                logging.getLogger("moler_threads").debug(f"ALIVE {self}")
+            if pulling_done.is_set():
+                break
+            if record_start_time is None:
+                record_start_time = record.time
+            if record.direction == ">":
+                if self.wait_for_send:
+                    if not self._wait_for_send(record=record, pulling_done=pulling_done):
+                        break
+                    start_time = time.monotonic()
+                    record_start_time = record.time
+                continue
+            if record.direction != "<":
+                continue
+            if self.mode != REPLAY_FAST:
+                delay = start_time + (record.time - record_start_time) / self.speed - time.monotonic()
+                if delay > 0 and pulling_done.wait(delay):
+                    break
+            self.data_received(record.data, recv_time=datetime.datetime.now())
+            self.replayed_records += 1
+        else:
+            self.replay_done.set()
+            self._log(msg=f"replay of {self.path} done ({self.replayed_records} records)", level=logging.INFO)
+        logging.getLogger("moler_threads").debug(f"EXIT  {self}")
+
+    def _wait_for_send(self, record, pulling_done):
+        while not pulling_done.is_set():
+            try:
+                sent_data = self._sent.get(timeout=0.05)
+            except Empty:
+                continue
+            if bytes(sent_data) != bytes(record.data):
+                self._log(msg=f"sent {bytes(sent_data)!r} instead of recorded {bytes(record.data)!r}",
+                          level=logging.WARNING)
+            return True
+        return False
+
+    def _open_session(self):
+        if is_session_recording(self.path):
+            self._reader = SessionRecordingReader(self.path)
+        else:
+            self._reader = RawLogSessionReader(raw_log_path=self.path, trace_path=self.trace_path)
+        return self._reader.records()
+
+    def __str__(self):
+        return f'{self._name}:replay({self.path})'
@@ -14,7 +14,7 @@ The only 3 requirements for these connections are:
 # pylint: skip-file
 
 __author__ = 'Grzegorz Latuszek'
-__copyright__ = 'Copyright (C) 2018, Nokia'
+__copyright__ = 'Copyright (C) 2018-2026, Nokia'
 __email__ = 'grzegorz.latuszek@nokia.com'
 
 import logging
@@ -22,6 +22,7 @@ import select
 import socket
 import sys
 import threading
+import time
 import contextlib
 
 from moler.io.io_exceptions import ConnectionTimeout
@@ -30,6 +31,7 @@ from moler.io.io_exceptions import RemoteEndpointNotConnected
 from moler.io.raw import TillDoneThread
 import datetime
 from moler.util import tracked_thread
+from moler.util.trace_recorder import TraceRecorder
 
 
 # TODO: logging - want to know what happens on GIVEN connection
@@ -209,8 +211,13 @@ class ThreadedTcp(Tcp):
             try:
                 data = self.receive(timeout=0.1)
                 if data:
+                    dispatch_start_time = time.monotonic()
                     # make Moler happy :-)
                     self.moler_connection.data_received(data, datetime.datetime.now())  # (3)
+                    recorder = TraceRecorder.active
+                    if recorder is not None:
+                        recorder.complete(name="read", category="io", start_time=dispatch_start_time,
+                                          args={"connection": self.moler_connection.name, "bytes": len(data)})
             except ConnectionTimeout:
                 continue
             except RemoteEndpointNotConnected:
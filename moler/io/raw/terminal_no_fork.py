@@ -21,6 +21,7 @@ from moler.helpers import remove_all_known_special_chars
 from moler.helpers import all_chars_to_hex
 from moler.helpers import non_printable_chars_to_hex
 from moler.util import tracked_thread
+from moler.util.trace_recorder import TraceRecorder
 from moler.connection import Connection
 
 
@@ -201,12 +202,17 @@ class ThreadedTerminalNoFork(IOConnection):
 
             if self._terminal.fd in reads:
                 try:
+                    read_start_time = time.monotonic()
                     data = self._terminal.read(self._read_buffer_size)
                     self._log_debug_incoming_data(data)
                     if self._shell_operable.is_set():
                         self.data_received(data=data, recv_time=datetime.datetime.now())
                     else:
                         self._verify_shell_is_operable(data)
+                    recorder = TraceRecorder.active
+                    if recorder is not None:
+                        recorder.complete(name="read", category="io", start_time=read_start_time,
+                                          args={"connection": self.moler_connection.name, "bytes": len(data)})
                 except EOFError:
                     self._notify_on_disconnect()
                     pulling_done.set()
@@ -6,7 +6,7 @@ Moler implementation of MolerConnection for Runner with single thread.
 
 
 __author__ = "Marcin Usielski"
-__copyright__ = "Copyright (C) 2021, Nokia"
+__copyright__ = "Copyright (C) 2021-2026, Nokia"
 __email__ = "marcin.usielski@nokia.com"
 
 
@@ -58,7 +58,7 @@ class MolerConnectionForSingleThreadRunner(ThreadedMolerConnection):
             newline=newline,
             logger_name=logger_name,
         )
-        self._connection_observers = []
+        self._connection_observers = []  # Guarded by self._observers_lock.
         self.open()
 
     def open(self):
@@ -87,12 +87,14 @@ class MolerConnectionForSingleThreadRunner(ThreadedMolerConnection):
         :param connection_observer: Command or event.
         :return: None
         """
-        if connection_observer not in self._connection_observers:
+        with self._observers_lock:
+            if connection_observer in self._connection_observers:
+                return
             self._connection_observers.append(connection_observer)
-            self.subscribe(
-                observer=connection_observer.data_received,
-                connection_closed_handler=connection_observer.connection_closed_handler,
-            )
+        self.subscribe(
+            observer=connection_observer.data_received,
+            connection_closed_handler=connection_observer.connection_closed_handler,
+        )
 
     def unsubscribe_connection_observer(self, connection_observer):
         """
@@ -101,12 +103,29 @@ class MolerConnectionForSingleThreadRunner(ThreadedMolerConnection):
         :param connection_observer: Command or event.
         :return: None
         """
-        if connection_observer in self._connection_observers:
+        with self._observers_lock:
+            if connection_observer not in self._connection_observers:
+                return
             self._connection_observers.remove(connection_observer)
-            self.unsubscribe(
-                observer=connection_observer.data_received,
-                connection_closed_handler=connection_observer.connection_closed_handler,
-            )
+        self.unsubscribe(
+            observer=connection_observer.data_received,
+            connection_closed_handler=connection_observer.connection_closed_handler,
+        )
+
+    def remove_leaked_observers(self):
+        """
+        Unsubscribe observers which are done, cancelled or whose references are dead and stop their threads.
+
+        :return: Dict {name of wrapper of removed observer: reason}.
+        """
+        removed = super(MolerConnectionForSingleThreadRunner, self).remove_leaked_observers()
+        if removed:
+            with self._observers_lock:
+                self._connection_observers = [
+                    connection_observer for connection_observer in self._connection_observers
+                    if self._get_observer_key_value(connection_observer.data_received)[0] in self._observer_wrappers
+                ]
+        return removed
 
     def notify_observers(self, data, recv_time):
         """
@@ -118,7 +137,9 @@ class MolerConnectionForSingleThreadRunner(ThreadedMolerConnection):
         super(MolerConnectionForSingleThreadRunner, self).notify_observers(
             data=data, recv_time=recv_time
         )
-        for connection_observer in self._connection_observers:
+        with self._observers_lock:
+            connection_observers = list(self._connection_observers)
+        for connection_observer in connection_observers:
             connection_observer.life_status.last_feed_time = time.monotonic()
 
     def _create_observer_wrapper(self, observer_reference, self_for_observer):
@@ -134,12 +155,14 @@ class MolerConnectionForSingleThreadRunner(ThreadedMolerConnection):
                 observer=observer_reference,
                 observer_self=self_for_observer,
                 logger=self.logger,
+                metrics=self.metrics,
             )
         else:
             otw = ObserverThreadWrapper(
                 observer=observer_reference,
                 observer_self=self_for_observer,
                 logger=self.logger,
+                metrics=self.metrics,
             )
         return otw
 
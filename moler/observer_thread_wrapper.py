@@ -7,10 +7,13 @@ __copyright__ = 'Copyright (C) 2020-2026, Nokia'
 __email__ = 'marcin.usielski@nokia.com'
 
 import logging
+import time
 import traceback
 import threading
 import queue
+import moler.connection_observer
 from moler.util import tracked_thread
+from moler.util.observer_cpu_accounting import ObserverCpuAccounting, get_observer_name
 from moler.config.loggers import TRACE
 from moler.exceptions import CommandFailure, MolerException
 from threading import Thread
@@ -21,13 +24,18 @@ class ObserverThreadWrapper:
 
     _th_nr = 1
 
-    def __init__(self, observer, observer_self, logger):
+    LEAK_DEAD_REFERENCE = "dead_reference"
+    LEAK_CANCELLED = "cancelled"
+    LEAK_DONE = "done"
+
+    def __init__(self, observer, observer_self, logger, metrics=None):
         """
         Construct wrapper for observer.
 
         :param observer: observer to wrap.
         :param observer_self: self for observer if observer is method from object or None if observer is a function.
         :param logger: logger to log.
+        :param metrics: ConnectionMetrics to record dispatch latency or None.
         """
         self._observer = observer
         self._observer_self = observer_self
@@ -35,10 +43,14 @@ class ObserverThreadWrapper:
         self._request_end = threading.Event()
         self._timeout_for_get_from_queue = 1
         self.logger = logger
+        self._metrics = metrics
+        self.queue_high_water_mark = 0
+        self._observer_name = None  # Name used by ObserverCpuAccounting, calculated when needed.
         self.name = f"ObserverThreadWrapper-{ObserverThreadWrapper._th_nr}-{observer_self}"
         self._t = Thread(target=self._loop_for_observer, name=self.name)
         ObserverThreadWrapper._th_nr += 1
         self._t.daemon = True
+        tracked_thread.register_thread(role=tracked_thread.ROLE_OBSERVER_WRAPPER, thread=self._t)
         self._t.start()
 
     def feed(self, data, recv_time):
@@ -50,6 +62,18 @@ class ObserverThreadWrapper:
         :return: None
         """
         self._queue.put((data, recv_time))
+        depth = self._queue.qsize()
+        if depth > self.queue_high_water_mark:
+            self.queue_high_water_mark = depth
+
+    @property
+    def queue_depth(self):
+        """
+        Number of data chunks waiting for observer.
+
+        :return: Size of queue.
+        """
+        return self._queue.qsize()
 
     def request_stop(self):
         """
@@ -62,19 +86,46 @@ class ObserverThreadWrapper:
         if self._t:
             self._t = None
 
+    def get_leak_reason(self):
+        """
+        Check if observer will never need data again but is still subscribed.
+
+        :return: LEAK_DEAD_REFERENCE, LEAK_CANCELLED, LEAK_DONE or None if observer is alive and running.
+        """
+        observer = self._observer
+        observer_self = self._observer_self
+        if self._request_end.is_set() or observer is None:
+            return ObserverThreadWrapper.LEAK_DEAD_REFERENCE  # Loop stopped on ReferenceError.
+        try:
+            if observer_self is None:
+                # Proxy of function raises ReferenceError when function is gone. Runners attach connection observer
+                # fed by their wrapping functions.
+                observer_self = getattr(observer, "connection_observer", None)
+            if isinstance(observer_self, moler.connection_observer.ConnectionObserver):  # Dead proxy raises here.
+                if observer_self.cancelled():
+                    return ObserverThreadWrapper.LEAK_CANCELLED
+                if observer_self.done():
+                    return ObserverThreadWrapper.LEAK_DONE
+        except ReferenceError:
+            return ObserverThreadWrapper.LEAK_DEAD_REFERENCE
+        return None
+
     def _process_data_from_queue(self) -> None:
         """Process data from queue."""
         try:
             data, timestamp = self._queue.get(True, self._timeout_for_get_from_queue)
+            if self._metrics is not None:
+                self._metrics.data_dispatched(recv_time=timestamp)
             try:
                 self.logger.log(level=TRACE, msg=f'notifying {self._observer}({repr(data)})')
             except ReferenceError:
                 self._request_end.set()  # self._observer is no more valid.
             try:
-                if self._observer_self:
-                    self._observer(self._observer_self, data, timestamp)
+                accounting = self._get_cpu_accounting()
+                if accounting is None:
+                    self._notify_observer(data=data, timestamp=timestamp)
                 else:
-                    self._observer(data, timestamp)
+                    self._notify_observer_with_accounting(accounting=accounting, data=data, timestamp=timestamp)
             except ReferenceError:
                 self._request_end.set()  # self._observer is no more valid.
             except Exception as ex:
@@ -82,6 +133,49 @@ class ObserverThreadWrapper:
         except queue.Empty:
             pass  # No incoming data within self._timeout_for_get_from_queue
 
+    def _notify_observer(self, data, timestamp) -> None:
+        """
+        Pass data to observer.
+
+        :param data: data to pass.
+        :param timestamp: time when data was read from connection.
+        :return: None
+        """
+        if self._observer_self:
+            self._observer(self._observer_self, data, timestamp)
+        else:
+            self._observer(data, timestamp)
+
+    def _notify_observer_with_accounting(self, accounting, data, timestamp) -> None:
+        """
+        Pass data to observer and record thread CPU time and wall time of the call.
+
+        :param accounting: ObserverCpuAccounting to record times.
+        :param data: data to pass.
+        :param timestamp: time when data was read from connection.
+        :return: None
+        """
+        if self._observer_name is None:
+            self._observer_name = get_observer_name(observer=self._observer, observer_self=self._observer_self)
+        start_cpu_time = time.thread_time()
+        start_wall_time = time.perf_counter()
+        try:
+            self._notify_observer(data=data, timestamp=timestamp)
+        finally:
+            accounting.record(observer_name=self._observer_name, cpu_time=time.thread_time() - start_cpu_time,
+                              wall_time=time.perf_counter() - start_wall_time, logger=self.logger)
+
+    def _get_cpu_accounting(self):
+        """
+        Get accounting of CPU time: of connection if enabled, global otherwise.
+
+        :return: ObserverCpuAccounting or None if accounting is disabled.
+        """
+        accounting = self._metrics.cpu_accounting if self._metrics is not None else None
+        if accounting is None:
+            accounting = ObserverCpuAccounting.global_accounting
+        return accounting
+
     @tracked_thread.log_exit_exception
     def _loop_for_observer(self):
         """
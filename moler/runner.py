@@ -27,7 +27,9 @@ from moler.exceptions import ConnectionObserverTimeout
 from moler.exceptions import MolerException
 from moler.exceptions import CommandFailure
 from moler.util.loghelper import log_into_logger
+from moler.util.observers_leak_detector import ObserversLeakDetector
 from moler.util import tracked_thread
+from moler.util.trace_recorder import TraceRecorder
 
 
 @add_metaclass(ABCMeta)
@@ -98,6 +100,21 @@ class ConnectionObserverRunner:
         :return: True if connection_observer is currently running in this runner, False otherwise.
         """
 
+    def wait_for_running_state(self, connection_observer, running=True, timeout=10.0) -> bool:
+        """
+        Wait till given connection_observer is (or is not) running in this runner.
+        :param connection_observer: The one we want to check.
+        :param running: True to wait till connection_observer is running, False to wait till it is not running.
+        :param timeout: Max time (in float seconds) to wait.
+        :return: True if connection_observer reached expected state, False if timeout occurred.
+        """
+        start_time = time.monotonic()
+        while self.is_connection_observer_running(connection_observer) is not running:
+            if time.monotonic() - start_time > timeout:
+                return False
+            time.sleep(0.005)
+        return True
+
     def __enter__(self):
         return self
 
@@ -120,6 +137,10 @@ def time_out_observer(connection_observer, timeout, passed_time, runner_logger,
             # TODO: secure_data_received() may change status of connection_observer
             # TODO: and if secure_data_received() runs inside threaded connection - we have race
             connection_observer.set_exception(exception)
+            recorder = TraceRecorder.active
+            if recorder is not None:
+                recorder.instant(name=f"timeout {connection_observer.__class__.__name__}", category="observer",
+                                 args={"observer": str(connection_observer), "passed_time": passed_time})
 
             connection_observer.on_timeout()
 
@@ -213,6 +234,9 @@ class ThreadPoolExecutorRunner(ConnectionObserverRunner):
         self._in_shutdown = False
         self._i_own_executor = False
         self._was_timeout_called = False
+        self._running_observers = set()  # Connection observers fed by threads of executor.
+        # Notified when connection observers start or finish being fed.
+        self._running_observers_changed = threading.Condition()
         self.executor = executor
         self.logger = logging.getLogger('moler.runner.thread-pool')
         self.logger.debug("created")
@@ -275,6 +299,12 @@ class ThreadPoolExecutorRunner(ConnectionObserverRunner):
         remain_time, msg = his_remaining_time("remaining", timeout=observer_timeout,
                                               from_start_time=connection_observer.life_status.start_time)
         self.logger.debug(f"go background: {connection_observer!r} - {msg}")
+        recorder = TraceRecorder.active
+        if recorder is not None:
+            recorder.async_begin(name=connection_observer.__class__.__name__, category="observer",
+                                 async_id=id(connection_observer),
+                                 args={"observer": str(connection_observer),
+                                       "connection": connection_observer.connection.name})
         # TODO: check dependency - connection_observer.connection
 
         # Our submit consists of two steps:
@@ -514,6 +544,9 @@ class ThreadPoolExecutorRunner(ConnectionObserverRunner):
                     else:
                         self.logger.debug(f"{connection_observer} returned: {connection_observer._result}")  # pylint: disable=protected-access
 
+        secure_data_received.observed_class = connection_observer.__class__  # For ObserverCpuAccounting.
+        secure_data_received.connection_observer = connection_observer  # For ObserversLeakDetector.
+
         moler_conn = connection_observer.connection
         self.logger.debug(f"subscribing for data {connection_observer}")
         self.logger.debug(f">>> Entering {observer_lock}. conn-obs '{connection_observer}' runner '{self}' moler-conn '{moler_conn}'")
@@ -547,12 +580,32 @@ class ThreadPoolExecutorRunner(ConnectionObserverRunner):
                 connection_observer._log(logging.INFO,  # pylint: disable=protected-access
                                          f"{connection_observer.get_short_desc()} finished, {msg}")
                 feed_done.set()
+                recorder = TraceRecorder.active
+                if recorder is not None:
+                    recorder.async_end(name=connection_observer.__class__.__name__, category="observer",
+                                       async_id=id(connection_observer))
         self.logger.debug(f">>> Exited   {observer_lock}. conn-obs '{connection_observer}' runner '{self}'")
 
     # pylint: disable-next=unused-argument
     def _feed_finish_callback(self, future, connection_observer, subscribed_data_receiver, feed_done, observer_lock):
         """Callback attached to concurrent.futures.Future of submitted feed()"""
         self._stop_feeding(connection_observer, subscribed_data_receiver, feed_done, observer_lock)
+        self._set_running_state(connection_observer=connection_observer, running=False)
+
+    def _set_running_state(self, connection_observer, running):
+        """
+        Mark connection_observer as (not) running in this runner and wake up threads waiting for it.
+
+        :param connection_observer: The one which started or finished being fed.
+        :param running: True if feeding started, False if finished.
+        :return: None
+        """
+        with self._running_observers_changed:
+            if running:
+                self._running_observers.add(connection_observer)
+            else:
+                self._running_observers.discard(connection_observer)
+            self._running_observers_changed.notify_all()
 
     @tracked_thread.log_exit_exception
     # pylint: disable=arguments-differ
@@ -563,6 +616,8 @@ class ThreadPoolExecutorRunner(ConnectionObserverRunner):
         Should be called from background-processing of connection observer.
         """
         logging.getLogger("moler_threads").debug(f"ENTER {connection_observer}")
+        tracked_thread.register_thread(role=tracked_thread.ROLE_RUNNER_FEEDER)  # Thread of pool may be reused.
+        self._set_running_state(connection_observer=connection_observer, running=True)
 
         # pylint: disable-next=unused-variable
         remain_time, msg = his_remaining_time("remaining", timeout=connection_observer.timeout,
@@ -574,7 +629,12 @@ class ThreadPoolExecutorRunner(ConnectionObserverRunner):
 
         time.sleep(self._tick)  # give control back before we start processing
 
+        feed_loop_start_time = time.monotonic()
         self._feed_loop(connection_observer, stop_feeding, observer_lock)
+        recorder = TraceRecorder.active
+        if recorder is not None:
+            recorder.complete(name=f"feed {connection_observer.__class__.__name__}", category="observer",
+                              start_time=feed_loop_start_time, args={"observer": str(connection_observer)})
 
         remain_time, msg = his_remaining_time("remaining", timeout=connection_observer.timeout,
                                               from_start_time=connection_observer.life_status.start_time)
@@ -589,6 +649,7 @@ class ThreadPoolExecutorRunner(ConnectionObserverRunner):
         while True:
             if next(heartbeat):
                 logging.getLogger("moler_threads").debug(f"ALIVE {connection_observer}")
+            ObserversLeakDetector.audit_if_due()
             if stop_feeding.is_set():
                 # TODO: should it be renamed to 'cancelled' to be in sync with initial action?
                 self.logger.debug(f"stopped {connection_observer}")
@@ -654,10 +715,23 @@ class ThreadPoolExecutorRunner(ConnectionObserverRunner):
         :param connection_observer: The one we want to check.
         :return: True if connection_observer is currently running in this runner, False otherwise.
         """
-        future = connection_observer._future  # pylint: disable=protected-access
-        if future and future.running():
-            return True
-        return False
+        with self._running_observers_changed:
+            return connection_observer in self._running_observers
+
+    def wait_for_running_state(self, connection_observer, running=True, timeout=10.0) -> bool:
+        """
+        Wait till given connection_observer is (or is not) running in this runner. No polling, runner notifies
+        when feeding of connection observers starts or finishes.
+        :param connection_observer: The one we want to check.
+        :param running: True to wait till connection_observer is running, False to wait till it is not running.
+        :param timeout: Max time (in float seconds) to wait.
+        :return: True if connection_observer reached expected state, False if timeout occurred.
+        """
+        with self._running_observers_changed:
+            return self._running_observers_changed.wait_for(
+                lambda: (connection_observer in self._running_observers) is running,
+                timeout=timeout
+            )
 
 
 # utilities to be used by runners
@@ -16,7 +16,10 @@ import time
 from moler.exceptions import CommandTimeout, ConnectionObserverTimeout
 from moler.helpers import copy_list
 from moler.runner import ConnectionObserverRunner
+from moler.util import tracked_thread
 from moler.util.loghelper import log_into_logger
+from moler.util.observers_leak_detector import ObserversLeakDetector
+from moler.util.trace_recorder import TraceRecorder
 
 
 class RunnerSingleThread(ConnectionObserverRunner):
@@ -44,7 +47,10 @@ class RunnerSingleThread(ConnectionObserverRunner):
         )
         RunnerSingleThread._th_nr += 1
         self._connection_observer_lock = threading.Lock()
+        # Notified when connection observers are added to or removed from the runner.
+        self._connection_observers_changed = threading.Condition(self._connection_observer_lock)
         self._loop_thread.daemon = True
+        tracked_thread.register_thread(role=tracked_thread.ROLE_RUNNER_FEEDER, thread=self._loop_thread)
         self._loop_thread.start()
 
     def is_in_shutdown(self):
@@ -141,6 +147,8 @@ class RunnerSingleThread(ConnectionObserverRunner):
         observers = self._connections_observers
         self._connections_observers = []
         self._stop_loop_runner.set()
+        with self._connection_observers_changed:
+            self._connection_observers_changed.notify_all()
         for connection_observer in observers:
             connection_observer.cancel()
             moler_connection = connection_observer.connection
@@ -168,6 +176,12 @@ class RunnerSingleThread(ConnectionObserverRunner):
                     connection_observer=connection_observer
                 )
                 self._connections_observers.append(connection_observer)
+                recorder = TraceRecorder.active
+                if recorder is not None:
+                    recorder.async_begin(name=connection_observer.__class__.__name__, category="observer",
+                                         async_id=id(connection_observer),
+                                         args={"observer": str(connection_observer),
+                                               "connection": moler_connection.name})
                 _, msg = RunnerSingleThread._its_remaining_time(
                     prefix="remaining",
                     timeout=connection_observer.timeout,
@@ -179,6 +193,7 @@ class RunnerSingleThread(ConnectionObserverRunner):
                 )
                 self._start_command(connection_observer=connection_observer)
                 connection_observer.life_status.last_feed_time = time.monotonic()
+                self._connection_observers_changed.notify_all()
 
     @classmethod
     def _its_remaining_time(cls, prefix, timeout, from_start_time):
@@ -245,6 +260,7 @@ class RunnerSingleThread(ConnectionObserverRunner):
             self._check_last_feed_connection_observers()
             self._check_timeout_connection_observers()
             self._remove_unnecessary_connection_observers()
+            ObserversLeakDetector.audit_if_due()
             time.sleep(self._tick)
 
     def _check_last_feed_connection_observers(self):
@@ -338,6 +354,10 @@ class RunnerSingleThread(ConnectionObserverRunner):
                         passed_time=passed_time,
                     )
                 connection_observer.set_exception(exception)
+                recorder = TraceRecorder.active
+                if recorder is not None:
+                    recorder.instant(name=f"timeout {connection_observer.__class__.__name__}", category="observer",
+                                     args={"observer": str(connection_observer), "passed_time": passed_time})
                 connection_observer.on_timeout()
 
                 observer_info = f"{connection_observer.__class__.__module__}.{connection_observer}"
@@ -378,11 +398,17 @@ class RunnerSingleThread(ConnectionObserverRunner):
                         self._connections_observers.remove(connection_observer)
                     except ValueError:
                         pass
+                    else:
+                        recorder = TraceRecorder.active
+                        if recorder is not None:
+                            recorder.async_end(name=connection_observer.__class__.__name__, category="observer",
+                                               async_id=id(connection_observer))
                     moler_connection = connection_observer.connection
                     moler_connection.unsubscribe_connection_observer(
                         connection_observer=connection_observer
                     )
-            self._to_remove_connection_observers = []  # clear() is not available under old Pythons.
+                self._to_remove_connection_observers = []  # clear() is not available under old Pythons.
+                self._connection_observers_changed.notify_all()
 
     def _start_command(self, connection_observer):
         """
@@ -400,5 +426,28 @@ class RunnerSingleThread(ConnectionObserverRunner):
         :return: True if connection_observer is currently running in this runner, False otherwise.
         """
         with self._connection_observer_lock:
-            return connection_observer in self._connections_observers or \
-                connection_observer in self._to_remove_connection_observers
+            return self._is_connection_observer_running(connection_observer=connection_observer)
+
+    def wait_for_running_state(self, connection_observer, running=True, timeout=10.0) -> bool:
+        """
+        Wait till given connection_observer is (or is not) running in this runner. No polling, runner notifies
+        when connection observers are added or removed.
+        :param connection_observer: The one we want to check.
+        :param running: True to wait till connection_observer is running, False to wait till it is not running.
+        :param timeout: Max time (in float seconds) to wait.
+        :return: True if connection_observer reached expected state, False if timeout occurred.
+        """
+        with self._connection_observers_changed:
+            return self._connection_observers_changed.wait_for(
+                lambda: self._is_connection_observer_running(connection_observer=connection_observer) is running,
+                timeout=timeout
+            )
+
+    def _is_connection_observer_running(self, connection_observer) -> bool:
+        """
+        Check if given connection_observer is in this runner. Call under self._connection_observer_lock.
+        :param connection_observer: The one we want to check.
+        :return: True if connection_observer is currently running in this runner, False otherwise.
+        """
+        return connection_observer in self._connections_observers or \
+            connection_observer in self._to_remove_connection_observers
@@ -30,6 +30,7 @@ from moler.abstract_moler_connection import (
 from moler.config.loggers import RAW_DATA, TRACE
 from moler.helpers import instance_id
 from moler.observer_thread_wrapper import ObserverThreadWrapper
+from moler.util.observers_leak_detector import ObserversLeakDetector
 
 
 class ThreadedMolerConnection(AbstractMolerConnection):
@@ -75,6 +76,7 @@ class ThreadedMolerConnection(AbstractMolerConnection):
         self._connection_closed_handlers = {}
         self._observer_wrappers = {}
         self._observers_lock = Lock()
+        ObserversLeakDetector.register_connection(self)
 
     def data_received(self, data, recv_time):
         """
@@ -91,6 +93,7 @@ class ThreadedMolerConnection(AbstractMolerConnection):
         self._log_data(msg=data, level=RAW_DATA, extra=extra)
 
         decoded_data = self.decode(data)
+        self.metrics.data_received(data, decoded_data)
         self._log_data(msg=decoded_data, level=logging.INFO, extra=extra)
 
         self.notify_observers(decoded_data, recv_time)
@@ -119,6 +122,7 @@ class ThreadedMolerConnection(AbstractMolerConnection):
                     observer_reference=observer_reference,
                     self_for_observer=self_for_observer,
                 )
+                self.metrics.observer_subscribed(self._observer_wrappers[observer_key])
                 self._connection_closed_handlers[
                     observer_key
                 ] = connection_closed_handler
@@ -131,6 +135,7 @@ class ThreadedMolerConnection(AbstractMolerConnection):
             observer=observer_reference,
             observer_self=self_for_observer,
             logger=self.logger,
+            metrics=self.metrics,
         )
         return otw
 
@@ -151,6 +156,7 @@ class ThreadedMolerConnection(AbstractMolerConnection):
             self._log(level=TRACE, msg=f"unsubscribe({observer})")
             if observer_key in self._observer_wrappers and observer_key in self._connection_closed_handlers:
                 self._observer_wrappers[observer_key].request_stop()
+                self.metrics.observer_unsubscribed(self._observer_wrappers[observer_key])
                 del self._connection_closed_handlers[observer_key]
                 del self._observer_wrappers[observer_key]
             elif observer_key not in self._observer_wrappers and observer_key not in self._connection_closed_handlers:
@@ -165,6 +171,36 @@ class ThreadedMolerConnection(AbstractMolerConnection):
             f">>> Exited   {self._observers_lock}. conn-obs '{observer}' moler-conn '{self}'"
         )
 
+    def remove_leaked_observers(self):
+        """
+        Unsubscribe observers which are done, cancelled or whose references are dead and stop their threads.
+
+        :return: Dict {name of wrapper of removed observer: reason}.
+        """
+        removed = {}
+        with self._observers_lock:
+            for observer_key, wrapper in list(self._observer_wrappers.items()):
+                reason = wrapper.get_leak_reason()
+                if reason is None:
+                    continue
+                wrapper.request_stop()
+                self.metrics.observer_unsubscribed(wrapper)
+                del self._observer_wrappers[observer_key]
+                self._connection_closed_handlers.pop(observer_key, None)
+                removed[wrapper.name] = reason
+        for name, reason in removed.items():
+            self._log(level=logging.WARNING, msg=f"Unsubscribed leaked observer ({reason}): {name}")
+        return removed
+
+    def get_subscribed_observers_count(self):
+        """
+        Get number of subscribed observers.
+
+        :return: Number of observers.
+        """
+        with self._observers_lock:
+            return len(self._observer_wrappers)
+
     def shutdown(self):
         """
         Closes connection with notifying all observers about closing.
@@ -175,6 +211,7 @@ class ThreadedMolerConnection(AbstractMolerConnection):
                 handler()
             for handler in list(self._observer_wrappers.values()):
                 handler.request_stop()
+                self.metrics.observer_unsubscribed(handler)
             self._observer_wrappers = {}
             self._connection_closed_handlers = {}
         super(ThreadedMolerConnection, self).shutdown()
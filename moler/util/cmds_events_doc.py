@@ -11,6 +11,10 @@ __email__ = 'grzegorz.latuszek@nokia.com', 'michal.ernst@nokia.com', 'michal.pli
                                                                      ' marcin.usielski@nokia.com'
 
 import collections
+import concurrent.futures
+import itertools
+import multiprocessing
+import os
 import time
 from argparse import ArgumentParser
 from datetime import datetime
@@ -18,7 +22,7 @@ from importlib import import_module
 from os import walk, sep
 from os.path import abspath, join, relpath, exists, split
 from pprint import pformat
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from moler.command import Command
 from moler.event import Event
@@ -88,20 +92,30 @@ def _walk_moler_python_files(path, *args):
 
 def _walk_moler_commands(path, base_class):
     for fname in _walk_moler_python_files(path=path):
-        pkg_name = fname.replace(".py", "")
-        parts = pkg_name.split(sep)
-        pkg_name = ".".join(parts)
-        moler_module = import_module(pkg_name)
-        for _, cls in moler_module.__dict__.items():
-            if not isinstance(cls, type):
-                continue
-            if not issubclass(cls, base_class):
-                continue
-            module_of_class = cls.__dict__['__module__']
-            # take only Commands
-            # take only the ones defined in given file (not imported ones)
-            if (cls != base_class) and (module_of_class == pkg_name):
-                yield moler_module, cls
+        yield from _walk_moler_commands_of_module(fname=fname, base_class=base_class)
+
+
+def _walk_moler_commands_of_module(fname, base_class):
+    """
+    Import python module and yield classes defined in it.
+
+    :param fname: path to python module relative to repository
+    :param base_class: base class of yielded classes
+    """
+    pkg_name = fname.replace(".py", "")
+    parts = pkg_name.split(sep)
+    pkg_name = ".".join(parts)
+    moler_module = import_module(pkg_name)
+    for _, cls in moler_module.__dict__.items():
+        if not isinstance(cls, type):
+            continue
+        if not issubclass(cls, base_class):
+            continue
+        module_of_class = cls.__dict__['__module__']
+        # take only Commands
+        # take only the ones defined in given file (not imported ones)
+        if (cls != base_class) and (module_of_class == pkg_name):
+            yield moler_module, cls
 
 
 def _walk_moler_nonabstract_commands(path, base_class):
@@ -112,7 +126,11 @@ def _walk_moler_nonabstract_commands(path, base_class):
     :param path: path to python module
     :type path: str
     """
-    for moler_module, moler_class in _walk_moler_commands(path, base_class):
+    yield from _skip_abstract_commands(_walk_moler_commands(path, base_class))
+
+
+def _skip_abstract_commands(modules_and_classes):
+    for moler_module, moler_class in modules_and_classes:
         try:
             _ = moler_class()
         except TypeError as err:
@@ -315,15 +333,19 @@ def _report_documentation_check_result(observer_type, path2cmds, number_of_comma
     return True
 
 
-def check_if_documentation_exists(path2cmds: str) -> bool:
+def check_if_documentation_exists(path2cmds: str, processes: Optional[int] = 1) -> bool:
     """
     Check if documentation exists and has proper structure.
 
     :param path2cmds: relative path to comands directory
     :type path2cmds: str
+    :param processes: number of worker processes to check modules in. 1 to check in current process,
+     None or 0 to use all cores.
     :return: True if all checks passed
     :rtype: bool
     """
+    if processes != 1:
+        return _check_if_documentation_exists_in_processes(path2cmds=path2cmds, processes=processes)
     observer_type, base_class = check_cmd_or_event(path2cmds)
     wrong_commands: Dict[str, int] = {}
     errors_found: List[str] = []
@@ -342,9 +364,65 @@ def check_if_documentation_exists(path2cmds: str) -> bool:
                                               wrong_commands, errors_found)
 
 
+def _check_if_documentation_exists_in_processes(path2cmds: str, processes: Optional[int]) -> bool:
+    """
+    Check documentation of modules sharded across worker processes. Results are reported in the same order as
+    in one process.
+
+    :param path2cmds: relative path to comands directory
+    :param processes: number of worker processes, None or 0 to use all cores
+    :return: True if all checks passed
+    """
+    observer_type, _ = check_cmd_or_event(path2cmds)
+    module_files = list(_walk_moler_python_files(path=path2cmds))
+    max_workers = min(processes or os.cpu_count() or 1, max(len(module_files), 1))
+    chunksize = max(1, len(module_files) // (max_workers * 4))  # small chunks to balance slow modules
+    print()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers,
+                                                mp_context=multiprocessing.get_context("spawn")) as executor:
+        modules_results = list(executor.map(_check_documentation_of_module, module_files,
+                                            itertools.repeat(path2cmds), chunksize=chunksize))
+
+    wrong_commands: Dict[str, int] = {}
+    errors_found: List[str] = []
+    number_of_command_found = 0
+    for module_results in modules_results:
+        for class_name, class_str, duration, class_errors in module_results:
+            number_of_command_found += 1
+            print(f"processing: '{class_str}'... - {duration:.3f} s.")
+            if class_errors:
+                wrong_commands[class_name] = 1
+                errors_found.extend(class_errors)
+    return _report_documentation_check_result(observer_type, path2cmds, number_of_command_found,
+                                              wrong_commands, errors_found)
+
+
+def _check_documentation_of_module(fname: str, path2cmds: str) -> List[tuple]:
+    """
+    Check documentation of all commands or events of one module. Run in worker process.
+
+    :param fname: path to python module relative to repository
+    :param path2cmds: relative path to comands directory
+    :return: list of tuples (class name, class as str, duration of check, list of errors), one per class
+    """
+    observer_type, base_class = check_cmd_or_event(path2cmds)
+    results = []
+    modules_and_classes = _walk_moler_commands_of_module(fname=fname, base_class=base_class)
+    for moler_module, moler_class in _skip_abstract_commands(modules_and_classes):
+        wrong_commands: Dict[str, int] = {}
+        errors_found: List[str] = []
+        start_time = time.monotonic()
+        _process_documentation_for_observer(moler_module, moler_class, observer_type,
+                                            base_class, wrong_commands, errors_found)
+        results.append((moler_class.__name__, str(moler_class), time.monotonic() - start_time, errors_found))
+    return results
+
+
 if __name__ == '__main__':
     parser = ArgumentParser(description="Moler's Command(s) autotest")
     parser.add_argument('-c', '--cmd_filename', required=True, help='python module implementing given command')
+    parser.add_argument('-p', '--processes', type=int, default=1,
+                        help='number of worker processes, 0 to use all cores')
     options = parser.parse_args()
 
     if not exists(options.cmd_filename):
@@ -352,4 +430,4 @@ if __name__ == '__main__':
         parser.print_help()
         exit()
     else:
-        check_if_documentation_exists(path2cmds=options.cmd_filename)
+        check_if_documentation_exists(path2cmds=options.cmd_filename, processes=options.processes)
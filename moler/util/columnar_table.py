@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+Table of parsed rows stored by columns.
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+import re
+from array import array
+from typing import Dict, List, Sequence, Union
+
+from moler.util.converterhelper import ConverterHelper
+
+
+class ColumnarTable:
+    """
+    Table stored as columns instead of list of dicts. Cells are collected as strings and converted when the table is
+    read: column with integers only is stored as array of int64, column with floats only as array of doubles, other
+    columns as lists with numbers converted cell by cell. Rows are available as dicts (row view), so the table may
+    be used in place of list of dicts.
+    """
+
+    missing = object()  # Cell not present in row. Column is not present in dict of the row.
+
+    # 123
+    _re_integers = re.compile(r"[+\-]?\d+(?:\n[+\-]?\d+)*")
+    # 2.5
+    _re_floats = re.compile(r"(?:[+\-]?(?:(?:\d+\.\d*|\.\d+)(?:[eE][+\-]?\d+)?|\d+[eE][+\-]?\d+))"
+                            r"(?:\n[+\-]?(?:(?:\d+\.\d*|\.\d+)(?:[eE][+\-]?\d+)?|\d+[eE][+\-]?\d+))*")
+
+    def __init__(self, columns: Sequence[str], convert_numbers: bool = True):
+        """
+        Create empty table.
+
+        :param columns: Names of columns.
+        :param convert_numbers: True to convert numbers in cells, False to keep cells as they are.
+        """
+        self._columns = list(columns)
+        self._convert_numbers = convert_numbers
+        self._cells: Dict[str, Union[list, array]] = {column: [] for column in self._columns}
+        self._rows_count = 0
+        self._converted = True
+        self._converter_helper = ConverterHelper.get_converter_helper()
+
+    @property
+    def columns(self) -> List[str]:
+        """
+        Names of columns.
+
+        :return: List of names.
+        """
+        return list(self._columns)
+
+    def append(self, values: Sequence) -> None:
+        """
+        Add row. Values are assigned to columns in order. Values over number of columns are ignored, missing values
+        are marked as not present in the row.
+
+        :param values: Values of cells.
+        :return: None
+        """
+        if self._converted and self._rows_count:
+            self._make_columns_appendable()
+        self._converted = False
+        values_count = len(values)
+        for nr, column in enumerate(self._columns):
+            self._cells[column].append(values[nr] if nr < values_count else ColumnarTable.missing)
+        self._rows_count += 1
+
+    def column(self, name: str) -> Union[list, array]:
+        """
+        Get all cells of column.
+
+        :param name: Name of column.
+        :return: array.array for numeric columns, list otherwise.
+        """
+        self._convert()
+        return self._cells[name]
+
+    def row(self, index: int) -> Dict[str, object]:
+        """
+        Get row as dict.
+
+        :param index: Index of row.
+        :return: Dict with cells of row.
+        """
+        if index < 0:
+            index += self._rows_count
+        if index < 0 or index >= self._rows_count:
+            raise IndexError(f"Index {index} out of range for {self._rows_count} rows.")
+        self._convert()
+        row = {}
+        for column in self._columns:
+            value = self._cells[column][index]
+            if value is not ColumnarTable.missing:
+                row[column] = value
+        return row
+
+    def __len__(self) -> int:
+        return self._rows_count
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict[str, object], List[Dict[str, object]]]:
+        if isinstance(index, slice):
+            return [self.row(nr) for nr in range(*index.indices(self._rows_count))]
+        return self.row(index)
+
+    def __iter__(self):
+        for index in range(self._rows_count):
+            yield self.row(index)
+
+    def __eq__(self, other) -> bool:
+        try:
+            if len(self) != len(other):
+                return False
+        except TypeError:
+            return False
+        return all(row == other_row for row, other_row in zip(self, other))
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+    def __repr__(self) -> str:
+        return f"ColumnarTable(columns={self._columns}, rows={self._rows_count})"
+
+    def _convert(self) -> None:
+        """
+        Convert all columns to final types.
+
+        :return: None
+        """
+        if self._converted:
+            return
+        for column in self._columns:
+            self._cells[column] = self._convert_column(cells=self._cells[column])
+        self._converted = True
+
+    def _convert_column(self, cells: list) -> Union[list, array]:
+        """
+        Convert one column. Type is checked for all cells of column by one regex match.
+
+        :param cells: Cells of column.
+        :return: array.array for numeric columns, list otherwise.
+        """
+        if not self._convert_numbers:
+            return cells
+        if all(isinstance(cell, str) for cell in cells):
+            joined = "\n".join(cells)
+            try:
+                if ColumnarTable._re_integers.fullmatch(joined):
+                    return array('q', map(int, cells))
+                if ColumnarTable._re_floats.fullmatch(joined):
+                    return array('d', map(float, cells))
+            except (OverflowError, ValueError):
+                pass
+        return [self._to_number(cell) for cell in cells]
+
+    def _to_number(self, cell: object) -> object:
+        """
+        Convert cell to number if possible.
+
+        :param cell: Value of cell.
+        :return: int or float if cell is string with number, cell otherwise.
+        """
+        if isinstance(cell, str):
+            try:
+                return self._converter_helper.to_number(value=cell, raise_exception=True)
+            except ValueError:
+                pass
+        return cell
+
+    def _make_columns_appendable(self) -> None:
+        """
+        Change converted columns back to lists to add next rows.
+
+        :return: None
+        """
+        for column in self._columns:
+            if isinstance(self._cells[column], array):
+                self._cells[column] = list(self._cells[column])
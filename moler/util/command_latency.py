@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Statistics of phases of commands execution.
+
+Every textual command records when it was queued, submitted, sent, when its echo was detected, when the first
+line of output came and when it was done. Durations of phases are aggregated per device (connection) and command
+class.
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+import threading
+from typing import Dict, Optional
+
+from moler.util.connection_metrics import LatencyHistogram
+
+
+class CommandLatencyStatistics:
+    """
+    Percentiles of durations of phases of commands per device and command class.
+
+    Phases:
+    queue_wait - from start of command till CommandScheduler passed it to runner,
+    echo - from sending command string till echo of command detected,
+    first_output - from echo till the first line of command output,
+    prompt - from the first line of output till command is done,
+    total - from sending command string till command is done.
+    """
+
+    phases = ("queue_wait", "echo", "first_output", "prompt", "total")
+    enabled = True  # Set False to not collect statistics.
+
+    _histograms: Dict[tuple, Dict[str, LatencyHistogram]] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def record(cls, device: Optional[str], command_class: str, durations: Dict[str, float]) -> None:
+        """
+        Record durations of phases of one command.
+
+        :param device: Name of device (moler connection).
+        :param command_class: Full name of class of command.
+        :param durations: Dict with phase as key and duration in seconds as value. Not measured phases are omitted.
+        :return: None
+        """
+        if not cls.enabled or not durations:
+            return
+        key = (device, command_class)
+        with cls._lock:
+            histograms = cls._histograms.get(key)
+            if histograms is None:
+                histograms = {phase: LatencyHistogram() for phase in cls.phases}
+                cls._histograms[key] = histograms
+        for phase, duration in durations.items():
+            histograms[phase].record(duration)
+
+    @classmethod
+    def get_statistics(cls, device: Optional[str] = None, command_class: Optional[str] = None) -> dict:
+        """
+        Get statistics of phases.
+
+        :param device: Name of device to get statistics for or None for all devices.
+        :param command_class: Name of class (full or just name of class) or None for all classes.
+        :return: Dict {device: {command class: {phase: dict with count, min, max, mean and percentiles}}}.
+        """
+        with cls._lock:
+            items = list(cls._histograms.items())
+        statistics = {}
+        items.sort(key=lambda item: (str(item[0][0]), item[0][1]))
+        for (key_device, key_command_class), histograms in items:
+            if device is not None and key_device != device:
+                continue
+            if command_class is not None and command_class not in (key_command_class,
+                                                                   key_command_class.rsplit(".", 1)[-1]):
+                continue
+            phases = {phase: histogram.snapshot() for phase, histogram in histograms.items() if histogram.count}
+            statistics.setdefault(key_device, {})[key_command_class] = phases
+        return statistics
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Remove all collected statistics.
+
+        :return: None
+        """
+        with cls._lock:
+            cls._histograms = {}
+
+
+def calculate_phases_durations(times: Dict[str, Optional[float]]) -> Dict[str, float]:
+    """
+    Calculate durations of phases from moments of command lifecycle.
+
+    :param times: Dict with monotonic times of moments: enqueued, submitted, sent, echo, first_output, done.
+    :return: Dict with durations of phases which both ends were recorded.
+    """
+    durations = {}
+    for phase, start, end in (("queue_wait", "enqueued", "submitted"), ("echo", "sent", "echo"),
+                              ("first_output", "echo", "first_output"), ("prompt", "first_output", "done"),
+                              ("total", "sent", "done")):
+        if times.get(start) is not None and times.get(end) is not None:
+            durations[phase] = max(0.0, times[end] - times[start])
+    return durations
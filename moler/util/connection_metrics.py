@@ -0,0 +1,438 @@
+# -*- coding: utf-8 -*-
+"""
+Metrics of data flowing through Moler connections.
+
+Every moler connection counts bytes and chunks in both directions, lines received, depth of queues of observers
+and latency of dispatching data from the moment it was read from IO till observer gets it.
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+import datetime
+import json
+import logging
+import os
+import threading
+import weakref
+from typing import Dict, List, Optional
+
+from moler.exceptions import WrongUsage
+from moler.util import tracked_thread
+
+
+class LatencyHistogram:
+    """
+    Histogram of latencies with buckets of logarithmic width (like HdrHistogram). Values are stored in microseconds
+    with relative precision 2 ** -(sub_bucket_bits - 1), memory does not depend on number of recorded values.
+    """
+
+    def __init__(self, sub_bucket_bits: int = 5):
+        """
+        Create empty histogram.
+
+        :param sub_bucket_bits: Number of significant bits of value kept in bucket (5 means ~3% precision).
+        """
+        self._sub_bucket_bits = sub_bucket_bits
+        self._sub_bucket_count = 1 << sub_bucket_bits
+        self._half_sub_bucket_count = self._sub_bucket_count >> 1
+        self._counts: Dict[int, int] = {}
+        self._count = 0
+        self._sum_us = 0
+        self._min_us = None
+        self._max_us = None
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        """
+        Record one value.
+
+        :param seconds: Value in seconds. Negative values are recorded as 0.
+        :return: None
+        """
+        value_us = int(seconds * 1000000) if seconds > 0 else 0
+        index = self._bucket_index(value_us)
+        with self._lock:
+            self._counts[index] = self._counts.get(index, 0) + 1
+            self._count += 1
+            self._sum_us += value_us
+            if self._min_us is None or value_us < self._min_us:
+                self._min_us = value_us
+            if self._max_us is None or value_us > self._max_us:
+                self._max_us = value_us
+
+    @property
+    def count(self) -> int:
+        """
+        Number of recorded values.
+
+        :return: Number of values.
+        """
+        return self._count
+
+    def percentile(self, percent: float) -> float:
+        """
+        Get value below which given percent of recorded values are.
+
+        :param percent: Percent (0-100).
+        :return: Value in seconds, 0.0 if nothing recorded.
+        """
+        with self._lock:
+            return self._percentile_us(percent=percent, counts=sorted(self._counts.items())) / 1000000.
+
+    def snapshot(self) -> dict:
+        """
+        Get statistics of recorded values.
+
+        :return: Dict with count, sum, min, max, mean and percentiles in seconds.
+        """
+        with self._lock:
+            counts = sorted(self._counts.items())
+            count = self._count
+            sum_us = self._sum_us
+            min_us = self._min_us or 0
+            max_us = self._max_us or 0
+        return {
+            "count": count,
+            "sum": sum_us / 1000000.,
+            "min": min_us / 1000000.,
+            "max": max_us / 1000000.,
+            "mean": sum_us / count / 1000000. if count else 0.0,
+            "p50": self._percentile_us(percent=50, counts=counts, count=count, max_us=max_us) / 1000000.,
+            "p90": self._percentile_us(percent=90, counts=counts, count=count, max_us=max_us) / 1000000.,
+            "p99": self._percentile_us(percent=99, counts=counts, count=count, max_us=max_us) / 1000000.,
+            "p999": self._percentile_us(percent=99.9, counts=counts, count=count, max_us=max_us) / 1000000.,
+        }
+
+    def reset(self) -> None:
+        """
+        Remove all recorded values.
+
+        :return: None
+        """
+        with self._lock:
+            self._counts = {}
+            self._count = 0
+            self._sum_us = 0
+            self._min_us = None
+            self._max_us = None
+
+    def _bucket_index(self, value_us: int) -> int:
+        """
+        Get index of bucket for value.
+
+        :param value_us: Value in microseconds.
+        :return: Index of bucket.
+        """
+        if value_us < self._sub_bucket_count:
+            return value_us
+        shift = value_us.bit_length() - self._sub_bucket_bits
+        return self._sub_bucket_count + (shift - 1) * self._half_sub_bucket_count + (
+            (value_us >> shift) - self._half_sub_bucket_count)
+
+    def _bucket_highest_value(self, index: int) -> int:
+        """
+        Get the highest value stored in bucket.
+
+        :param index: Index of bucket.
+        :return: Value in microseconds.
+        """
+        if index < self._sub_bucket_count:
+            return index
+        shift, sub_index = divmod(index - self._sub_bucket_count, self._half_sub_bucket_count)
+        shift += 1
+        return ((sub_index + self._half_sub_bucket_count + 1) << shift) - 1
+
+    def _percentile_us(self, percent: float, counts: list, count: Optional[int] = None,
+                       max_us: Optional[int] = None) -> int:
+        """
+        Get percentile from buckets.
+
+        :param percent: Percent (0-100).
+        :param counts: Sorted list of pairs (index of bucket, count).
+        :param count: Number of values.
+        :param max_us: Max value.
+        :return: Value in microseconds.
+        """
+        count = self._count if count is None else count
+        max_us = (self._max_us or 0) if max_us is None else max_us
+        if count == 0:
+            return 0
+        expected = max(1, int(round(count * percent / 100.)))
+        collected = 0
+        for index, bucket_count in counts:
+            collected += bucket_count
+            if collected >= expected:
+                return min(self._bucket_highest_value(index), max_us)
+        return max_us
+
+
+class ConnectionMetrics:
+    """
+    Counters of one moler connection. Counters are updated without locks by IO and observers threads, so they
+    are cheap enough to be always enabled.
+    """
+
+    _all_metrics = weakref.WeakSet()  # Metrics of all alive connections, used by exporter.
+    _all_metrics_lock = threading.Lock()
+
+    def __init__(self, name: str):
+        """
+        Create metrics for connection.
+
+        :param name: Name of connection.
+        """
+        self.name = name
+        self.bytes_in = 0
+        self.chunks_in = 0
+        self.lines_in = 0
+        self.bytes_out = 0
+        self.chunks_out = 0
+        self.dispatch_latency = LatencyHistogram()
+        self.cpu_accounting = None  # ObserverCpuAccounting of observers of connection if enabled for connection.
+        self._observers = {}
+        self._queue_high_water_mark = 0  # of observers already unsubscribed
+        self._observers_lock = threading.Lock()
+        with ConnectionMetrics._all_metrics_lock:
+            ConnectionMetrics._all_metrics.add(self)
+
+    def data_received(self, data, decoded_data) -> None:
+        """
+        Count incoming data.
+
+        :param data: Data read from IO.
+        :param decoded_data: Data after decoding.
+        :return: None
+        """
+        self.chunks_in += 1
+        self.bytes_in += len(data)
+        if isinstance(decoded_data, str):
+            self.lines_in += decoded_data.count("\n")
+        elif isinstance(decoded_data, bytes):
+            self.lines_in += decoded_data.count(b"\n")
+
+    def data_sent(self, data) -> None:
+        """
+        Count outgoing data.
+
+        :param data: Data passed to IO.
+        :return: None
+        """
+        self.chunks_out += 1
+        self.bytes_out += len(data)
+
+    def data_dispatched(self, recv_time: datetime.datetime) -> None:
+        """
+        Record latency of dispatching data to observer.
+
+        :param recv_time: Time when data was read from IO.
+        :return: None
+        """
+        if isinstance(recv_time, datetime.datetime):
+            self.dispatch_latency.record((datetime.datetime.now() - recv_time).total_seconds())
+
+    def observer_subscribed(self, observer_wrapper) -> None:
+        """
+        Start reporting queue of observer.
+
+        :param observer_wrapper: Wrapper of observer with queue_depth and queue_high_water_mark.
+        :return: None
+        """
+        with self._observers_lock:
+            self._observers[id(observer_wrapper)] = observer_wrapper
+
+    def observer_unsubscribed(self, observer_wrapper) -> None:
+        """
+        Stop reporting queue of observer.
+
+        :param observer_wrapper: Wrapper of observer.
+        :return: None
+        """
+        with self._observers_lock:
+            if self._observers.pop(id(observer_wrapper), None) is not None:
+                self._queue_high_water_mark = max(self._queue_high_water_mark,
+                                                  observer_wrapper.queue_high_water_mark)
+
+    def snapshot(self) -> dict:
+        """
+        Get current values of all metrics.
+
+        :return: Dict with metrics.
+        """
+        with self._observers_lock:
+            observers = list(self._observers.values())
+            queue_high_water_mark = self._queue_high_water_mark
+        observers_metrics = []
+        for observer_wrapper in observers:
+            observers_metrics.append({
+                "observer": observer_wrapper.name,
+                "queue_depth": observer_wrapper.queue_depth,
+                "queue_high_water_mark": observer_wrapper.queue_high_water_mark,
+            })
+            queue_high_water_mark = max(queue_high_water_mark, observer_wrapper.queue_high_water_mark)
+        return {
+            "connection": self.name,
+            "bytes_in": self.bytes_in,
+            "chunks_in": self.chunks_in,
+            "lines_in": self.lines_in,
+            "bytes_out": self.bytes_out,
+            "chunks_out": self.chunks_out,
+            "queue_high_water_mark": queue_high_water_mark,
+            "observers": observers_metrics,
+            "dispatch_latency": self.dispatch_latency.snapshot(),
+        }
+
+    @classmethod
+    def snapshot_all(cls) -> List[dict]:
+        """
+        Get metrics of all alive connections.
+
+        :return: List of dicts with metrics, sorted by name of connection.
+        """
+        with cls._all_metrics_lock:
+            all_metrics = list(cls._all_metrics)
+        return sorted((metrics.snapshot() for metrics in all_metrics), key=lambda snapshot: str(snapshot["connection"]))
+
+
+def metrics_to_json(snapshots: List[dict]) -> str:
+    """
+    Format metrics as json.
+
+    :param snapshots: Snapshots of metrics of connections.
+    :return: String with json.
+    """
+    return json.dumps(snapshots, indent=2)
+
+
+def metrics_to_openmetrics(snapshots: List[dict]) -> str:
+    """
+    Format metrics in OpenMetrics text format.
+
+    :param snapshots: Snapshots of metrics of connections.
+    :return: String with metrics.
+    """
+    lines = []
+    for counter in ("bytes_in", "chunks_in", "lines_in", "bytes_out", "chunks_out"):
+        lines.append(f"# TYPE moler_connection_{counter} counter")
+        for snapshot in snapshots:
+            lines.append(f"moler_connection_{counter}_total{{connection=\"{_label(snapshot['connection'])}\"}} "
+                         f"{snapshot[counter]}")
+    lines.append("# TYPE moler_connection_queue_high_water_mark gauge")
+    for snapshot in snapshots:
+        lines.append(f"moler_connection_queue_high_water_mark{{connection=\"{_label(snapshot['connection'])}\"}} "
+                     f"{snapshot['queue_high_water_mark']}")
+    lines.append("# TYPE moler_observer_queue_depth gauge")
+    for snapshot in snapshots:
+        for observer in snapshot["observers"]:
+            lines.append(f"moler_observer_queue_depth{{connection=\"{_label(snapshot['connection'])}\","
+                         f"observer=\"{_label(observer['observer'])}\"}} {observer['queue_depth']}")
+    lines.append("# TYPE moler_connection_dispatch_latency_seconds summary")
+    lines.append("# UNIT moler_connection_dispatch_latency_seconds seconds")
+    for snapshot in snapshots:
+        connection = _label(snapshot['connection'])
+        latency = snapshot["dispatch_latency"]
+        for quantile, key in (("0.5", "p50"), ("0.9", "p90"), ("0.99", "p99"), ("0.999", "p999")):
+            lines.append(f"moler_connection_dispatch_latency_seconds{{connection=\"{connection}\","
+                         f"quantile=\"{quantile}\"}} {latency[key]}")
+        lines.append(f"moler_connection_dispatch_latency_seconds_count{{connection=\"{connection}\"}} "
+                     f"{latency['count']}")
+        lines.append(f"moler_connection_dispatch_latency_seconds_sum{{connection=\"{connection}\"}} {latency['sum']}")
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def _label(value) -> str:
+    """
+    Escape value of label for OpenMetrics.
+
+    :param value: Value of label.
+    :return: Escaped value.
+    """
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+class MetricsExporter:
+    """Writes metrics of all connections to file periodically."""
+
+    _formatters = {
+        "json": metrics_to_json,
+        "openmetrics": metrics_to_openmetrics,
+    }
+
+    def __init__(self, path: str, interval: float = 10.0, file_format: str = "json"):
+        """
+        Create exporter.
+
+        :param path: Path to file. File is replaced by every export.
+        :param interval: Time in seconds between exports.
+        :param file_format: "json" or "openmetrics".
+        """
+        if file_format not in MetricsExporter._formatters:
+            raise WrongUsage(f"Format '{file_format}' is not supported. Use one of {sorted(MetricsExporter._formatters)}.")
+        self.path = path
+        self.interval = interval
+        self.file_format = file_format
+        self._stop = threading.Event()
+        self._thread = None
+        self.logger = logging.getLogger("moler.metrics")
+
+    def export(self) -> None:
+        """
+        Write current metrics to file.
+
+        :return: None
+        """
+        content = MetricsExporter._formatters[self.file_format](ConnectionMetrics.snapshot_all())
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as metrics_file:
+            metrics_file.write(content)
+        os.replace(tmp_path, self.path)
+
+    def start(self) -> None:
+        """
+        Start periodic export in background thread.
+
+        :return: None
+        """
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._export_loop, name="MetricsExporter")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop periodic export. Metrics are exported last time.
+
+        :return: None
+        """
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop.set()
+        thread.join()
+        self._thread = None
+
+    @tracked_thread.log_exit_exception
+    def _export_loop(self) -> None:
+        """
+        Loop of background thread.
+
+        :return: None
+        """
+        while not self._stop.wait(self.interval):
+            self._export_safely()
+        self._export_safely()
+
+    def _export_safely(self) -> None:
+        """
+        Export and log error instead of raising it.
+
+        :return: None
+        """
+        try:
+            self.export()
+        except Exception as ex:  # pylint: disable=broad-except
+            self.logger.warning(f"Cannot export metrics to '{self.path}': {ex!r}")
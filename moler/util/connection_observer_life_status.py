@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
 __author__ = 'Marcin Usielski'
-__copyright__ = 'Copyright (C) 2020-2024 Nokia'
+__copyright__ = 'Copyright (C) 2020-2026 Nokia'
 __email__ = 'marcin.usielski@nokia.com'
 
 
@@ -33,6 +33,8 @@ class ConnectionObserverLifeStatus:
         self.timeout: Optional[float] = 20.0  # default
         self.is_done: bool = False  # Set True if ConnectionObserver object is done. False otherwise.
         self.is_cancelled: bool = False  # Set True if ConnectionObserver object is cancelled. False otherwise.
+        self.enqueued_time: Optional[float] = None  # time.monotonic() when passed to CommandScheduler.
+        self.submitted_time: Optional[float] = None  # time.monotonic() when CommandScheduler submitted it to runner.
 
     def __str__(self) -> str:
         """
@@ -4,10 +4,11 @@ Units converter
 """
 
 __author__ = "Marcin Usielski"
-__copyright__ = "Copyright (C) 2018-2024, Nokia"
+__copyright__ = "Copyright (C) 2018-2026, Nokia"
 __email__ = "marcin.usielski@nokia.com"
 
 import re
+import string
 import warnings
 from datetime import datetime
 
@@ -18,6 +19,38 @@ with warnings.catch_warnings():
 
 class ConverterHelper:
     _instance = None
+    # Unambiguous formats of dates learned by parse_date. Tried only when dateutil parsed date of new shape.
+    _date_formats = (
+        "%a %b %d %H:%M:%S %Y",  # Thu Nov 23 10:38:17 2017
+        "%a %b %d %H:%M:%S.%f %Y",
+        "%b %d %H:%M:%S %Y",  # Nov 23 10:38:17 2017
+        "%a, %d %b %Y %H:%M:%S",  # Thu, 23 Nov 2017 10:38:17
+        "%d %b %Y %H:%M:%S",  # 23 Nov 2017 10:38:17
+        "%Y-%m-%d %H:%M:%S",  # 2017-11-23 10:38:17
+        "%Y-%m-%d %H:%M:%S.%f",  # 2017-11-23 10:38:17.123456
+        "%Y-%m-%dT%H:%M:%S",  # 2017-11-23T10:38:17
+        "%Y-%m-%dT%H:%M:%S.%f",  # 2017-11-23T10:38:17.123456
+        "%Y-%m-%d %H:%M",  # 2017-11-23 10:38
+        "%Y-%m-%d",  # 2017-11-23
+    )
+    _learned_date_formats = {}  # Shape of date string -> format or None if only dateutil can parse it.
+    _date_format_regexes = {}  # Format -> compiled regex extracting fields of date.
+    _date_directives = {
+        "a": r"[A-Za-z]+",
+        "b": r"(?P<b>[A-Za-z]{3})",
+        "d": r"(?P<d>\d{1,2})",
+        "m": r"(?P<m>\d{1,2})",
+        "Y": r"(?P<Y>\d{4})",
+        "H": r"(?P<H>\d{1,2})",
+        "M": r"(?P<M>\d{1,2})",
+        "S": r"(?P<S>\d{1,2})",
+        "f": r"(?P<f>\d{1,6})",
+    }
+    _months = {"jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6, "jul": 7, "aug": 8, "sep": 9, "oct": 10,
+               "nov": 11, "dec": 12}
+    _max_learned_date_formats = 256
+    _date_shape_table = str.maketrans(string.digits + string.ascii_letters,
+                                      "0" * len(string.digits) + "a" * len(string.ascii_letters))
     # examples of matched strings: 1K 1 .5M  3.2G
     _re_to_bytes = re.compile(r"(?P<VALUE>\d+\.?\d*|\.\d+)\s*(?P<UNIT>\w?)")
 
@@ -335,12 +368,70 @@ class ConverterHelper:
     @classmethod
     def parse_date(cls, date: str, tzinfos=None) -> datetime:
         """
-        Parse date string to datetime object.
+        Parse date string to datetime object. Format of the first date of every shape (digits and letters replaced)
+        parsed by dateutil is learned, next dates of the same shape are parsed by datetime.strptime.
 
         :param date: date string
         :param tzinfos: dict with time zones
         :return: datetime object
         """
+        shape = date.translate(cls._date_shape_table)
+        date_format = cls._learned_date_formats.get(shape)
+        if date_format is not None:
+            parsed_date = cls._parse_date_with_format(date=date, date_format=date_format)
+            if parsed_date is not None:
+                return parsed_date
+            # the same shape but other format, dateutil knows better
         if tzinfos is None:
             tzinfos = cls._time_zones
-        return parser.parse(date, tzinfos=tzinfos)
+        parsed_date = parser.parse(date, tzinfos=tzinfos)
+        if shape not in cls._learned_date_formats:
+            if len(cls._learned_date_formats) >= cls._max_learned_date_formats:
+                cls._learned_date_formats.clear()
+            cls._learned_date_formats[shape] = cls._learn_date_format(date=date, parsed_date=parsed_date)
+        return parsed_date
+
+    @classmethod
+    def _learn_date_format(cls, date: str, parsed_date: datetime):
+        """
+        Find format which parses date to the same datetime as dateutil.
+
+        :param date: date string
+        :param parsed_date: datetime parsed by dateutil
+        :return: format for datetime.strptime or None if no known format fits.
+        """
+        if parsed_date.tzinfo is not None:
+            return None
+        for date_format in cls._date_formats:
+            if cls._parse_date_with_format(date=date, date_format=date_format) == parsed_date:
+                return date_format
+        return None
+
+    @classmethod
+    def _parse_date_with_format(cls, date: str, date_format: str):
+        """
+        Parse date with precompiled regex built from format.
+
+        :param date: date string
+        :param date_format: format with directives as for datetime.strptime (only from _date_directives)
+        :return: datetime object or None if date does not match format.
+        """
+        regex = cls._date_format_regexes.get(date_format)
+        if regex is None:
+            regex_str = re.sub(r"%(\w)|(\s+)|([^%\s]+)",
+                               lambda found: cls._date_directives[found.group(1)] if found.group(1) else
+                               r"\s+" if found.group(2) else re.escape(found.group(3)),
+                               date_format)
+            regex = re.compile(regex_str)
+            cls._date_format_regexes[date_format] = regex
+        found = regex.fullmatch(date.strip())
+        if found is None:
+            return None
+        fields = found.groupdict()
+        try:
+            month = cls._months[fields["b"].lower()] if "b" in fields else int(fields["m"])
+            microsecond = int(fields["f"].ljust(6, "0")) if "f" in fields else 0
+            return datetime(int(fields["Y"]), month, int(fields["d"]), int(fields.get("H") or 0),
+                            int(fields.get("M") or 0), int(fields.get("S") or 0), microsecond)
+        except (KeyError, ValueError):
+            return None
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+Accounting of CPU time spent by observers (commands, events and other subscribers) of moler connections.
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+import logging
+import threading
+from typing import Dict, Optional
+
+
+class ObserverCpuAccounting:
+    """
+    Totals of thread CPU time and wall time spent in observers, per class of observer. Single calls longer than
+    warning threshold are logged as warnings.
+
+    Accounting may be enabled for one connection (AbstractMolerConnection.enable_observers_cpu_accounting) or for all
+    connections (enable_globally or OBSERVERS_CPU_ACCOUNTING section of moler config).
+    """
+
+    global_accounting = None  # Instance used by all connections without own accounting.
+
+    def __init__(self, warning_threshold: Optional[float] = 0.1):
+        """
+        Create empty accounting.
+
+        :param warning_threshold: Wall time in seconds of single call of observer to log warning. None to not warn.
+        """
+        self.warning_threshold = warning_threshold
+        self._totals: Dict[str, list] = {}  # name of observer -> [calls, cpu time, wall time, max wall time, slow calls]
+        self._lock = threading.Lock()
+
+    @classmethod
+    def enable_globally(cls, warning_threshold: Optional[float] = 0.1) -> "ObserverCpuAccounting":
+        """
+        Enable accounting for all connections.
+
+        :param warning_threshold: Wall time in seconds of single call of observer to log warning. None to not warn.
+        :return: Global accounting.
+        """
+        cls.global_accounting = ObserverCpuAccounting(warning_threshold=warning_threshold)
+        return cls.global_accounting
+
+    @classmethod
+    def disable_globally(cls) -> None:
+        """
+        Disable accounting for connections without own accounting.
+
+        :return: None
+        """
+        cls.global_accounting = None
+
+    def record(self, observer_name: str, cpu_time: float, wall_time: float,
+               logger: Optional[logging.Logger] = None) -> None:
+        """
+        Record one call of observer.
+
+        :param observer_name: Name of class of observer.
+        :param cpu_time: CPU time of thread in seconds.
+        :param wall_time: Wall time in seconds.
+        :param logger: Logger to log warning about slow call.
+        :return: None
+        """
+        is_slow = self.warning_threshold is not None and wall_time > self.warning_threshold
+        with self._lock:
+            totals = self._totals.get(observer_name)
+            if totals is None:
+                totals = [0, 0.0, 0.0, 0.0, 0]
+                self._totals[observer_name] = totals
+            totals[0] += 1
+            totals[1] += cpu_time
+            totals[2] += wall_time
+            if wall_time > totals[3]:
+                totals[3] = wall_time
+            if is_slow:
+                totals[4] += 1
+        if is_slow and logger is not None:
+            logger.warning(f"Slow observer '{observer_name}': processing of data took {wall_time:.3f} s "
+                           f"(CPU {cpu_time:.3f} s), threshold is {self.warning_threshold} s.")
+
+    def snapshot(self) -> Dict[str, dict]:
+        """
+        Get totals per class of observer.
+
+        :return: Dict with name of class as key and dict with calls, cpu_time, wall_time, max_wall_time and
+         slow_calls as value. The most CPU consuming classes first.
+        """
+        with self._lock:
+            items = [(name, list(totals)) for name, totals in self._totals.items()]
+        items.sort(key=lambda item: item[1][1], reverse=True)
+        return {name: {"calls": totals[0], "cpu_time": totals[1], "wall_time": totals[2],
+                       "max_wall_time": totals[3], "slow_calls": totals[4]} for name, totals in items}
+
+    def reset(self) -> None:
+        """
+        Remove all recorded totals.
+
+        :return: None
+        """
+        with self._lock:
+            self._totals = {}
+
+
+def get_observer_name(observer, observer_self) -> str:
+    """
+    Get name of class of observer used as key of accounting.
+
+    :param observer: Function or method (may be weakref.proxy).
+    :param observer_self: Object of method (may be weakref.proxy) or None for function.
+    :return: Full name of class of object or full name of function.
+    """
+    try:
+        observed_class = getattr(observer, "observed_class", None)  # Set by runners for their wrapping functions.
+        if observed_class is None and observer_self is not None:
+            observed_class = observer_self.__class__
+        if observed_class is not None:
+            return f"{observed_class.__module__}.{observed_class.__name__}"
+        return f"{observer.__module__}.{observer.__qualname__}"
+    except (AttributeError, ReferenceError):
+        return repr(observer)
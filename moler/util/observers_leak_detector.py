@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+Detector of observers which are still subscribed to moler connections but will never need data again: connection
+observers which are done or cancelled and observers whose weak references are dead. Such observers keep their threads
+and queues as long as connection lives.
+
+Audit is run periodically by runners (audit_if_due), it may also be run on demand (audit).
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+import threading
+import time
+import weakref
+from typing import Dict, Optional
+
+
+class ObserversLeakDetector:
+    """
+    Audit of observers subscribed to all alive moler connections. Leaked observers are force-unsubscribed and their
+    threads are stopped. Counts of removed observers are available via get_diagnostics.
+    """
+
+    audit_interval = 60.0  # Seconds between audits run by runners, None to switch periodic audit off.
+    _connections = weakref.WeakSet()  # Alive moler connections with observers.
+    _lock = threading.Lock()
+    _next_audit_time = 0.0
+    _audits = 0
+    _last_audit_time = None
+    _removed = {}  # reason -> count of all audits
+    _removed_per_connection = {}  # name of connection -> reason -> count of all audits
+
+    @classmethod
+    def register_connection(cls, connection) -> None:
+        """
+        Register connection to audit.
+
+        :param connection: Moler connection with method remove_leaked_observers.
+        :return: None
+        """
+        with cls._lock:
+            cls._connections.add(connection)
+
+    @classmethod
+    def audit_if_due(cls) -> Optional[Dict[str, int]]:
+        """
+        Run audit if audit_interval passed since the previous one. Cheap enough to be called in loops of runners.
+
+        :return: Counts of removed observers per reason or None if audit was not due.
+        """
+        if cls.audit_interval is None or time.monotonic() < cls._next_audit_time:
+            return None
+        with cls._lock:
+            now = time.monotonic()
+            if now < cls._next_audit_time:
+                return None  # Other runner has just started audit.
+            cls._next_audit_time = now + cls.audit_interval
+        return cls.audit()
+
+    @classmethod
+    def audit(cls) -> Dict[str, int]:
+        """
+        Find leaked observers of all connections and unsubscribe them.
+
+        :return: Counts of removed observers per reason.
+        """
+        with cls._lock:
+            connections = list(cls._connections)
+        removed = {}
+        removed_per_connection = {}
+        for connection in connections:
+            for reason in connection.remove_leaked_observers().values():
+                removed[reason] = removed.get(reason, 0) + 1
+                connection_removed = removed_per_connection.setdefault(str(connection.name), {})
+                connection_removed[reason] = connection_removed.get(reason, 0) + 1
+        with cls._lock:
+            cls._audits += 1
+            cls._last_audit_time = time.time()
+            for reason, count in removed.items():
+                cls._removed[reason] = cls._removed.get(reason, 0) + count
+            for name, connection_removed in removed_per_connection.items():
+                total_removed = cls._removed_per_connection.setdefault(name, {})
+                for reason, count in connection_removed.items():
+                    total_removed[reason] = total_removed.get(reason, 0) + count
+        return removed
+
+    @classmethod
+    def get_diagnostics(cls) -> dict:
+        """
+        Get results of audits and current numbers of subscribed observers.
+
+        :return: Dict with number of audits, time of the last audit (Unix time), counts of removed observers per reason
+         (all connections and per connection) and numbers of observers subscribed to alive connections.
+        """
+        with cls._lock:
+            connections = list(cls._connections)
+            diagnostics = {
+                "audits": cls._audits,
+                "last_audit_time": cls._last_audit_time,
+                "removed": dict(cls._removed),
+                "removed_per_connection": {name: dict(removed) for name, removed in
+                                           cls._removed_per_connection.items()},
+            }
+        diagnostics["subscribed_observers"] = {str(connection.name): connection.get_subscribed_observers_count()
+                                               for connection in connections}
+        return diagnostics
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Remove results of audits.
+
+        :return: None
+        """
+        with cls._lock:
+            cls._audits = 0
+            cls._last_audit_time = None
+            cls._removed = {}
+            cls._removed_per_connection = {}
+            cls._next_audit_time = 0.0
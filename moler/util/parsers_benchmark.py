@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of parsers of commands and events.
+
+Output documented in COMMAND_OUTPUT/EVENT_OUTPUT of modules is replayed many times via data_received of
+observers. Speed of parsing is reported in lines and bytes per second and may be compared with saved baseline.
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+import json
+import statistics
+import sys
+import time
+from argparse import ArgumentParser
+from collections import namedtuple
+from datetime import datetime
+from os.path import exists
+from typing import Dict, List, Optional
+
+from moler.cmd import RegexHelper
+from moler.util.cmds_events_doc import (
+    _buffer_connection,
+    _create_command,
+    _get_doc_variant,
+    _retrieve_command_documentation,
+    _walk_moler_nonabstract_commands,
+    check_cmd_or_event,
+)
+
+ParserBenchmarkResult = namedtuple("ParserBenchmarkResult", ["name", "variants", "lines", "bytes", "seconds",
+                                                             "lines_per_second", "bytes_per_second", "error"])
+
+ParserRegression = namedtuple("ParserRegression", ["name", "baseline_lines_per_second", "lines_per_second",
+                                                   "ratio"])
+
+
+def benchmark_parsers(path2cmds: str, repetitions: int = 100, name_filter: Optional[str] = None
+                      ) -> List[ParserBenchmarkResult]:
+    """
+    Measure speed of parsers of all commands or events from directory.
+
+    :param path2cmds: Path to directory with commands or events.
+    :param repetitions: How many times every documented output is parsed.
+    :param name_filter: If set then only classes with this string in full name are measured.
+    :return: List of results, one per class.
+    """
+    observer_type, base_class = check_cmd_or_event(path2cmds)
+    results = []
+    for moler_module, moler_class in _walk_moler_nonabstract_commands(path=path2cmds, base_class=base_class):
+        name = _get_class_name(moler_class)
+        if name_filter and name_filter not in name:
+            continue
+        test_data = _retrieve_command_documentation(moler_module, observer_type)
+        results.append(_benchmark_observer(name=name, moler_class=moler_class, test_data=test_data,
+                                           observer_type=observer_type, repetitions=repetitions))
+    return results
+
+
+def compare_with_baseline(results: List[ParserBenchmarkResult], baseline: Dict[str, dict],
+                          tolerance: float = 0.2) -> List[ParserRegression]:
+    """
+    Find parsers slower than in baseline.
+
+    :param results: Results of benchmark.
+    :param baseline: Baseline as returned by load_benchmark_results.
+    :param tolerance: Allowed drop of speed, 0.2 means parser may be 20% slower than in baseline.
+    :return: List of regressions, the biggest first.
+    """
+    regressions = []
+    for result in results:
+        if result.error or result.name not in baseline:
+            continue
+        baseline_lines_per_second = baseline[result.name].get("lines_per_second")
+        if not baseline_lines_per_second:
+            continue
+        ratio = result.lines_per_second / baseline_lines_per_second
+        if ratio < 1 - tolerance:
+            regressions.append(ParserRegression(name=result.name,
+                                                baseline_lines_per_second=baseline_lines_per_second,
+                                                lines_per_second=result.lines_per_second, ratio=ratio))
+    return sorted(regressions, key=lambda regression: regression.ratio)
+
+
+def save_benchmark_results(results: List[ParserBenchmarkResult], path: str) -> None:
+    """
+    Save results of benchmark to json file to use them as baseline.
+
+    :param results: Results of benchmark.
+    :param path: Path to file.
+    :return: None
+    """
+    data = {result.name: result._asdict() for result in results if not result.error}
+    with open(path, "w") as baseline_file:
+        json.dump(data, baseline_file, indent=2, sort_keys=True)
+
+
+def load_benchmark_results(path: str) -> Dict[str, dict]:
+    """
+    Load results of benchmark saved by save_benchmark_results.
+
+    :param path: Path to file.
+    :return: Dict with name of class as key and dict with result as value.
+    """
+    with open(path) as baseline_file:
+        return json.load(baseline_file)
+
+
+def format_benchmark_results(results: List[ParserBenchmarkResult],
+                             baseline: Optional[Dict[str, dict]] = None) -> str:
+    """
+    Format results of benchmark as table, the slowest parsers first.
+
+    :param results: Results of benchmark.
+    :param baseline: Baseline to show speed relative to baseline.
+    :return: String with table.
+    """
+    header = f"{'class':<60} {'lines/s':>12} {'bytes/s':>14}"
+    if baseline is not None:
+        header += f" {'vs baseline':>12}"
+    report = [header]
+    for result in sorted(results, key=lambda res: (res.error is None, res.lines_per_second)):
+        if result.error:
+            report.append(f"{result.name:<60} error: {result.error}")
+            continue
+        line = f"{result.name:<60} {result.lines_per_second:>12.0f} {result.bytes_per_second:>14.0f}"
+        if baseline is not None:
+            baseline_lines_per_second = baseline.get(result.name, {}).get("lines_per_second")
+            if baseline_lines_per_second:
+                line += f" {result.lines_per_second / baseline_lines_per_second:>11.2f}x"
+            else:
+                line += f" {'new':>12}"
+        report.append(line)
+    return "\n".join(report)
+
+
+def _get_class_name(moler_class: type) -> str:
+    """
+    Get full name of class.
+
+    :param moler_class: Class of command or event.
+    :return: Name of module and class.
+    """
+    return f"{moler_class.__module__}.{moler_class.__name__}"
+
+
+def _benchmark_observer(name: str, moler_class: type, test_data: dict, observer_type: str,
+                        repetitions: int) -> ParserBenchmarkResult:
+    """
+    Measure speed of parser of one class for all documented outputs.
+
+    :param name: Name of class.
+    :param moler_class: Class of command or event.
+    :param test_data: Documentation of module.
+    :param observer_type: COMMAND or EVENT.
+    :param repetitions: How many times every documented output is parsed.
+    :return: Result of benchmark.
+    """
+    lines = 0
+    size = 0
+    seconds = 0.0
+    variants = 0
+    try:
+        for variant in test_data:
+            if f"{observer_type}_OUTPUT" not in test_data[variant] or f"{observer_type}_RESULT" not in test_data[variant]:
+                continue
+            cmd_output, cmd_kwargs, _ = _get_doc_variant(test_data, variant, observer_type)
+            # Warm up: regular expressions compiled and caches filled before measurement.
+            _replay_output(moler_class=moler_class, cmd_output=cmd_output, cmd_kwargs=cmd_kwargs, repetitions=1)
+            # Median is not sensitive to single slow repetitions (garbage collector, other processes).
+            durations = _replay_output(moler_class=moler_class, cmd_output=cmd_output, cmd_kwargs=cmd_kwargs,
+                                       repetitions=repetitions)
+            seconds += statistics.median(durations) * repetitions
+            lines += len(cmd_output.splitlines()) * repetitions
+            size += len(cmd_output.encode("utf-8")) * repetitions
+            variants += 1
+    except Exception as err:  # pylint: disable=broad-except
+        return ParserBenchmarkResult(name=name, variants=variants, lines=lines, bytes=size, seconds=seconds,
+                                     lines_per_second=0.0, bytes_per_second=0.0, error=str(err))
+    if variants == 0 or seconds <= 0:
+        return ParserBenchmarkResult(name=name, variants=variants, lines=lines, bytes=size, seconds=seconds,
+                                     lines_per_second=0.0, bytes_per_second=0.0,
+                                     error=f"No {observer_type}_OUTPUT to replay.")
+    return ParserBenchmarkResult(name=name, variants=variants, lines=lines, bytes=size, seconds=seconds,
+                                 lines_per_second=lines / seconds, bytes_per_second=size / seconds, error=None)
+
+
+def _replay_output(moler_class: type, cmd_output: str, cmd_kwargs: dict, repetitions: int) -> List[float]:
+    """
+    Replay output via data_received of new instance of class for every repetition.
+
+    :param moler_class: Class of command or event.
+    :param cmd_output: Output to replay.
+    :param cmd_kwargs: Parameters of command or event.
+    :param repetitions: How many times output is parsed.
+    :return: Times of parsing of every repetition in seconds (creation of instances not included).
+    """
+    durations = []
+    buffer_io = _buffer_connection()
+    with buffer_io:  # commands may send data (i.e. passwords) when they parse output
+        for _ in range(repetitions):
+            moler_cmd, _ = _create_command(moler_class, buffer_io.moler_connection, cmd_kwargs)
+            if hasattr(moler_cmd, "command_string"):
+                # Regex of echo of command is built with command string, normally when command is sent.
+                _ = moler_cmd.command_string
+            recv_time = datetime.now()
+            start_time = time.perf_counter()
+            moler_cmd.data_received(cmd_output, recv_time)
+            durations.append(time.perf_counter() - start_time)
+    return durations
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description="Moler's parsers benchmark")
+    parser.add_argument('-p', '--path', required=True, help='directory with commands or events')
+    parser.add_argument('-r', '--repetitions', type=int, default=100, help='how many times every output is parsed')
+    parser.add_argument('-f', '--filter', default=None, help='measure only classes with this string in name')
+    parser.add_argument('-b', '--baseline', default=None, help='json file with baseline to compare with')
+    parser.add_argument('-s', '--save', default=None, help='json file to save results as new baseline')
+    parser.add_argument('-t', '--tolerance', type=float, default=0.2, help='allowed drop of speed vs baseline')
+    parser.add_argument('-x', '--regex-profile', action='store_true', help='print profile of regular expressions')
+    options = parser.parse_args()
+
+    if not exists(options.path):
+        print(f'\n{options.path} path doesn\'t exist!\n')
+        parser.print_help()
+        sys.exit(2)
+    if options.regex_profile:
+        RegexHelper.enable_profiling()
+    benchmark_results = benchmark_parsers(path2cmds=options.path, repetitions=options.repetitions,
+                                          name_filter=options.filter)
+    regex_profiler = RegexHelper.disable_profiling()
+    baseline_results = load_benchmark_results(options.baseline) if options.baseline else None
+    print(format_benchmark_results(benchmark_results, baseline=baseline_results))
+    if regex_profiler is not None:
+        print(regex_profiler.format_report())
+    if options.save:
+        save_benchmark_results(benchmark_results, options.save)
+    if baseline_results is not None:
+        found_regressions = compare_with_baseline(benchmark_results, baseline_results, tolerance=options.tolerance)
+        for regression in found_regressions:
+            print(f"Regression: {regression.name} {regression.lines_per_second:.0f} lines/s, "
+                  f"baseline {regression.baseline_lines_per_second:.0f} lines/s ({regression.ratio:.2f}x)")
+        if found_regressions:
+            sys.exit(1)
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Accumulator of not full line (line without new line chars yet) kept between chunks of data from connection.
+
+Chunks are kept in list and joined only when line is complete, so time of accumulation is linear with length of
+line. While line is not complete, observers get only its tail (the newest chunk plus overlap window of previous
+chars), so regular expressions run on partial lines do not rescan the whole line for every chunk.
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+
+class PartialLine:
+    """
+    Not full line built from chunks.
+    """
+
+    _compaction_chunks = 256  # Number of chunks joined into one string to keep list of chunks short.
+
+    def __init__(self):
+        """
+        Create empty line.
+        """
+        self._chunks = []
+        self._compacted = 0  # Number of chunks at the beginning of list which are results of compaction.
+        self._length = 0
+
+    def append(self, chunk: str) -> None:
+        """
+        Add chunk at the end of line.
+
+        :param chunk: Chunk of line.
+        :return: None
+        """
+        self._chunks.append(chunk)
+        self._length += len(chunk)
+        if len(self._chunks) - self._compacted >= PartialLine._compaction_chunks:
+            # Every char is joined here once, so compaction keeps accumulation linear.
+            block = "".join(self._chunks[self._compacted:])
+            del self._chunks[self._compacted:]
+            self._chunks.append(block)
+            self._compacted = len(self._chunks)
+
+    def get_tail(self, length: int) -> str:
+        """
+        Get the last chars of line.
+
+        :param length: Number of chars.
+        :return: The last length chars of line or whole line if it is shorter.
+        """
+        parts = []
+        collected = 0
+        for chunk in reversed(self._chunks):
+            parts.append(chunk)
+            collected += len(chunk)
+            if collected >= length:
+                break
+        parts.reverse()
+        tail = "".join(parts)
+        return tail[-length:] if collected > length else tail
+
+    def get_line(self) -> str:
+        """
+        Get whole line.
+
+        :return: Line.
+        """
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+            self._compacted = 1
+        return self._chunks[0] if self._chunks else ""
+
+    def pop_line(self) -> str:
+        """
+        Get whole line and clear accumulator.
+
+        :return: Line.
+        """
+        line = self.get_line()
+        self.clear()
+        return line
+
+    def set(self, line: str) -> None:
+        """
+        Replace content by line.
+
+        :param line: New content.
+        :return: None
+        """
+        self.clear()
+        self.append(line)
+
+    def clear(self) -> None:
+        """
+        Remove all chunks.
+
+        :return: None
+        """
+        self._chunks = []
+        self._compacted = 0
+        self._length = 0
+
+    def is_empty(self) -> bool:
+        """
+        Check if there is any chunk.
+
+        :return: True if no chunk was appended since last clear.
+        """
+        return not self._chunks
+
+    def __len__(self) -> int:
+        return self._length
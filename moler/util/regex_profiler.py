@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+Profiler of regular expressions used by RegexHelper of commands and events.
+
+Usage:
+    profiler = RegexHelper.enable_profiling()
+    ... run commands or parsers benchmark ...
+    RegexHelper.disable_profiling()
+    print(profiler.format_report())
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+import threading
+import time
+from typing import List, Optional
+
+
+class RegexProfiler:
+    """
+    Call counts, time and hit ratio of regular expressions per pattern and class which owns RegexHelper.
+
+    Pattern is reported as catastrophic backtracking candidate when time per character of long strings is many times
+    higher than time per character of short strings (time of linear regex grows with length of string, time of
+    backtracking regex explodes) and at least one call was slow.
+    """
+
+    def __init__(self, long_line_length: int = 200, backtracking_factor: float = 10.0,
+                 slow_call_time: float = 0.001):
+        """
+        Create empty profiler.
+
+        :param long_line_length: Strings with this length or longer are treated as long.
+        :param backtracking_factor: How many times time per character of long strings must be higher than of short
+         strings to report backtracking candidate.
+        :param slow_call_time: Minimal time in seconds of the slowest call of backtracking candidate.
+        """
+        self.long_line_length = long_line_length
+        self.backtracking_factor = backtracking_factor
+        self.slow_call_time = slow_call_time
+        # (owner, pattern) -> [calls, hits, time, max time, length of max time, short time, short chars, long time,
+        # long chars]
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def measure(self, owner_class: Optional[type], pattern, string, function, *args):
+        """
+        Call regex function and record its time.
+
+        :param owner_class: Class of object which owns RegexHelper or None.
+        :param pattern: Pattern as string or compiled regular expression.
+        :param string: String passed to regular expression.
+        :param function: Function to call (search or match).
+        :param args: Arguments of function.
+        :return: Result of function.
+        """
+        start_time = time.perf_counter()
+        found = function(*args)
+        duration = time.perf_counter() - start_time
+        self.record(owner_class=owner_class, pattern=pattern, string_length=len(string), duration=duration,
+                    hit=found is not None)
+        return found
+
+    def record(self, owner_class: Optional[type], pattern, string_length: int, duration: float, hit: bool) -> None:
+        """
+        Record one call of regular expression.
+
+        :param owner_class: Class of object which owns RegexHelper or None.
+        :param pattern: Pattern as string or compiled regular expression.
+        :param string_length: Length of string passed to regular expression.
+        :param duration: Time of call in seconds.
+        :param hit: True if pattern was found.
+        :return: None
+        """
+        owner = f"{owner_class.__module__}.{owner_class.__name__}" if owner_class is not None else None
+        key = (owner, str(getattr(pattern, "pattern", pattern)))
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = [0, 0, 0.0, 0.0, 0, 0.0, 0, 0.0, 0]
+                self._stats[key] = stats
+            stats[0] += 1
+            if hit:
+                stats[1] += 1
+            stats[2] += duration
+            if duration > stats[3]:
+                stats[3] = duration
+                stats[4] = string_length
+            if string_length < self.long_line_length:
+                stats[5] += duration
+                stats[6] += string_length
+            else:
+                stats[7] += duration
+                stats[8] += string_length
+
+    def get_statistics(self, owner: Optional[str] = None) -> List[dict]:
+        """
+        Get statistics of patterns.
+
+        :param owner: Full name or name of owner class to get statistics for. None for all.
+        :return: List of dicts with owner, pattern, calls, hits, hit_ratio, total_time, mean_time, max_time,
+         max_time_length and backtracking_candidate. The most time consuming patterns first.
+        """
+        with self._lock:
+            items = [(key, list(stats)) for key, stats in self._stats.items()]
+        statistics = []
+        for (key_owner, pattern), stats in items:
+            if owner is not None and owner not in (key_owner, str(key_owner).rsplit(".", 1)[-1]):
+                continue
+            calls, hits, total_time, max_time, max_time_length = stats[:5]
+            statistics.append({"owner": key_owner, "pattern": pattern, "calls": calls, "hits": hits,
+                               "hit_ratio": hits / calls, "total_time": total_time, "mean_time": total_time / calls,
+                               "max_time": max_time, "max_time_length": max_time_length,
+                               "backtracking_candidate": self._is_backtracking_candidate(stats)})
+        statistics.sort(key=lambda item: item["total_time"], reverse=True)
+        return statistics
+
+    def get_backtracking_candidates(self) -> List[dict]:
+        """
+        Get statistics of patterns which may suffer from catastrophic backtracking.
+
+        :return: List of dicts as in get_statistics.
+        """
+        return [item for item in self.get_statistics() if item["backtracking_candidate"]]
+
+    def format_report(self, top: Optional[int] = 20) -> str:
+        """
+        Format report of the most time consuming patterns.
+
+        :param top: Number of patterns in report. None for all.
+        :return: Report as string.
+        """
+        statistics = self.get_statistics()
+        total_time = sum(item["total_time"] for item in statistics)
+        lines = [f"Regex profile: {len(statistics)} patterns, {sum(item['calls'] for item in statistics)} calls, "
+                 f"{total_time:.6f} s"]
+        for item in statistics[:top]:
+            flag = " BACKTRACKING?" if item["backtracking_candidate"] else ""
+            lines.append(f"{item['total_time']:>10.6f} s {item['calls']:>9} calls {item['hit_ratio']:>6.1%} hits "
+                         f"max {item['max_time'] * 1000:.3f} ms ({item['max_time_length']} chars){flag} "
+                         f"{item['owner']} '{item['pattern']}'")
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """
+        Remove all recorded statistics.
+
+        :return: None
+        """
+        with self._lock:
+            self._stats = {}
+
+    def _is_backtracking_candidate(self, stats: list) -> bool:
+        max_time, short_time, short_chars, long_time, long_chars = stats[3], stats[5], stats[6], stats[7], stats[8]
+        if max_time < self.slow_call_time or long_chars == 0 or short_chars == 0:
+            return False
+        short_rate = short_time / short_chars
+        long_rate = long_time / long_chars
+        return long_rate >= self.backtracking_factor * short_rate
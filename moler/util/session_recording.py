@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""
+Binary recording of data sent and received by connection.
+
+Recording file starts with header (magic, start time of recording as Unix time) followed by records. Every record is
+length of payload, time from start of recording (monotonic clock), direction ('<' received, '>' sent) and payload.
+The file is only appended to. Every index_interval records position and time of record is appended to seek index
+kept in file with .idx suffix, so reader may jump to any time of recording without reading it from the beginning.
+
+Reader maps the file into memory and reads records lazily, recordings of long sessions are never loaded as a whole.
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+import bisect
+import mmap
+import os
+import struct
+import threading
+import time
+from collections import namedtuple
+from typing import Iterator, Optional
+
+from moler.exceptions import WrongUsage
+
+SessionRecord = namedtuple("SessionRecord", ["time", "direction", "data", "offset"])
+
+_MAGIC = b"MOLERSR1"
+_HEADER = struct.Struct("<8sd")  # magic, start of recording as Unix time
+_RECORD_HEADER = struct.Struct("<Idc")  # length of payload, time from start of recording, direction
+_INDEX_ENTRY = struct.Struct("<dQ")  # time from start of recording, offset of record in recording file
+_DIRECTIONS = ("<", ">")
+
+
+def get_index_path(path: str) -> str:
+    """
+    Get path of seek index of recording.
+
+    :param path: Path of recording file.
+    :return: Path of index file.
+    """
+    return f"{path}.idx"
+
+
+def is_session_recording(path: str) -> bool:
+    """
+    Check if file is session recording.
+
+    :param path: Path of file.
+    :return: True if file starts with header of session recording.
+    """
+    with open(path, "rb") as checked_file:
+        return checked_file.read(len(_MAGIC)) == _MAGIC
+
+
+class SessionRecordingWriter:
+    """
+    Writer of recording file. Records are flushed to file when written.
+    """
+
+    def __init__(self, path: str, index_interval: int = 1000, mode: str = "w"):
+        """
+        Open recording file.
+
+        :param path: Path of recording file.
+        :param index_interval: Entry of seek index is written every index_interval records.
+        :param mode: 'w' to create new recording, 'a' to append to existing one (time continues from its last record).
+        """
+        if mode not in ("w", "a"):
+            raise WrongUsage(f"Mode of recording must be 'w' or 'a', not '{mode}'.")
+        self.path = path
+        self.index_interval = index_interval
+        self._lock = threading.Lock()
+        index = []
+        end_offset = _HEADER.size
+        if mode == "a" and os.path.exists(path) and os.path.getsize(path) >= _HEADER.size:
+            with open(path, "rb") as recording_file:
+                _, self.start_time = _read_header(recording_file.read(_HEADER.size), path=path)
+            with SessionRecordingReader(path) as reader:
+                last_record = reader.get_last_record()
+                index = reader.index
+            if last_record is not None:
+                end_offset = last_record.offset + _RECORD_HEADER.size + len(last_record.data)
+            self._start_monotonic = time.monotonic() - (last_record.time if last_record else 0.0)
+            self._records_count = 0  # The first appended record gets entry of seek index.
+            self._file = open(path, "r+b")
+            self._file.truncate(end_offset)  # Incomplete record of interrupted recording.
+            self._file.seek(end_offset)
+        else:
+            self.start_time = time.time()
+            self._start_monotonic = time.monotonic()
+            self._records_count = 0
+            self._file = open(path, "wb")
+            self._file.write(_HEADER.pack(_MAGIC, self.start_time))
+        self._index_file = open(get_index_path(path), "wb")
+        for index_time, index_offset in index:  # Entries of appended recording.
+            if index_offset < end_offset:
+                self._index_file.write(_INDEX_ENTRY.pack(index_time, index_offset))
+        self._offset = self._file.tell()
+
+    def write(self, direction: str, data: bytes, timestamp: Optional[float] = None) -> None:
+        """
+        Append record.
+
+        :param direction: '<' for received data, '>' for sent data.
+        :param data: Payload as bytes.
+        :param timestamp: Time from start of recording in seconds. None to take current time of monotonic clock.
+        :return: None
+        """
+        if direction not in _DIRECTIONS:
+            raise WrongUsage(f"Direction of record must be '<' or '>', not '{direction}'.")
+        with self._lock:
+            if timestamp is None:
+                timestamp = time.monotonic() - self._start_monotonic
+            if self._records_count % self.index_interval == 0:
+                self._index_file.write(_INDEX_ENTRY.pack(timestamp, self._offset))
+                self._index_file.flush()
+            self._file.write(_RECORD_HEADER.pack(len(data), timestamp, direction.encode("ascii")))
+            self._file.write(data)
+            self._file.flush()
+            self._offset += _RECORD_HEADER.size + len(data)
+            self._records_count += 1
+
+    def flush(self) -> None:
+        """
+        Flush files. Records are flushed when written, method exists to be used as stream of logging handler.
+
+        :return: None
+        """
+        with self._lock:
+            self._file.flush()
+            self._index_file.flush()
+
+    def close(self) -> None:
+        """
+        Close recording file.
+
+        :return: None
+        """
+        with self._lock:
+            self._file.close()
+            self._index_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class SessionRecordingReader:
+    """
+    Lazy reader of recording file.
+    """
+
+    def __init__(self, path: str):
+        """
+        Map recording file into memory.
+
+        :param path: Path of recording file.
+        """
+        self.path = path
+        with open(path, "rb") as recording_file:
+            _, self.start_time = _read_header(recording_file.read(_HEADER.size), path=path)
+            self._size = os.fstat(recording_file.fileno()).st_size
+            self._mmap = mmap.mmap(recording_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.index = self._load_index()
+        self._index_times = [entry[0] for entry in self.index]
+
+    def __iter__(self) -> Iterator[SessionRecord]:
+        return self.records()
+
+    def records(self, start_offset: int = _HEADER.size) -> Iterator[SessionRecord]:
+        """
+        Iterate records.
+
+        :param start_offset: Position of the first record in file.
+        :return: Iterator of records. Incomplete record at the end of file (recording interrupted) is skipped.
+        """
+        offset = start_offset
+        while offset + _RECORD_HEADER.size <= self._size:
+            length, timestamp, direction = _RECORD_HEADER.unpack_from(self._mmap, offset)
+            data_offset = offset + _RECORD_HEADER.size
+            if data_offset + length > self._size:
+                break
+            yield SessionRecord(time=timestamp, direction=direction.decode("ascii"),
+                                data=self._mmap[data_offset:data_offset + length], offset=offset)
+            offset = data_offset + length
+
+    def seek(self, time_offset: float) -> Iterator[SessionRecord]:
+        """
+        Iterate records starting from time of recording.
+
+        :param time_offset: Time from start of recording in seconds.
+        :return: Iterator of records with time not earlier than time_offset.
+        """
+        position = bisect.bisect_right(self._index_times, time_offset) - 1
+        start_offset = self.index[position][1] if position >= 0 else _HEADER.size
+        for record in self.records(start_offset=start_offset):
+            if record.time >= time_offset:
+                yield record
+
+    def get_last_record(self) -> Optional[SessionRecord]:
+        """
+        Get the last complete record.
+
+        :return: The last record or None if recording is empty.
+        """
+        last_record = None
+        start_offset = self.index[-1][1] if self.index else _HEADER.size
+        for last_record in self.records(start_offset=start_offset):
+            pass
+        return last_record
+
+    def close(self) -> None:
+        """
+        Unmap recording file.
+
+        :return: None
+        """
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+            self._size = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def _load_index(self) -> list:
+        index_path = get_index_path(self.path)
+        if not os.path.exists(index_path):
+            return []
+        with open(index_path, "rb") as index_file:
+            content = index_file.read()
+        usable_size = len(content) - len(content) % _INDEX_ENTRY.size
+        return [entry for entry in _INDEX_ENTRY.iter_unpack(content[:usable_size]) if entry[1] < self._size]
+
+
+def _read_header(header: bytes, path: str) -> tuple:
+    if len(header) < _HEADER.size:
+        raise WrongUsage(f"File '{path}' is not a session recording (too short).")
+    magic, start_time = _HEADER.unpack(header)
+    if magic != _MAGIC:
+        raise WrongUsage(f"File '{path}' is not a session recording (magic {magic!r}).")
+    return magic, start_time
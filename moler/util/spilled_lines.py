@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+List of lines which moves to temporary file when it grows over configured size.
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+import tempfile
+import threading
+from array import array
+from typing import Iterable, Iterator, List, Optional, Union
+
+
+class SpilledLines:
+    """
+    Sequence of lines kept in memory till they take max_bytes_in_memory. Then all lines are moved to temporary file
+    and only offsets of lines are kept in memory. Lines are read from file lazily when accessed.
+    """
+
+    _encoding = "utf-8"
+
+    def __init__(self, max_bytes_in_memory: int = 1048576, lines: Optional[Iterable[str]] = None):
+        """
+        Create sequence of lines.
+
+        :param max_bytes_in_memory: Max number of bytes of lines kept in memory. Set 0 to keep all lines in file.
+        :param lines: Initial lines.
+        """
+        self.max_bytes_in_memory = max_bytes_in_memory
+        self._lines: List[str] = []
+        self._bytes_in_memory = 0
+        self._file = None
+        self._offsets = array('Q', [0])  # Start of every line in file and the end of the last one.
+        self._lock = threading.Lock()
+        if lines:
+            self.extend(lines)
+
+    @property
+    def spilled(self) -> bool:
+        """
+        Checks if lines are stored in temporary file.
+
+        :return: True if lines are in file, False if in memory.
+        """
+        return self._file is not None
+
+    def append(self, line: str) -> None:
+        """
+        Add line at the end.
+
+        :param line: Line to add.
+        :return: None
+        """
+        with self._lock:
+            if self._file is None:
+                self._lines.append(line)
+                self._bytes_in_memory += len(line)
+                if self._bytes_in_memory > self.max_bytes_in_memory:
+                    self._spill()
+            else:
+                self._write(line)
+
+    def extend(self, lines: Iterable[str]) -> None:
+        """
+        Add lines at the end.
+
+        :param lines: Lines to add.
+        :return: None
+        """
+        for line in lines:
+            self.append(line)
+
+    def close(self) -> None:
+        """
+        Remove temporary file. Lines stored in file are lost.
+
+        :return: None
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                self._offsets = array('Q', [0])
+
+    def __len__(self) -> int:
+        with self._lock:
+            if self._file is None:
+                return len(self._lines)
+            return len(self._offsets) - 1
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self[nr] for nr in range(*index.indices(len(self)))]
+        with self._lock:
+            if self._file is None:
+                return self._lines[index]
+            lines_count = len(self._offsets) - 1
+            if index < 0:
+                index += lines_count
+            if index < 0 or index >= lines_count:
+                raise IndexError(f"Index {index} out of range for {lines_count} lines.")
+            start = self._offsets[index]
+            self._file.seek(start)
+            data = self._file.read(self._offsets[index + 1] - start)
+            self._file.seek(0, 2)
+            return data.decode(self._encoding)
+
+    def __eq__(self, other) -> bool:
+        try:
+            if len(self) != len(other):
+                return False
+        except TypeError:
+            return False
+        return all(line == other_line for line, other_line in zip(self, other))
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+    def __repr__(self) -> str:
+        return f"SpilledLines(lines={len(self)}, spilled={self.spilled})"
+
+    def _spill(self) -> None:
+        """
+        Move lines from memory to temporary file.
+
+        :return: None
+        """
+        self._file = tempfile.TemporaryFile(prefix="moler_lines_")
+        for line in self._lines:
+            self._write(line)
+        self._lines = []
+        self._bytes_in_memory = 0
+
+    def _write(self, line: str) -> None:
+        """
+        Write line at the end of temporary file.
+
+        :param line: Line to write.
+        :return: None
+        """
+        data = line.encode(self._encoding)
+        self._file.write(data)
+        self._offsets.append(self._offsets[-1] + len(data))
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:  # pylint: disable=broad-except
+            pass
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+Recorder of timeline of runners, devices, commands scheduler and IO threads.
+
+Events are stored in Trace Event Format (JSON) and may be viewed offline in chrome://tracing or
+https://ui.perfetto.dev.
+
+Usage:
+    recorder = TraceRecorder.start()
+    ... run test ...
+    TraceRecorder.stop()
+    recorder.save("moler_trace.json")
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+import collections
+import json
+import os
+import threading
+import time
+from typing import Optional
+
+
+class TraceRecorder:
+    """
+    Recorder of trace events.
+
+    Recording is off by default. Instrumented code checks TraceRecorder.active and records nothing when it is None, so
+    the cost of disabled recording is one attribute lookup.
+
+    Categories of recorded events:
+    observer - lifetime of connection observers (from runner submit till done), feed loops and timeouts,
+    device - hops of goto_state,
+    scheduler - waits of commands in queue of connection,
+    io - reads of data by pulling threads of connections.
+    """
+
+    active = None  # Recorder used by instrumented code, None when recording is off.
+
+    def __init__(self, max_events: int = 1000000):
+        """
+        Create recorder.
+
+        :param max_events: Max number of kept events. The oldest events are dropped when limit is reached.
+        """
+        self._events = collections.deque(maxlen=max_events)
+        self._threads_names = {}  # thread id -> thread name
+        self._pid = os.getpid()
+
+    @classmethod
+    def start(cls, max_events: int = 1000000) -> "TraceRecorder":
+        """
+        Start recording of events by new recorder.
+
+        :param max_events: Max number of kept events.
+        :return: Active recorder.
+        """
+        cls.active = TraceRecorder(max_events=max_events)
+        return cls.active
+
+    @classmethod
+    def stop(cls) -> Optional["TraceRecorder"]:
+        """
+        Stop recording of events.
+
+        :return: Recorder which was active or None if recording was off.
+        """
+        recorder = cls.active
+        cls.active = None
+        return recorder
+
+    def complete(self, name: str, category: str, start_time: float, end_time: Optional[float] = None,
+                 args: Optional[dict] = None) -> None:
+        """
+        Record span of code executed in current thread.
+
+        :param name: Name of span.
+        :param category: Category of span.
+        :param start_time: Start of span, value of time.monotonic().
+        :param end_time: End of span, value of time.monotonic(). None for now.
+        :param args: Additional information shown for span.
+        :return: None
+        """
+        if end_time is None:
+            end_time = time.monotonic()
+        event = {"name": name, "cat": category, "ph": "X", "ts": start_time * 1000000,
+                 "dur": max(0.0, end_time - start_time) * 1000000}
+        self._append(event=event, args=args)
+
+    def instant(self, name: str, category: str, args: Optional[dict] = None) -> None:
+        """
+        Record instant event in current thread.
+
+        :param name: Name of event.
+        :param category: Category of event.
+        :param args: Additional information shown for event.
+        :return: None
+        """
+        event = {"name": name, "cat": category, "ph": "i", "s": "t", "ts": time.monotonic() * 1000000}
+        self._append(event=event, args=args)
+
+    def async_begin(self, name: str, category: str, async_id: int, args: Optional[dict] = None) -> None:
+        """
+        Record begin of span which may end in other thread.
+
+        :param name: Name of span.
+        :param category: Category of span.
+        :param async_id: Id of span, the same must be passed to async_end.
+        :param args: Additional information shown for span.
+        :return: None
+        """
+        event = {"name": name, "cat": category, "ph": "b", "id": hex(async_id), "ts": time.monotonic() * 1000000}
+        self._append(event=event, args=args)
+
+    def async_end(self, name: str, category: str, async_id: int, args: Optional[dict] = None) -> None:
+        """
+        Record end of span started by async_begin.
+
+        :param name: Name of span.
+        :param category: Category of span.
+        :param async_id: Id of span passed to async_begin.
+        :param args: Additional information shown for span.
+        :return: None
+        """
+        event = {"name": name, "cat": category, "ph": "e", "id": hex(async_id), "ts": time.monotonic() * 1000000}
+        self._append(event=event, args=args)
+
+    def get_events(self) -> list:
+        """
+        Get recorded events with metadata events naming threads.
+
+        :return: List of events in Trace Event Format.
+        """
+        events = list(self._events)
+        for thread_id, thread_name in list(self._threads_names.items()):
+            events.append({"name": "thread_name", "ph": "M", "pid": self._pid, "tid": thread_id,
+                           "args": {"name": thread_name}})
+        return events
+
+    def to_json(self) -> str:
+        """
+        Get recorded events as JSON object format of Trace Event Format.
+
+        :return: JSON string.
+        """
+        return json.dumps({"traceEvents": self.get_events(), "displayTimeUnit": "ms"})
+
+    def save(self, path: str) -> None:
+        """
+        Save recorded events to file.
+
+        :param path: Path to file.
+        :return: None
+        """
+        with open(path, "w") as trace_file:
+            trace_file.write(self.to_json())
+
+    def clear(self) -> None:
+        """
+        Remove all recorded events.
+
+        :return: None
+        """
+        self._events.clear()
+
+    def _append(self, event: dict, args: Optional[dict]) -> None:
+        thread_id = threading.get_native_id()
+        if thread_id not in self._threads_names:
+            self._threads_names[thread_id] = threading.current_thread().name
+        event["pid"] = self._pid
+        event["tid"] = thread_id
+        if args:
+            event["args"] = args
+        self._events.append(event)
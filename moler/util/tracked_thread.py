@@ -1,9 +1,14 @@
 import logging
 import functools
 import os
+import signal
 import sys
 import threading
 import time
+import weakref
+from typing import Dict, List, Optional
+
+from moler.exceptions import WrongUsage
 
 # Need to store a reference to sys.exc_info for printing
 # out exceptions when a thread tries to use a global var. during interp.
@@ -13,6 +18,18 @@ _exc_info = sys.exc_info
 # do_threads_debug = os.getenv('MOLER_DEBUG_THREADS', 'False').lower() in ('true', 't', 'yes', 'y', '1')
 do_threads_debug = os.getenv('MOLER_DEBUG_THREADS', 'True').lower() in ('true', 't', 'yes', 'y', '1')  # just to catch that rare hanging thread issue
 
+# Roles of threads created by Moler
+ROLE_IO_PULLER = "io_puller"
+ROLE_OBSERVER_WRAPPER = "observer_wrapper"
+ROLE_RUNNER_FEEDER = "runner_feeder"
+ROLE_GOTO_STATE = "goto_state"
+ROLE_COMMAND_SCHEDULER = "command_scheduler"
+ROLE_ASYNCIO_LOOP = "asyncio_loop"
+ROLE_UNREGISTERED = "unregistered"
+
+_registered_threads = weakref.WeakKeyDictionary()  # thread -> role, entry disappears together with thread object
+_registered_threads_lock = threading.Lock()
+
 
 def log_exit_exception(fun):
     @functools.wraps(fun)
@@ -51,7 +68,7 @@ def report_alive(report_tick=5.0):
 def threads_dumper(report_tick=10.0):
     while True:
         time.sleep(report_tick)
-        logging.getLogger("moler_threads").info(f"ACTIVE: {threading.enumerate()}")
+        logging.getLogger("moler_threads").info(f"ACTIVE: {get_role_counts()} {threading.enumerate()}")
 
 
 def start_threads_dumper():
@@ -59,3 +76,152 @@ def start_threads_dumper():
         dumper = threading.Thread(target=threads_dumper)
         dumper.daemon = True
         dumper.start()
+
+
+def register_thread(role: str, thread: Optional[threading.Thread] = None) -> None:
+    """
+    Register thread created by Moler in inventory of threads.
+
+    :param role: Role of thread, one of ROLE_* constants.
+    :param thread: Thread to register. None for current thread (threads of pools change role when reused).
+    :return: None
+    """
+    if thread is None:
+        thread = threading.current_thread()
+    with _registered_threads_lock:
+        _registered_threads[thread] = role
+
+
+def get_thread_role(thread: Optional[threading.Thread] = None) -> Optional[str]:
+    """
+    Get role of thread.
+
+    :param thread: Thread to check. None for current thread.
+    :return: Role of thread or None if thread is not registered.
+    """
+    if thread is None:
+        thread = threading.current_thread()
+    with _registered_threads_lock:
+        return _registered_threads.get(thread)
+
+
+def get_threads(role: Optional[str] = None) -> List[threading.Thread]:
+    """
+    Get alive threads registered by Moler.
+
+    :param role: Role of threads to get. None for all roles.
+    :return: List of threads.
+    """
+    with _registered_threads_lock:
+        registered = list(_registered_threads.items())
+    return [thread for thread, thread_role in registered if thread.is_alive() and role in (None, thread_role)]
+
+
+def get_role_counts() -> Dict[str, int]:
+    """
+    Count alive threads per role.
+
+    :return: Dict {role: number of alive threads}. Threads not registered by Moler are counted as 'unregistered'.
+    """
+    counts = {}
+    for thread in threading.enumerate():
+        role = get_thread_role(thread) or ROLE_UNREGISTERED
+        counts[role] = counts.get(role, 0) + 1
+    return counts
+
+
+def sample_stacks(duration: float = 1.0, interval: float = 0.01, role: Optional[str] = None) -> Dict[str, int]:
+    """
+    Sample stacks of all threads for time window.
+
+    :param duration: Time window of sampling in seconds.
+    :param interval: Time between samples in seconds.
+    :param role: Sample only threads of this role. None for all threads.
+    :return: Dict {folded stack: number of samples}. Folded stack starts with role of thread (name of thread if it
+     is not registered) followed by frames from the outermost one, separated by ';'.
+    """
+    sampler_ident = threading.get_ident()
+    stacks = {}
+    end_time = time.monotonic() + duration
+    while True:
+        threads = {thread.ident: thread for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():  # pylint: disable=protected-access
+            if ident == sampler_ident:
+                continue
+            thread = threads.get(ident)
+            thread_role = get_thread_role(thread) if thread is not None else None
+            if role is not None and thread_role != role:
+                continue
+            frames = []
+            while frame is not None:
+                code = frame.f_code
+                frames.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            root = thread_role or (thread.name if thread is not None else str(ident))
+            frames.append(root.replace(";", ","))
+            frames.reverse()
+            folded_stack = ";".join(frames)
+            stacks[folded_stack] = stacks.get(folded_stack, 0) + 1
+        if time.monotonic() >= end_time:
+            break
+        time.sleep(interval)
+    return stacks
+
+
+def format_folded_stacks(stacks: Dict[str, int]) -> str:
+    """
+    Format stacks as input of flame graph tools (flamegraph.pl, speedscope, inferno).
+
+    :param stacks: Dict {folded stack: number of samples} as returned by sample_stacks.
+    :return: Lines '<folded stack> <number of samples>', the most frequent stacks first.
+    """
+    lines = [f"{stack} {count}" for stack, count in sorted(stacks.items(), key=lambda item: item[1], reverse=True)]
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def trigger_stacks_sampling(path: str, duration: float = 5.0, interval: float = 0.01,
+                            role: Optional[str] = None) -> threading.Thread:
+    """
+    Sample stacks in background thread and save them as folded stacks.
+
+    :param path: Path of file with folded stacks.
+    :param duration: Time window of sampling in seconds.
+    :param interval: Time between samples in seconds.
+    :param role: Sample only threads of this role. None for all threads.
+    :return: Thread of sampling, join it to wait for file.
+    """
+    @log_exit_exception
+    def _sample_to_file():
+        stacks = sample_stacks(duration=duration, interval=interval, role=role)
+        with open(path, "w") as stacks_file:
+            stacks_file.write(format_folded_stacks(stacks))
+        logging.getLogger("moler_threads").info(f"Saved {sum(stacks.values())} samples of stacks into '{path}'. "
+                                                f"Threads per role: {get_role_counts()}")
+
+    sampler = threading.Thread(target=_sample_to_file, name="StacksSampler")
+    sampler.daemon = True
+    sampler.start()
+    return sampler
+
+
+def install_stacks_sampling_signal_handler(signum: Optional[int] = None, directory: str = ".",
+                                           duration: float = 5.0, interval: float = 0.01):
+    """
+    Sample stacks when process gets signal, for example: kill -USR2 <pid>. Must be called from main thread.
+
+    :param signum: Number of signal. None for SIGUSR2.
+    :param directory: Directory of files moler.stacks.<pid>.<time>.folded with folded stacks.
+    :param duration: Time window of sampling in seconds.
+    :param interval: Time between samples in seconds.
+    :return: Previous handler of signal.
+    """
+    if signum is None:
+        signum = getattr(signal, "SIGUSR2", None)
+        if signum is None:
+            raise WrongUsage("SIGUSR2 is not available on this system. Please pass signum.")
+
+    def _handler(received_signum, frame):  # pylint: disable=unused-argument
+        path = os.path.join(directory, f"moler.stacks.{os.getpid()}.{time.strftime('%Y%m%d_%H%M%S')}.folded")
+        trigger_stacks_sampling(path=path, duration=duration, interval=interval)
+
+    return signal.signal(signum, _handler)
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+Registry of exceptions set in connection observers and not raised yet.
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+from collections import OrderedDict
+from itertools import islice
+from typing import Dict, List
+
+
+class UnraisedExceptions:
+    """
+    Exceptions in order of setting, indexed by identity of exception. Adding, removing and checking of exception cost
+    O(1). Counts of exceptions are kept per class of observer for summary.
+
+    The registry is not thread safe, caller has to synchronize access.
+    """
+
+    def __init__(self):
+        """
+        Create empty registry.
+        """
+        self._entries = OrderedDict()  # id of exception -> (exception, name of observer class)
+        self._counts: Dict[str, Dict[str, int]] = {}  # name of observer class -> name of exception class -> count
+
+    def add(self, exception: Exception, observer_class: str) -> None:
+        """
+        Add exception. Exception already in registry is not added again.
+
+        :param exception: Exception set in observer.
+        :param observer_class: Full name of class of observer.
+        :return: None
+        """
+        key = id(exception)
+        if key in self._entries:
+            return
+        self._entries[key] = (exception, observer_class)
+        exceptions_counts = self._counts.setdefault(observer_class, {})
+        exception_class = exception.__class__.__name__
+        exceptions_counts[exception_class] = exceptions_counts.get(exception_class, 0) + 1
+
+    def discard(self, exception: Exception) -> bool:
+        """
+        Remove exception if it is in registry.
+
+        :param exception: Exception to remove.
+        :return: True if exception was removed, False if it was not in registry.
+        """
+        entry = self._entries.pop(id(exception), None)
+        if entry is None:
+            return False
+        observer_class = entry[1]
+        exceptions_counts = self._counts[observer_class]
+        exception_class = exception.__class__.__name__
+        exceptions_counts[exception_class] -= 1
+        if exceptions_counts[exception_class] == 0:
+            del exceptions_counts[exception_class]
+            if not exceptions_counts:
+                del self._counts[observer_class]
+        return True
+
+    def get_exceptions(self) -> List[Exception]:
+        """
+        Get all exceptions.
+
+        :return: List of exceptions in order of adding.
+        """
+        return [exception for exception, _ in self._entries.values()]
+
+    def get_last(self, count: int) -> List[tuple]:
+        """
+        Get the most recently added exceptions.
+
+        :param count: Max number of exceptions.
+        :return: List of tuples (exception, name of observer class) in order of adding.
+        """
+        last = list(islice(reversed(self._entries.values()), count))
+        last.reverse()
+        return last
+
+    def get_summary(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get counts of exceptions grouped by class of observer.
+
+        :return: Dict {name of observer class: {name of exception class: count}}.
+        """
+        return {observer_class: dict(exceptions_counts) for observer_class, exceptions_counts in self._counts.items()}
+
+    def clear(self) -> None:
+        """
+        Remove all exceptions.
+
+        :return: None
+        """
+        self._entries.clear()
+        self._counts.clear()
+
+    def __contains__(self, exception) -> bool:
+        entry = self._entries.get(id(exception))
+        return entry is not None and entry[0] is exception
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self.get_exceptions())
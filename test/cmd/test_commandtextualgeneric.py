@@ -4,9 +4,12 @@ Testing CommandTextualGeneric.
 """
 
 __author__ = 'Grzegorz Latuszek'
-__copyright__ = 'Copyright (C) 2020, Nokia'
+__copyright__ = 'Copyright (C) 2020-2026, Nokia'
 __email__ = 'grzegorz.latuszek@nokia.com'
 
+import re
+
+import mock
 import pytest
 
 
@@ -19,6 +22,253 @@ def test_correct_closing_of_ctrl_c_broken_command(buffer_connection, textual_com
     assert not cmd.is_end_of_cmd_output(line="Xadb_shell@12345678 $")
 
 
+def test_command_passes_whole_long_line_and_tails_of_not_full_line(buffer_connection, textual_command_class):
+    import datetime
+    cmd = textual_command_class(connection=buffer_connection.moler_connection,
+                                prompt=r"^host:~ #")
+    cmd.partial_line_window = 20
+    cmd.ret_required = False
+    cmd._cmd_output_started = True  # pylint: disable=protected-access
+    lines = []
+    on_new_line = cmd.on_new_line
+
+    def recording_on_new_line(line, is_full_line):
+        lines.append((line, is_full_line))
+        on_new_line(line=line, is_full_line=is_full_line)
+
+    cmd.on_new_line = recording_on_new_line
+    for _ in range(1000):
+        cmd.data_received("0123456789", datetime.datetime.now())
+        assert len(lines[-1][0]) <= 30
+    assert lines[-1] == ("012345678901234567890123456789", False)
+    cmd.data_received("\nhost:~ #", datetime.datetime.now())
+    assert lines[-2] == ("0123456789" * 1000, True)
+    assert cmd.done() is True
+
+
+def test_command_passes_too_long_not_full_line_as_full_line(buffer_connection, textual_command_class):
+    import datetime
+    cmd = textual_command_class(connection=buffer_connection.moler_connection,
+                                prompt=r"^host:~ #")
+    cmd.max_partial_line_length = 25
+    cmd.ret_required = False
+    cmd._cmd_output_started = True  # pylint: disable=protected-access
+    lines = []
+    cmd.on_new_line = lambda line, is_full_line: lines.append((line, is_full_line))
+    for _ in range(4):
+        cmd.data_received("0123456789", datetime.datetime.now())
+    assert lines == [("0123456789", False), ("01234567890123456789", False), ("012345678901234567890123456789", True),
+                     ("0123456789", False)]
+
+
+def test_command_classifies_line_with_fused_regex(buffer_connection, textual_command_class):
+    cmd = textual_command_class(connection=buffer_connection.moler_connection,
+                                prompt=r"^host:~ #")
+    cmd.add_failure_indication("No such file")
+    cmd.break_exec_regex = r"Press any key"
+    assert cmd._line_may_match_classifier("regular line of output") is False  # pylint: disable=protected-access
+    assert cmd._line_may_match_classifier("host:~ #") is True  # pylint: disable=protected-access
+    assert cmd._line_may_match_classifier("ls: NO SUCH FILE") is True  # pylint: disable=protected-access
+    assert cmd._line_may_match_classifier("Press any key") is True  # pylint: disable=protected-access
+    assert cmd._line_may_match_classifier("Permission denied") is False  # pylint: disable=protected-access
+    cmd.add_failure_indication("Permission denied")
+    assert cmd._line_may_match_classifier("Permission denied") is True  # pylint: disable=protected-access
+    assert cmd.is_failure_indication("Permission denied", is_full_line=True) is True
+    assert cmd.is_failure_indication("regular line of output", is_full_line=True) is False
+    assert cmd.is_end_of_cmd_output("^Chost:~ #") is True
+
+
+def test_command_does_not_fuse_patterns_with_backreferences(buffer_connection, textual_command_class):
+    cmd = textual_command_class(connection=buffer_connection.moler_connection,
+                                prompt=r"^host:~ #")
+    cmd.add_failure_indication(r"(\w+) \1")
+    assert cmd._line_may_match_classifier("regular line of output") is True  # pylint: disable=protected-access
+    assert cmd.is_failure_indication("failed failed", is_full_line=True) is True
+    assert cmd.is_failure_indication("regular line of output", is_full_line=True) is False
+
+
+@pytest.mark.parametrize("pattern", [r"(?i)no such file", r"(?x) no \s such \s file", r"(?im)^No such file"])
+def test_command_does_not_fuse_patterns_with_global_inline_flags(pattern):
+    from moler.cmd.commandtextualgeneric import CommandTextualGeneric
+    patterns = (re.compile(r"^host:~ #"), re.compile(pattern))
+    assert CommandTextualGeneric._get_line_classifier(patterns=patterns) is None  # pylint: disable=protected-access
+    assert CommandTextualGeneric._get_line_classifier(  # pylint: disable=protected-access
+        patterns=(re.compile(r"^host:~ #"), re.compile(r"(?i:no such) file"))) is not None
+
+
+def test_command_does_not_fuse_not_supported_patterns():
+    from moler.cmd.commandtextualgeneric import CommandTextualGeneric
+    prompt = re.compile(r"^host:~ #")
+    not_fusable = [
+        (prompt, re.compile(rb"No such file")),  # bytes pattern
+        (prompt, re.compile(r"No such file", re.VERBOSE)),  # flag without scoped inline version
+        (re.compile(r"(?P<state>host)"), re.compile(r"(?P<state>fail)")),  # fused regex is not valid
+        (None, None),
+    ]
+    for patterns in not_fusable:
+        assert CommandTextualGeneric._get_line_classifier(patterns=patterns) is None  # pylint: disable=protected-access
+
+
+def test_command_line_classifiers_cache_is_bounded(monkeypatch):
+    from moler.cmd.commandtextualgeneric import CommandTextualGeneric
+    monkeypatch.setattr(CommandTextualGeneric, "_line_classifiers", {})
+    monkeypatch.setattr(CommandTextualGeneric, "_max_line_classifiers", 2)
+    for nr in range(5):
+        classifier = CommandTextualGeneric._get_line_classifier(  # pylint: disable=protected-access
+            patterns=(re.compile(fr"^host{nr}:~ #"),))
+        assert classifier.search(f"host{nr}:~ #") is not None
+        assert len(CommandTextualGeneric._line_classifiers) <= 2  # pylint: disable=protected-access
+
+
+def test_command_checks_prompt_only_in_last_line_of_chunk(buffer_connection, textual_command_class):
+    import datetime
+    cmd = textual_command_class(connection=buffer_connection.moler_connection,
+                                prompt=r"^host:~ #")
+    cmd.ret_required = False
+    cmd.prompt_only_in_last_line_of_chunk = True
+    cmd._cmd_output_started = True  # pylint: disable=protected-access
+    cmd.data_received("host:~ #\nline 1\nline", datetime.datetime.now())
+    assert cmd.done() is False
+    cmd.data_received(" 2\nline 3\nhost:~", datetime.datetime.now())
+    assert cmd.done() is False
+    cmd.data_received(" #", datetime.datetime.now())
+    assert cmd.done() is True
+
+
+def test_command_checks_failure_in_all_lines_of_chunk(buffer_connection, textual_command_class):
+    import datetime
+    from moler.exceptions import CommandFailure
+    cmd = textual_command_class(connection=buffer_connection.moler_connection,
+                                prompt=r"^host:~ #")
+    cmd.ret_required = False
+    cmd.prompt_only_in_last_line_of_chunk = True
+    cmd.add_failure_indication("No such file")
+    cmd._cmd_output_started = True  # pylint: disable=protected-access
+    cmd.data_received("line 1\nNo such\n", datetime.datetime.now())
+    cmd.data_received("No such file\nline 3\nhost:~ #", datetime.datetime.now())
+    assert cmd.done() is True
+    with pytest.raises(CommandFailure):
+        cmd.result()
+
+
+def test_command_ignores_empty_chunk_when_checking_prompt_only_in_last_line(buffer_connection,
+                                                                           textual_command_class):
+    import datetime
+    cmd = textual_command_class(connection=buffer_connection.moler_connection, prompt=r"^host:~ #")
+    cmd.ret_required = False
+    cmd.prompt_only_in_last_line_of_chunk = True
+    cmd._cmd_output_started = True  # pylint: disable=protected-access
+    cmd.data_received("line", datetime.datetime.now())
+    cmd.data_received("", datetime.datetime.now())
+    assert cmd.done() is False
+    cmd.data_received(" 1\nhost:~ #", datetime.datetime.now())
+    assert cmd.done() is True
+
+
+@pytest.mark.parametrize("prompt_only_in_last_line_of_chunk, max_decoded_lines", [(True, 2), (False, 1002)])
+def test_unix_command_checks_failure_of_chunk_in_one_search(buffer_connection, prompt_only_in_last_line_of_chunk,
+                                                              max_decoded_lines):
+    import datetime
+    from moler.cmd.unix.touch import Touch
+    from moler.exceptions import CommandFailure
+    chunk = "".join(f"line {nr}\n" for nr in range(1000)) + "host:~ #"
+    cmd = Touch(connection=buffer_connection.moler_connection, path="file.txt", prompt=r"^host:~ #")
+    cmd.prompt_only_in_last_line_of_chunk = prompt_only_in_last_line_of_chunk
+    cmd._cmd_output_started = True  # pylint: disable=protected-access
+    with mock.patch.object(cmd, "_decode_line", wraps=cmd._decode_line) as decode_line:
+        cmd.data_received(chunk, datetime.datetime.now())
+    assert cmd.done() is True
+    assert cmd.result() == {}
+    assert decode_line.call_count <= max_decoded_lines  # re_fail of unix commands is searched once for the chunk.
+
+    cmd = Touch(connection=buffer_connection.moler_connection, path="file.txt", prompt=r"^host:~ #")
+    cmd.prompt_only_in_last_line_of_chunk = prompt_only_in_last_line_of_chunk
+    cmd._cmd_output_started = True  # pylint: disable=protected-access
+    cmd.data_received(chunk.replace("line 500\n", "touch: cannot touch 'file.txt': No such file or directory\n"),
+                      datetime.datetime.now())
+    with pytest.raises(CommandFailure):
+        cmd.result()
+
+
+@pytest.mark.parametrize("output, failed", [("not failed\n", False), ("not failed\nfailed\n", True)])
+def test_command_checks_lines_of_chunk_one_by_one_for_not_line_local_failure(buffer_connection, textual_command_class,
+                                                                             output, failed):
+    import datetime
+    from moler.exceptions import CommandFailure
+    cmd = textual_command_class(connection=buffer_connection.moler_connection, prompt=r"^host:~ #")
+    cmd.ret_required = False
+    cmd.prompt_only_in_last_line_of_chunk = True
+    cmd.add_failure_indication(r"(?<!not )failed")  # Lookbehind is not searched in joined lines.
+    cmd._cmd_output_started = True  # pylint: disable=protected-access
+    cmd.data_received(f"line 1\n{output}host:~ #", datetime.datetime.now())
+    assert cmd.done() is True
+    if failed:
+        with pytest.raises(CommandFailure):
+            cmd.result()
+    else:
+        assert cmd.result() == {}
+
+
+def test_command_lines_classifier_searches_joined_lines():
+    from moler.cmd.commandtextualgeneric import CommandTextualGeneric
+    classifier = CommandTextualGeneric._get_lines_classifier(  # pylint: disable=protected-access
+        patterns=(re.compile(r"^fail$"), None))
+    assert classifier.search("ok\nfail\nok") is not None
+    assert classifier.search("ok\nnot fail\nok") is None
+    for pattern in (r"\Afail", r"fail\Z", r"(?<!not )fail", r"fail(?!ed)", rb"fail"):
+        assert CommandTextualGeneric._get_lines_classifier(  # pylint: disable=protected-access
+            patterns=(re.compile(pattern),)) is None
+
+
+def test_command_parsing_output_processes_all_lines_of_chunk(buffer_connection):
+    from moler.cmd.unix.ls import Ls
+    from moler.cmd.unix.touch import Touch
+    ls = Ls(connection=buffer_connection.moler_connection)
+    touch = Touch(connection=buffer_connection.moler_connection, path="file.txt")
+    assert ls._is_pass_through() is False  # pylint: disable=protected-access
+    assert touch._is_pass_through() is True  # pylint: disable=protected-access
+
+
+def test_command_records_lifecycle_times_and_statistics(buffer_connection, textual_command_class):
+    from moler.util.command_latency import CommandLatencyStatistics
+    CommandLatencyStatistics.reset()
+    cmd = textual_command_class(connection=buffer_connection.moler_connection, prompt=r"^host:~ #")
+    cmd.ret_required = False
+    buffer_connection.remote_inject_response(["textual_cmd\n", "output\n", "host:~ #\n"])
+    cmd(timeout=2)
+    lifecycle = cmd.get_lifecycle_times()
+    times = lifecycle["times"]
+    assert times["enqueued"] <= times["submitted"] <= times["sent"] <= times["echo"] <= times["first_output"] <= times["done"]
+    assert set(lifecycle["durations"]) == {"queue_wait", "echo", "first_output", "prompt", "total"}
+    assert lifecycle["durations"]["total"] == pytest.approx(times["done"] - times["sent"])
+
+    statistics = CommandLatencyStatistics.get_statistics(device=buffer_connection.moler_connection.name,
+                                                         command_class="TextualCommand")
+    phases = list(statistics[buffer_connection.moler_connection.name].values())[0]
+    assert phases["total"]["count"] == 1
+    assert phases["echo"]["p50"] <= phases["total"]["max"]
+    assert CommandLatencyStatistics.get_statistics(device="not_existing_device") == {}
+
+
+def test_command_records_statistics_once_when_finished_twice(buffer_connection, textual_command_class):
+    from moler.connection_observer import ConnectionObserver
+    from moler.util.command_latency import CommandLatencyStatistics
+    CommandLatencyStatistics.reset()
+    cmd = textual_command_class(connection=buffer_connection.moler_connection, prompt=r"^host:~ #")
+    cmd.ret_required = False
+    buffer_connection.remote_inject_response(["textual_cmd\n", "output\n", "host:~ #\n"])
+    cmd(timeout=2)
+    done_time = cmd.get_lifecycle_times()["times"]["done"]
+    assert cmd.cancel() is False
+    cmd.set_exception(ValueError("too late"))  # Only logged for done command.
+    ConnectionObserver.get_unraised_exceptions(remove=True)
+    assert cmd.get_lifecycle_times()["times"]["done"] == done_time
+    statistics = CommandLatencyStatistics.get_statistics(device=buffer_connection.moler_connection.name,
+                                                         command_class="TextualCommand")
+    phases = list(statistics[buffer_connection.moler_connection.name].values())[0]
+    assert phases["total"]["count"] == 1
+
+
 @pytest.fixture()
 def textual_command_class():
     from moler.cmd.commandtextualgeneric import CommandTextualGeneric
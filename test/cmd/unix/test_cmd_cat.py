@@ -3,7 +3,7 @@
 Testing of cat command.
 """
 __author__ = 'Sylwester Golonka, Marcin Usielski'
-__copyright__ = 'Copyright (C) 2018-2024, Nokia'
+__copyright__ = 'Copyright (C) 2018-2026, Nokia'
 __email__ = 'sylwester.golonka@nokia.com, marcin.usielski@nokia.com'
 
 from moler.cmd.unix.cat import Cat
@@ -68,6 +68,28 @@ def test_cat_prompt_in_the_same_line(buffer_connection, command_output_prompt_in
     assert cat_cmd.enter_on_prompt_without_anchors is False
 
 
+def test_cat_streams_lines_to_callback_and_file(buffer_connection, command_output):
+    streamed = []
+    buffer_connection.remote_inject_response([command_output])
+    cat_cmd = Cat(connection=buffer_connection.moler_connection, path="/home/test/test")
+    cat_cmd.set_output_streaming(line_callback=streamed.append, max_bytes_in_memory=10)
+    result = cat_cmd()
+    assert result['LINES'].spilled is True
+    assert len(result['LINES']) == 3
+    assert result['LINES'][0] == "first line"
+    assert list(result['LINES']) == streamed
+
+
+def test_cat_yields_lines_without_storing_them(buffer_connection, command_output):
+    buffer_connection.remote_inject_response([command_output])
+    cat_cmd = Cat(connection=buffer_connection.moler_connection, path="/home/test/test")
+    cat_cmd.set_output_streaming(store_lines=False)
+    lines = cat_cmd.output_lines()
+    cat_cmd.start()
+    assert list(lines)[0] == "first line"
+    assert cat_cmd.result() == {'LINES': []}
+
+
 @pytest.fixture
 def command_output():
     data = """cat /home/test/test
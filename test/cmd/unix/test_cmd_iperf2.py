@@ -4,7 +4,7 @@ Iperf2 command test module.
 """
 
 __author__ = 'Grzegorz Latuszek'
-__copyright__ = 'Copyright (C) 2019, Nokia'
+__copyright__ = 'Copyright (C) 2019-2026, Nokia'
 __email__ = 'grzegorz.latuszek@nokia.com'
 
 import pytest
@@ -539,6 +539,70 @@ def test_iperf_publishes_only_summary_records_when_handling_parallel_clients(buf
     assert iperf_stats[summary_conn_name] == expected_result['CONNECTIONS'][summary_conn_name][:-1]
 
 
+def test_iperf_streaming_publishes_compact_summary_records_of_parallel_clients(buffer_connection):
+    from moler.cmd.unix import iperf2
+    buffer_connection.remote_inject_response([iperf2.COMMAND_OUTPUT_multiple_connections_udp_server])
+    iperf_cmd = iperf2.Iperf2(connection=buffer_connection.moler_connection, streaming=True,
+                              **iperf2.COMMAND_KWARGS_multiple_connections_udp_server)
+    expected_result = iperf2.COMMAND_RESULT_multiple_connections_udp_server
+    iperf_stats = []
+    iperf_report = {}
+
+    def iperf_observer(from_client, to_server, data_record=None, report=None):
+        if data_record:
+            iperf_stats.append(data_record)
+        if report:
+            iperf_report[(from_client, to_server)] = report
+
+    iperf_cmd.subscribe(subscriber=iperf_observer)
+    result = iperf_cmd()
+    summary_conn_name = ('multiport@192.168.44.1', '5016@192.168.44.130')
+    client_conn_name = ('192.168.44.1', '5016@192.168.44.130')
+    expected_records = expected_result['CONNECTIONS'][summary_conn_name][:-1]
+    assert iperf_report[client_conn_name] == expected_result['CONNECTIONS'][client_conn_name]['report']
+    assert result['CONNECTIONS'][client_conn_name] == expected_result['CONNECTIONS'][client_conn_name]
+    assert list(result['CONNECTIONS'][summary_conn_name]) == expected_result['CONNECTIONS'][summary_conn_name][-2:]
+    assert len(iperf_stats) == len(expected_records)
+    for record, expected_record in zip(iperf_stats, expected_records):
+        assert isinstance(record, iperf2.IperfIntervalRecord)
+        assert (record.start, record.end) == expected_record['Interval']
+        assert record.transfer == expected_record['Transfer']
+        assert record.bandwidth == expected_record['Bandwidth']
+        assert record.jitter == expected_record['Jitter']
+        assert (record.lost_datagrams, record.total_datagrams) == expected_record['Lost_vs_Total_Datagrams']
+    assert iperf_cmd._multiport_intervals == {}
+
+
+def test_iperf_streaming_drops_intervals_of_parallel_client_which_stopped_reporting(buffer_connection):
+    from moler.cmd.unix import iperf2
+    output_lines = ["", "vagrant@app-svr:~$ iperf -s -u -p 5016 -f k -i 1 -P 3",
+                    "[  3] local 192.168.44.130 port 5016 connected with 192.168.44.1 port 51914",
+                    "[  4] local 192.168.44.130 port 5016 connected with 192.168.44.1 port 51915",
+                    "[ ID] Interval       Transfer     Bandwidth        Jitter   Lost/Total Datagrams"]
+    for second in range(10):
+        for conn_id in ("3", "4"):
+            if conn_id == "3" or second == 0:  # Connection 4 stops reporting after the first interval.
+                output_lines.append(f"[  {conn_id}] {second:>2}.0-{second + 1:>2}.0 sec   122 KBytes  1000 Kbits/sec"
+                                    "   1.556 ms    0/   85 (0%)")
+    output_lines.extend(["[  3]  0.0-10.0 sec  1220 KBytes  1000 Kbits/sec   1.556 ms    0/  850 (0%)",
+                         "[SUM]  0.0-10.0 sec  1342 KBytes  1100 Kbits/sec   1.556 ms    0/  935 (0%)",
+                         "vagrant@app-svr:~$"])
+    buffer_connection.remote_inject_response(["\n".join(output_lines)])
+    iperf_cmd = iperf2.Iperf2(connection=buffer_connection.moler_connection, streaming=True,
+                              options="-s -u -p 5016 -f k -i 1 -P 3")
+    iperf_stats = []
+
+    def iperf_observer(from_client, to_server, data_record=None, report=None):
+        if data_record:
+            iperf_stats.append(data_record)
+
+    iperf_cmd.subscribe(subscriber=iperf_observer)
+    iperf_cmd()
+    assert [(record.start, record.end) for record in iperf_stats] == [(0.0, 1.0)]
+    assert len(iperf_cmd._multiport_intervals) == iperf2.Iperf2._max_pending_multiport_intervals
+    assert list(iperf_cmd._multiport_intervals.keys())[0] == ("192.168.44.1", (6.0, 7.0))
+
+
 def test_iperf_timeout_on_version_not_provied_but_prompt(buffer_connection):
     iperf_cmd = Iperf2(connection=buffer_connection.moler_connection, options='--version')
     command_output = """xyz@debian:~$ iperf --version
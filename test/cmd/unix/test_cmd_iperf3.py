@@ -4,7 +4,7 @@ Iperf3 command test module.
 """
 
 __author__ = "Kacper Kozik, Marcin Usielski"
-__copyright__ = "Copyright (C) 2023-2024, Nokia"
+__copyright__ = "Copyright (C) 2023-2026, Nokia"
 __email__ = "kacper.kozik@nokia.com, marcin.usielski@nokia.com"
 
 import pytest
@@ -463,6 +463,35 @@ def test_iperf_publishes_records_to_subscribed_observers(buffer_connection):
     iperf_cmd.cancel()
 
 
+def test_iperf_streaming_publishes_compact_records_and_keeps_last_two(buffer_connection):
+    from moler.cmd.unix import iperf2, iperf3
+    buffer_connection.remote_inject_response([iperf3.COMMAND_OUTPUT_basic_client])
+    iperf_cmd = iperf3.Iperf3(connection=buffer_connection.moler_connection, streaming=True,
+                              **iperf3.COMMAND_KWARGS_basic_client)
+    iperf_stats = []
+
+    def iperf_observer(from_client, to_server, data_record=None, report=None):
+        if data_record:
+            iperf_stats.append(data_record)
+
+    iperf_cmd.subscribe(subscriber=iperf_observer)
+    result = iperf_cmd()
+    expected_connections = iperf3.COMMAND_RESULT_basic_client['CONNECTIONS']
+    conn_name = ('48058@127.0.0.1', '5201@127.0.0.1')
+    report_name = ('127.0.0.1', '5201@127.0.0.1')
+    expected_records = expected_connections[conn_name]
+    assert result['CONNECTIONS'][report_name] == expected_connections[report_name]
+    assert list(result['CONNECTIONS'][conn_name]) == expected_records[-2:]
+    report_interval = expected_connections[report_name]['report']['Interval']
+    published_records = [record for record in expected_records if record['Interval'] != report_interval]
+    assert len(iperf_stats) == len(published_records)
+    for record, expected_record in zip(iperf_stats, published_records):
+        assert isinstance(record, iperf2.IperfIntervalRecord)
+        assert (record.start, record.end) == expected_record['Interval']
+        assert record.transfer == expected_record['Transfer']
+        assert record.bandwidth == expected_record['Bitrate']
+
+
 def test_iperf_publishes_only_summary_records_when_handling_parallel_clients(buffer_connection):
     from moler.cmd.unix import iperf3
     buffer_connection.remote_inject_response(
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+"""
+Testing of lsof command.
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+from moler.cmd.unix import lsof
+
+
+def test_lsof_command_columnar_result(buffer_connection):
+    buffer_connection.remote_inject_response([lsof.COMMAND_OUTPUT_no_parameters])
+    lsof_cmd = lsof.Lsof(connection=buffer_connection.moler_connection, columnar=True)
+    result = lsof_cmd()
+    expected_values = lsof.COMMAND_RESULT_no_parameters["VALUES"]
+    assert result["NUMBER"] == lsof.COMMAND_RESULT_no_parameters["NUMBER"]
+    assert result["VALUES"] == expected_values
+    assert list(result["VALUES"].column("PID")) == [row["PID"] for row in expected_values]
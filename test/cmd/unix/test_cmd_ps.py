@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
 __author__ = 'Dariusz Rosinski, Marcin Usielski'
-__copyright__ = 'Copyright (C) 2018-2020, Nokia'
+__copyright__ = 'Copyright (C) 2018-2026, Nokia'
 __email__ = 'dariusz.rosinski@nokia.com, marcin.usielski@nokia.com'
 
 from moler.cmd.unix import ps
@@ -37,3 +37,15 @@ def test_ps_command_aux(buffer_connection):
     assert ps_cmd.command_string == "ps -aux"
     result = ps_cmd()
     assert result == ps.COMMAND_RESULT_aux
+
+
+def test_ps_command_columnar_result(buffer_connection):
+    from array import array
+    buffer_connection.remote_inject_response([ps.COMMAND_OUTPUT_V2])
+    ps_cmd = ps.Ps(connection=buffer_connection.moler_connection, options="-ef", columnar=True)
+    result = ps_cmd()
+    assert result == ps.COMMAND_RESULT_V2
+    for row, expected_row in zip(result, ps.COMMAND_RESULT_V2):
+        assert [type(value) for value in row.values()] == [type(value) for value in expected_row.values()]
+    assert isinstance(result.column("PID"), array)
+    assert list(result.column("PID")) == [row["PID"] for row in ps.COMMAND_RESULT_V2]
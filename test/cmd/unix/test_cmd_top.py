@@ -4,7 +4,7 @@ Top command test module.
 """
 
 __author__ = 'Adrianna Pienkowska, Marcin Usielski'
-__copyright__ = 'Copyright (C) 2018-2019, Nokia'
+__copyright__ = 'Copyright (C) 2018-2026, Nokia'
 __email__ = 'adrianna.pienkowska@nokia.com, marcin.usielski@nokia.com'
 
 import pytest
@@ -26,6 +26,15 @@ def test_top_raise_error_on_bad_option(buffer_connection, command_output_and_exp
         top_cmd()
 
 
+def test_top_columnar_processes(buffer_connection):
+    from moler.cmd.unix import top
+    buffer_connection.remote_inject_response([top.COMMAND_OUTPUT_batch_mode])
+    top_cmd = Top(connection=buffer_connection.moler_connection, columnar=True, **top.COMMAND_KWARGS_batch_mode)
+    result = top_cmd()
+    assert result == top.COMMAND_RESULT_batch_mode
+    assert list(result["processes"].column("PID")) == [row["PID"] for row in top.COMMAND_RESULT_batch_mode["processes"]]
+
+
 @pytest.fixture
 def command_output_and_expected_result_on_bad_option():
     output = """xyz@debian>top abc n 1
@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 
 __author__ = 'Grzegorz Latuszek, Michal Ernst, Marcin Usielski'
-__copyright__ = 'Copyright (C) 2018-2021, Nokia'
+__copyright__ = 'Copyright (C) 2018-2026, Nokia'
 __email__ = 'grzegorz.latuszek@nokia.com, michal.ernst@nokia.com, marcin.usielski@nokia.com'
 
+from collections import OrderedDict
+
 import pytest
 
 
@@ -127,3 +129,38 @@ def configure_net_1_connection():
             conn_cfg.define_connection(name='net_1', io_type='memory')
 
             yield
+
+
+def test_device_caches_validated_prompts_table(buffer_connection):
+    from moler.device.textualdevice import TextualDevice
+    from moler.device.unixlocal import UnixLocal
+
+    dev1 = UnixLocal(io_connection=buffer_connection)
+    dev2 = UnixLocal(io_connection=buffer_connection)
+    dev1._prepare_validated_reverse_state_prompts_dict()  # pylint: disable=protected-access
+    prompts_key = (UnixLocal, tuple(dev1._state_prompts.items()))  # pylint: disable=protected-access
+    assert prompts_key in TextualDevice._validated_prompts_tables  # pylint: disable=protected-access
+    dev2._prepare_validated_reverse_state_prompts_dict()  # pylint: disable=protected-access
+    assert dev1._reverse_state_prompts_dict == dev2._reverse_state_prompts_dict  # pylint: disable=protected-access
+    for state, prompt in dev1._state_prompts.items():  # pylint: disable=protected-access
+        assert dev2._reverse_state_prompts_dict[prompt] == state  # pylint: disable=protected-access
+    compiled_prompts = dev2._compiled_reverse_state_prompts  # pylint: disable=protected-access
+    assert compiled_prompts is dev1._compiled_reverse_state_prompts  # pylint: disable=protected-access
+    assert {regex.pattern: state for regex, state in compiled_prompts.items()} == dev2._reverse_state_prompts_dict  # pylint: disable=protected-access
+
+
+def test_device_evicts_least_recently_used_prompts_table(buffer_connection, monkeypatch):
+    from moler.device.textualdevice import TextualDevice
+    from moler.device.unixlocal import UnixLocal
+
+    monkeypatch.setattr(TextualDevice, "_validated_prompts_tables", OrderedDict())
+    monkeypatch.setattr(TextualDevice, "_max_validated_prompts_tables", 2)
+    devices = [UnixLocal(io_connection=buffer_connection) for _ in range(3)]
+    for nr, device in enumerate(devices):
+        device._state_prompts[UnixLocal.unix_local] = f"^host{nr}:~ #"  # pylint: disable=protected-access
+    keys = [(UnixLocal, tuple(device._state_prompts.items())) for device in devices]  # pylint: disable=protected-access
+    devices[0]._prepare_validated_reverse_state_prompts_dict()  # pylint: disable=protected-access
+    devices[1]._prepare_validated_reverse_state_prompts_dict()  # pylint: disable=protected-access
+    devices[0]._prepare_validated_reverse_state_prompts_dict()  # pylint: disable=protected-access
+    devices[2]._prepare_validated_reverse_state_prompts_dict()  # pylint: disable=protected-access
+    assert list(TextualDevice._validated_prompts_tables.keys()) == [keys[0], keys[2]]  # pylint: disable=protected-access
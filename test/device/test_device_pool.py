@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+import os
+import threading
+import time
+
+import mock
+import pytest
+
+from moler.device.device_pool import DevicePool
+from moler.exceptions import MolerTimeout, WrongUsage
+
+
+def test_device_pool_hands_out_devices_in_target_state(device_factory):
+    with DevicePool(source_device='UNIX_LOCAL', size=2) as pool:
+        assert pool.free_devices_count() == 2
+        with pool.device() as dev1:
+            assert dev1.current_state == 'UNIX_LOCAL'
+            assert dev1.name.startswith('UNIX_LOCAL_POOL_')
+            with pool.device() as dev2:
+                assert dev1 is not dev2
+                assert pool.free_devices_count() == 0
+        assert pool.free_devices_count() == 2
+
+
+def test_device_pool_resets_device_on_return(device_factory):
+    with DevicePool(source_device='UNIX_LOCAL', size=1) as pool:
+        with pool.device() as dev:
+            dev.goto_state('NOT_CONNECTED')
+        assert dev.current_state == 'UNIX_LOCAL'
+        assert pool.evicted == 0
+
+
+def test_device_pool_evicts_unhealthy_device(device_factory):
+    with DevicePool(source_device='UNIX_LOCAL', size=1, is_healthy=lambda device: False) as pool:
+        with pool.device() as dev:
+            pass
+        assert pool.evicted == 1
+        with pool.device() as new_dev:
+            assert new_dev is not dev
+            assert new_dev.current_state == 'UNIX_LOCAL'
+
+
+def test_device_pool_acquire_timeout(device_factory):
+    with DevicePool(source_device='UNIX_LOCAL', size=1) as pool:
+        with pool.device():
+            with pytest.raises(MolerTimeout):
+                pool.acquire(timeout=0.1)
+
+
+def test_device_pool_rejects_second_release(device_factory):
+    with DevicePool(source_device='UNIX_LOCAL', size=1) as pool:
+        dev = pool.acquire()
+        pool.release(dev)
+        with pytest.raises(WrongUsage, match="already given back"):
+            pool.release(dev)
+        assert pool.free_devices_count() == 1
+
+
+def test_device_pool_close_wakes_up_waiting_acquire(device_factory):
+    pool = DevicePool(source_device='UNIX_LOCAL', size=1)
+    dev = pool.acquire()
+    errors = []
+
+    def acquire():
+        try:
+            pool.acquire(timeout=10)
+        except WrongUsage as exc:
+            errors.append(exc)
+
+    waiting = threading.Thread(target=acquire)
+    waiting.start()
+    time.sleep(0.1)
+    pool.close()
+    waiting.join(timeout=2)
+    assert not waiting.is_alive()
+    assert len(errors) == 1
+    pool.release(dev)
+
+
+def test_device_pool_does_not_mask_exception_raised_when_device_used(device_factory):
+    with DevicePool(source_device='UNIX_LOCAL', size=1, is_healthy=lambda device: False) as pool:
+        pool._create_device = mock.Mock(side_effect=RuntimeError("no clone"))  # pylint: disable=protected-access
+        with pytest.raises(ValueError):
+            with pool.device():
+                raise ValueError("device used wrongly")
+        assert pool.evicted == 1
+
+
+def test_device_pool_removes_device_when_closed_during_reset(device_factory):
+    def close_pool(device):
+        pool.close()
+        return True
+
+    pool = DevicePool(source_device='UNIX_LOCAL', size=1, is_healthy=close_pool)
+    dev = pool.acquire()
+    pool.release(dev)
+    assert pool.free_devices_count() == 0
+    assert pool._all_devices == []  # pylint: disable=protected-access
+    with pytest.raises(KeyError):
+        device_factory._devices[dev.name]  # pylint: disable=protected-access
+
+
+def test_device_pool_creates_device_in_acquire_when_replacement_failed(device_factory):
+    with DevicePool(source_device='UNIX_LOCAL', size=1, is_healthy=lambda device: False) as pool:
+        dev = pool.acquire()
+        with mock.patch.object(pool, "_create_device", side_effect=RuntimeError("no clone")):
+            pool.release(dev)
+            with pytest.raises(RuntimeError):
+                pool.acquire(timeout=1)
+        assert pool.evicted == 1
+        assert pool.free_devices_count() == 0
+        new_dev = pool.acquire(timeout=1)
+        assert new_dev is not dev
+        assert new_dev.current_state == 'UNIX_LOCAL'
+        pool._is_healthy = None  # pylint: disable=protected-access
+        pool.release(new_dev)
+        assert pool.free_devices_count() == 1
+
+
+def test_device_pool_wrong_size(device_factory):
+    with pytest.raises(WrongUsage):
+        DevicePool(source_device='UNIX_LOCAL', size=0)
+
+
+# --------------------------- resources ---------------------------
+
+
+@pytest.fixture
+def device_factory(clear_all_cfg):
+    import moler.config as moler_cfg
+    from moler.device.device import DeviceFactory as dev_factory
+    conn_config = os.path.join(os.path.dirname(__file__), os.pardir, "resources", "device_config.yml")
+    moler_cfg.load_config(config=conn_config, config_type='yaml')
+    yield dev_factory
+
+
+@pytest.fixture
+def clear_all_cfg():
+    import mock
+    import moler.config as moler_cfg
+    import moler.config.connections as conn_cfg
+    import moler.config.devices as dev_cfg
+    from moler.device.device import DeviceFactory as dev_factory
+
+    empty_loaded_config = ["NOT_LOADED_YET"]
+    default_connection = {"io_type": "terminal", "variant": "threaded"}
+
+    with mock.patch.object(conn_cfg, "default_variant", {}):
+        with mock.patch.object(conn_cfg, "named_connections", {}):
+            with mock.patch.object(moler_cfg, "loaded_config", empty_loaded_config):
+                with mock.patch.object(dev_cfg, "named_devices", {}):
+                    with mock.patch.object(dev_cfg, "default_connection", default_connection):
+                        with mock.patch.object(dev_factory, "_devices", {}):
+                            with mock.patch.object(dev_factory, "_devices_params", {}):
+                                with mock.patch.object(dev_factory, "_unique_names", {}):
+                                    with mock.patch.object(dev_factory, "_already_used_names", set()):
+                                        with mock.patch.object(dev_factory, "_was_any_device_deleted", False):
+                                            yield conn_cfg
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from moler.connection_observer import ConnectionObserver
+from moler.device.device import DeviceFactory
+from moler.device.fan_out import DevicesFanOut, goto_state_on_devices
+from moler.device.unixlocal import UnixLocal
+from moler.exceptions import (CommandFailure, DeviceChangeStateFailure, MolerTimeout, NoResultSinceCancelCalled,
+                              WrongUsage)
+from moler.util.devices_SM import DeviceCM, _prepare_device, get_memory_device_connection
+
+
+def test_fan_out_runs_command_on_all_devices(unix_local_devices):
+    fan_out = DevicesFanOut(cmd_name="pwd", devices=unix_local_devices, max_concurrency=1)
+    results = fan_out.run()
+    assert len(results) == 2
+    for device in unix_local_devices:
+        outcome = results[device.name]
+        assert outcome.succeeded is True
+        assert outcome.result == {'full_path': '/home/user', 'path_to_current': '/home', 'current_path': 'user'}
+        assert outcome.duration >= 0
+
+
+def test_fan_out_selects_devices_by_name_and_type(unix_local_devices):
+    fan_out = DevicesFanOut(cmd_name="pwd", device_names=[unix_local_devices[0].name], device_type=UnixLocal)
+    assert fan_out.devices[0] is unix_local_devices[0]
+    assert len(fan_out.devices) == len(set(fan_out.devices))
+    for device in unix_local_devices:
+        assert device in fan_out.devices
+
+
+def test_fan_out_yields_outcomes_as_completed(unix_local_devices):
+    fan_out = DevicesFanOut(cmd_name="pwd", devices=unix_local_devices, max_concurrency=1)
+    device_names = [outcome.device_name for outcome in fan_out.as_completed()]
+    assert device_names == [device.name for device in unix_local_devices]
+
+
+def test_fan_out_stores_exception_per_device(unix_local_devices):
+    fan_out = DevicesFanOut(cmd_name="ls", cmd_params={'options': '-l'}, devices=unix_local_devices)
+    results = fan_out.run()
+    for outcome in results.values():
+        assert outcome.succeeded is False
+        assert isinstance(outcome.exception, CommandFailure)
+
+
+def test_fan_out_global_deadline(unix_local_devices):
+    fan_out = DevicesFanOut(cmd_name="pwd", devices=unix_local_devices, timeout=0)
+    results = fan_out.run()
+    for outcome in results.values():
+        assert isinstance(outcome.exception, MolerTimeout)
+
+
+def test_fan_out_cancel_wakes_up_waiting_for_completion():
+    fan_out = DevicesFanOut(cmd_name="never_ending", devices=[NeverEndingDevice(name=f"NEVER_{number}")
+                                                              for number in range(2)])
+    canceller = threading.Timer(0.3, fan_out.cancel)
+    canceller.start()
+    start_time = time.monotonic()
+    results = fan_out.run()
+    canceller.join()
+    assert time.monotonic() - start_time < 5
+    for outcome in results.values():
+        assert isinstance(outcome.exception, NoResultSinceCancelCalled)
+        assert outcome.command.cancelled() is True
+
+
+def test_fan_out_can_run_only_once(unix_local_devices):
+    fan_out = DevicesFanOut(cmd_name="pwd", devices=unix_local_devices)
+    fan_out.run()
+    with pytest.raises(WrongUsage):
+        fan_out.run()
+
+
+def test_goto_state_on_devices(unix_local_devices):
+    results = goto_state_on_devices(devices=unix_local_devices, state="UNIX_LOCAL_ROOT", max_concurrency=2)
+    for device in unix_local_devices:
+        assert results[device.name].succeeded is True
+        assert device.current_state == "UNIX_LOCAL_ROOT"
+    results = goto_state_on_devices(devices=unix_local_devices, state="UNIX_LOCAL", max_concurrency=2)
+    for device in unix_local_devices:
+        assert results[device.name].succeeded is True
+        assert device.current_state == "UNIX_LOCAL"
+
+
+def test_goto_state_on_devices_stores_exception_per_device(unix_local_devices):
+    results = goto_state_on_devices(devices=unix_local_devices, state="NOT_EXISTING_STATE")
+    for device in unix_local_devices:
+        assert results[device.name].succeeded is False
+        assert results[device.name].exception is not None
+        assert device.current_state == "UNIX_LOCAL"
+
+
+def test_goto_state_async(unix_local_devices):
+    device = unix_local_devices[0]
+    asyncio.run(device.goto_state_async(state="UNIX_LOCAL_ROOT"))
+    assert device.current_state == "UNIX_LOCAL_ROOT"
+    asyncio.run(device.goto_state_async(state="UNIX_LOCAL"))
+    assert device.current_state == "UNIX_LOCAL"
+
+
+def test_goto_state_on_devices_called_from_running_loop(unix_local_devices):
+    async def change_state():
+        return goto_state_on_devices(devices=unix_local_devices, state="UNIX_LOCAL_ROOT")
+
+    results = asyncio.run(change_state())
+    for device in unix_local_devices:
+        assert results[device.name].succeeded is True
+        assert device.current_state == "UNIX_LOCAL_ROOT"
+    goto_state_on_devices(devices=unix_local_devices, state="UNIX_LOCAL")
+
+
+def test_goto_state_on_devices_deadline_waits_for_hops_in_progress(unix_local_devices):
+    results = goto_state_on_devices(devices=unix_local_devices, state="UNIX_LOCAL_ROOT", timeout=0.01,
+                                    sleep_after_changed_state=0.3)
+    states = [device.current_state for device in unix_local_devices]
+    time.sleep(0.5)
+    assert [device.current_state for device in unix_local_devices] == states
+    for device in unix_local_devices:
+        assert isinstance(results[device.name].exception, MolerTimeout)
+    goto_state_on_devices(devices=unix_local_devices, state="UNIX_LOCAL")
+
+
+def test_stopped_goto_state_does_not_start_next_hop(unix_local_devices):
+    device = unix_local_devices[0]
+    stop_event = threading.Event()
+    stop_event.set()
+    device._goto_state_stop.event = stop_event  # pylint: disable=protected-access
+    try:
+        with pytest.raises(DeviceChangeStateFailure):
+            device.goto_state(state="UNIX_LOCAL_ROOT")
+    finally:
+        device._goto_state_stop.event = None  # pylint: disable=protected-access
+    assert device.current_state == "UNIX_LOCAL"
+
+
+def test_fan_out_wrong_concurrency():
+    with pytest.raises(WrongUsage):
+        DevicesFanOut(cmd_name="pwd", devices=[], max_concurrency=0)
+
+
+class NeverEndingCommand(ConnectionObserver):
+    def start(self, timeout=None, *args, **kwargs):
+        return self  # Not started in runner, done only when cancelled.
+
+    def data_received(self, data, recv_time):
+        pass
+
+
+class NeverEndingDevice:
+    def __init__(self, name):
+        self.name = name
+
+    def get_cmd(self, cmd_name, cmd_params=None, check_state=True):
+        return NeverEndingCommand()
+
+
+@pytest.fixture(scope="module")
+def unix_local_devices():
+    output = {
+        "UNIX_LOCAL": {
+            'pwd': '/home/user\nmoler_bash#',
+            'ls -l': 'ls: cannot access: No such file or directory\nmoler_bash#',
+            'su': 'local_root_prompt',
+        },
+        "UNIX_LOCAL_ROOT": {
+            'exit': 'moler_bash#',
+        },
+    }
+    with get_memory_device_connection() as connection, get_memory_device_connection() as other_connection:
+        with DeviceCM(name="UNIX_LOCAL", connection=connection, device_output=output,
+                      test_file_path=__file__) as unix_local:
+            other_unix_local = DeviceFactory.get_cloned_device(source_device=unix_local, new_name="UNIX_LOCAL_FAN_OUT",
+                                                               io_connection=other_connection)
+            _prepare_device(device=other_unix_local, connection=other_connection, device_output=output)
+            yield [unix_local, other_unix_local]
+            DeviceFactory.remove_device(device=other_unix_local)
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+import copy
+import gc
+import multiprocessing
+import os
+import platform
+import threading
+
+import pytest
+
+from moler.config import read_yaml_configfile
+from moler.device.process_shard import DeviceShard, ShardedDevices, _ShardWorker
+from moler.exceptions import MolerException, MolerTimeout, WrongUsage
+
+
+pytestmark = pytest.mark.skipif('Linux' != platform.system(), reason="Worker process uses local terminal.")
+
+
+def test_device_shard_hosts_device_in_worker_process(device_shard):
+    device = device_shard.get_device("UNIX_LOCAL")
+    assert device.current_state == "UNIX_LOCAL"
+    result = device.get_cmd(cmd_name="pwd")()
+    assert 'full_path' in result
+    assert result == device.run("pwd")
+
+
+def test_device_shard_keeps_observer_till_proxy_is_released(device_shard):
+    device = device_shard.get_device("UNIX_LOCAL")
+    cmd = device.get_cmd(cmd_name="pwd")
+    result = cmd()
+    assert cmd.done() is True
+    assert cmd.result() == result
+    observer_id = cmd._observer_id
+    cmd.release()
+    with pytest.raises(MolerException):
+        device_shard.call("result", observer_id, timeout=10)
+
+    cmd = device.get_cmd(cmd_name="pwd")
+    observer_id = cmd._observer_id
+    del cmd
+    gc.collect()
+    with pytest.raises(MolerException):
+        device_shard.call("result", observer_id, timeout=10)  # Released by finalizer of proxy.
+
+
+def test_device_shard_call_raises_moler_timeout(device_shard):
+    device = device_shard.get_device("UNIX_LOCAL")
+    event = device.get_event(event_name="wait4prompts", event_params={"prompts": {r"^never_seen_prompt#": "X"},
+                                                                      "till_occurs_times": 1})
+    event.start(timeout=5)
+    with pytest.raises(MolerTimeout):
+        device_shard.call("await_done", event._observer_id, None, timeout=0.2)
+    assert device.current_state == "UNIX_LOCAL"  # Blocked await_done does not block other calls.
+    event.cancel()
+
+
+def test_device_shard_changes_state(device_shard):
+    device = device_shard.get_device("UNIX_LOCAL")
+    device.goto_state("NOT_CONNECTED")
+    assert device.current_state == "NOT_CONNECTED"
+    device.goto_state("UNIX_LOCAL")
+    assert device.current_state == "UNIX_LOCAL"
+
+
+def test_device_shard_returns_exception_from_worker_process(device_shard):
+    device = device_shard.get_device("UNIX_LOCAL")
+    with pytest.raises(MolerException):
+        device.run("ls", cmd_params={"options": "/not/existing/directory/in/the/system"})
+
+
+def test_device_shard_starts_event_in_worker_process(device_shard):
+    device = device_shard.get_device("UNIX_LOCAL")
+    event = device.get_event(event_name="wait4prompts", event_params={"prompts": {r"^moler_bash#": "UNIX_LOCAL"},
+                                                                      "till_occurs_times": 1})
+    event.start(timeout=10)
+    device.run("pwd")
+    event.await_done()
+    assert event.done() is True
+
+
+def test_device_shard_cannot_be_used_after_close(device_shard_config):
+    shard = DeviceShard(config=device_shard_config, device_names=["UNIX_LOCAL"])
+    shard.close()
+    with pytest.raises(WrongUsage):
+        shard.get_device("UNIX_LOCAL").current_state
+
+
+def test_sharded_devices_require_shards_in_config(device_shard_config):
+    with pytest.raises(WrongUsage):
+        ShardedDevices.from_config(config=device_shard_config)
+
+
+def test_sharded_devices_are_created_from_config(device_shard_config):
+    config = copy.deepcopy(device_shard_config)
+    config["PROCESS_SHARDS"] = {"SHARD_1": ["UNIX_LOCAL"], "SHARD_2": ["UNIX_LOCAL_TO_CLONE"]}
+    with ShardedDevices.from_config(config=config) as sharded_devices:
+        assert sorted(sharded_devices.shards) == ["SHARD_1", "SHARD_2"]
+        device = sharded_devices.get_device("UNIX_LOCAL_TO_CLONE")
+        assert device._shard is sharded_devices.shards["SHARD_2"]
+        cmd = device.get_cmd(cmd_name="pwd")
+        assert cmd() == cmd.result()
+        with pytest.raises(KeyError):
+            sharded_devices.get_device("NOT_EXISTING")
+
+
+def test_shard_worker_replaces_not_picklable_reply():
+    main_end, worker_end = multiprocessing.Pipe()
+    worker = _ShardWorker.__new__(_ShardWorker)  # Without devices.
+    worker._connection = worker_end
+    worker._send_lock = threading.Lock()
+    worker._startup_exception = None
+    worker._do_ping = lambda: threading.Lock()
+    worker._do_cancel = lambda: _raise(NotRecreatedError("code", "reason"))
+    try:
+        worker._handle(1, "ping", ())
+        worker._handle(2, "cancel", ())
+        request_id, is_ok, value = main_end.recv()
+        assert (request_id, is_ok, type(value)) == (1, False, MolerException)
+        assert "Not picklable result" in str(value)
+        request_id, is_ok, value = main_end.recv()
+        assert (request_id, is_ok, type(value)) == (2, False, MolerException)
+        assert "NotRecreatedError" in str(value)
+    finally:
+        main_end.close()
+        worker_end.close()
+
+
+class NotRecreatedError(Exception):
+    def __init__(self, code, reason):
+        super(NotRecreatedError, self).__init__(f"{code}: {reason}")
+
+
+def _raise(exc):
+    raise exc
+
+
+@pytest.fixture(scope="module")
+def device_shard_config(tmp_path_factory):
+    config = read_yaml_configfile(os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, "resources",
+                                                               "device_config.yml")))
+    config["LOGGER"]["PATH"] = str(tmp_path_factory.mktemp("shard_logs"))  # Logs of worker processes.
+    return config
+
+
+@pytest.fixture(scope="module")
+def device_shard(device_shard_config):
+    with DeviceShard(config=device_shard_config, device_names=["UNIX_LOCAL"], name="TEST_SHARD") as shard:
+        yield shard
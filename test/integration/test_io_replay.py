@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Testing external-IO connection replaying recorded sessions.
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+import time
+
+import pytest
+
+from moler.connection_factory import get_connection
+from moler.exceptions import WrongUsage
+from moler.io.raw.replay import ThreadedReplay, get_raw_trace_log_path, read_raw_log_session
+from moler.threaded_moler_connection import ThreadedMolerConnection
+from moler.util.session_recording import SessionRecordingWriter
+
+
+def test_replays_raw_log_and_answers_send_with_recorded_response(raw_log_path):
+    connection = get_connection(io_type="replay", path=raw_log_path)
+    received = []
+
+    def receiver(data, time_recv):
+        received.append(data)
+
+    connection.moler_connection.subscribe(receiver, connection_closed_handler)
+    with connection.open():
+        assert not connection.wait_for_replay_end(timeout=0.3)  # Waits for send of 'pwd'.
+        assert "".join(received) == "user@host:~$ "
+        connection.moler_connection.sendline("pwd")
+        assert connection.wait_for_replay_end(timeout=2)
+    assert "".join(received) == "user@host:~$ pwd\n/home/user\nuser@host:~$ "
+    assert connection.replayed_records == 2
+
+
+def test_raw_log_session_is_read_with_its_trace_log(raw_log_path):
+    assert get_raw_trace_log_path("logs/UNIX_LOCAL.raw.suffix1.log") == "logs/UNIX_LOCAL.raw.trace.suffix1.log"
+    records = list(read_raw_log_session(raw_log_path))
+    assert [(record.time, record.direction, record.data) for record in records] == [
+        (0.0, "<", b"user@host:~$ "), (pytest.approx(1.5), ">", b"pwd\n"),
+        (pytest.approx(1.75), "<", b"pwd\n/home/user\nuser@host:~$ ")]
+    assert [record.offset for record in records] == [0, 13, 17]
+
+
+@pytest.mark.parametrize("missing_file", ["replay.raw.log", "replay.raw.trace.log"])
+def test_open_raises_when_raw_log_or_trace_log_is_missing(raw_log_path, tmp_path, missing_file):
+    (tmp_path / missing_file).unlink()
+    connection = get_connection(io_type="replay", path=raw_log_path)
+    with pytest.raises(FileNotFoundError):
+        connection.open()
+    assert connection.pulling_thread is None
+    assert not connection.wait_for_replay_end(timeout=0.01)
+
+
+def test_command_runs_on_replayed_recording(recording_path):
+    from moler.cmd.unix.pwd import Pwd
+    with SessionRecordingWriter(recording_path) as writer:
+        writer.write(direction="<", data=b"user@host:~$ ", timestamp=0.0)
+        writer.write(direction=">", data=b"pwd\n", timestamp=30.0)
+        writer.write(direction="<", data=b"pwd\n/home/user\nuser@host:~$ ", timestamp=30.1)
+    connection = get_connection(io_type="replay", path=recording_path)
+    with connection.open():
+        cmd = Pwd(connection=connection.moler_connection, prompt=r"user@host:~\$")
+        assert cmd(timeout=5) == {"full_path": "/home/user", "path_to_current": "/home", "current_path": "user"}
+        assert connection.wait_for_replay_end(timeout=2)
+
+
+def test_scaled_replay_keeps_scaled_timing_of_recording(recording_path):
+    with SessionRecordingWriter(recording_path) as writer:
+        for number in range(3):
+            writer.write(direction="<", data=f"line {number}\n".encode("utf-8"), timestamp=number * 1.0)
+    moler_conn = ThreadedMolerConnection(decoder=lambda data: data.decode("utf-8"))
+    connection = ThreadedReplay(moler_connection=moler_conn, path=recording_path, mode="scaled", speed=10,
+                                wait_for_send=False)
+    start_time = time.monotonic()
+    with connection.open():
+        assert connection.wait_for_replay_end(timeout=2)
+        duration = time.monotonic() - start_time
+    assert 0.2 <= duration < 1.0
+    with pytest.raises(WrongUsage):
+        ThreadedReplay(moler_connection=moler_conn, path=recording_path, mode="slow")
+
+
+def connection_closed_handler():
+    pass
+
+
+@pytest.fixture
+def raw_log_path(tmp_path):
+    raw_log = tmp_path / "replay.raw.log"
+    raw_log.write_bytes(b"user@host:~$ pwd\npwd\n/home/user\nuser@host:~$ ")
+    (tmp_path / "replay.raw.trace.log").write_text(
+        "- 1536862639.25: {time: '20:17:19.250', direction: <, bytesize: 13, offset: 0}\n"
+        "- 1536862640.75: {time: '20:17:20.750', direction: >, bytesize: 4, offset: 13}\n"
+        "- 1536862641.0: {time: '20:17:21.000', direction: <, bytesize: 28, offset: 17}\n")
+    return str(raw_log)
+
+
+@pytest.fixture
+def recording_path(tmp_path):
+    return str(tmp_path / "replay.raw.rec")
@@ -8,7 +8,7 @@ from pytest import mark, raises
 from moler.command import Command
 
 __author__ = 'Michal Plichta, Michal Ernst'
-__copyright__ = 'Copyright (C) 2018-2019, Nokia'
+__copyright__ = 'Copyright (C) 2018-2026, Nokia'
 __email__ = 'michal.plichta@nokia.com, michal.ernst@nokia.com'
 
 cmd_dir_under_test = 'moler/cmd/'
@@ -68,6 +68,36 @@ def test_documentation_exists():
     assert check_if_documentation_exists(events_path) is True
 
 
+def test_documentation_checked_in_processes_reported_in_same_order(capsys):
+    from moler.util.cmds_events_doc import check_if_documentation_exists
+
+    events_path = path.join(repo_path, "moler", "events")
+
+    assert check_if_documentation_exists(events_path) is True
+    serial_output = capsys.readouterr().out
+    assert check_if_documentation_exists(events_path, processes=2) is True
+    parallel_output = capsys.readouterr().out
+
+    def processed_classes(output):
+        return [line.split("...")[0] for line in output.splitlines() if line.startswith("processing: ")]
+
+    assert processed_classes(serial_output)
+    assert processed_classes(parallel_output) == processed_classes(serial_output)
+
+
+def test_check_documentation_of_module_returns_errors_per_class():
+    from moler.util.cmds_events_doc import _check_documentation_of_module
+
+    results = _check_documentation_of_module(path.join("moler", "cmd", "unix", "uname.py"),
+                                             path.join(repo_path, "moler", "cmd"))
+    assert len(results) == 1
+    class_name, class_str, duration, errors = results[0]
+    assert class_name == "Uname"
+    assert "moler.cmd.unix.uname.Uname" in class_str
+    assert duration >= 0
+    assert errors == []
+
+
 def test_buffer_connection_returns_threadconnection_with_moler_conn():
     from moler.io.raw.memory import ThreadedFifoBuffer
     from moler.threaded_moler_connection import ThreadedMolerConnection
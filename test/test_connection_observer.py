@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
 __author__ = 'Grzegorz Latuszek, Marcin Usielski'
-__copyright__ = 'Copyright (C) 2018-2025, Nokia'
+__copyright__ = 'Copyright (C) 2018-2026, Nokia'
 __email__ = 'grzegorz.latuszek@nokia.com, marcin.usielski@nokia.com'
 
 import importlib
@@ -160,6 +160,30 @@ def test_connection_observer_is_not_running_after_it_is_done(do_nothing_connecti
     assert not connection_observer.running()
 
 
+def test_connection_observer_can_wait_for_being_in_runner(do_nothing_connection_observer__for_major_base_class,
+                                                          connection_to_remote):
+    connection_observer = do_nothing_connection_observer__for_major_base_class
+    connection_observer.connection = connection_to_remote.moler_connection
+    connection_observer.start()
+    assert connection_observer.wait_for_in_runner(in_runner=True, timeout=2) is True
+    assert connection_observer.is_in_runner() is True
+    connection_observer.cancel()
+    assert connection_observer.wait_for_in_runner(in_runner=False, timeout=2) is True
+    assert connection_observer.is_in_runner() is False
+
+
+def test_connection_observer_can_wait_for_being_in_single_thread_runner(
+        do_nothing_connection_observer__for_major_base_class, buffer_connection):
+    connection_observer = do_nothing_connection_observer__for_major_base_class
+    connection_observer.connection = buffer_connection.moler_connection
+    assert connection_observer.wait_for_in_runner(in_runner=True, timeout=0.1) is False
+    connection_observer.start()
+    assert connection_observer.wait_for_in_runner(in_runner=True, timeout=2) is True
+    connection_observer.cancel()
+    assert connection_observer.wait_for_in_runner(in_runner=False, timeout=2) is True
+    assert connection_observer.is_in_runner() is False
+
+
 def test_connection_observer_call_passes_positional_arguments_to_start(
         do_nothing_connection_observer_class__for_major_base_class):
     called_with_params = []
@@ -266,6 +290,20 @@ def test_cancel_returns_true_if_connection_observer_is_not_cancelled_nor_done(
     assert connection_observer.cancel() == True
 
 
+def test_done_callbacks_are_called_once_when_connection_observer_is_done(
+        do_nothing_connection_observer__for_major_base_class):
+    connection_observer = do_nothing_connection_observer__for_major_base_class
+    called = []
+    connection_observer.add_done_callback(called.append)
+    connection_observer.add_done_callback(lambda observer: 1 / 0)  # Exception of callback is only logged.
+    assert called == []
+    connection_observer.set_result(14361)
+    connection_observer.cancel()
+    assert called == [connection_observer]
+    connection_observer.add_done_callback(called.append)  # Already done, called at once.
+    assert called == [connection_observer, connection_observer]
+
+
 def test_can_retrieve_connection_observer_result_after_setting_result(
         do_nothing_connection_observer__for_major_base_class):
     connection_observer = do_nothing_connection_observer__for_major_base_class
@@ -493,6 +531,29 @@ def test_connection_observer_exception_do_not_remove():
     assert 0 == len(none_exceptions)
 
 
+def test_connection_observer_unraised_exceptions_summary_per_observer_class():
+    ConnectionObserver.get_unraised_exceptions(True)
+    from moler.cmd.unix.ls import Ls
+    from moler.cmd.unix.pwd import Pwd
+    from moler.exceptions import CommandTimeout, WrongUsage
+    commands = [Ls(None) for _ in range(100)] + [Pwd(None)]
+    for cmd in commands[:-1]:
+        cmd.set_exception(CommandTimeout(cmd, 0.1))
+        cmd._is_done = True
+    commands[-1].set_exception(WrongUsage("Wrong parameter"))
+    commands[-1]._is_done = True
+    summary = ConnectionObserver.get_unraised_exceptions_summary()
+    assert summary == {"moler.cmd.unix.ls.Ls": {"CommandTimeout": 100}, "moler.cmd.unix.pwd.Pwd": {"WrongUsage": 1}}
+    with pytest.raises(WrongUsage):
+        commands[-1].result()
+    with pytest.raises(CommandTimeout):
+        commands[0].result()
+    assert ConnectionObserver.get_unraised_exceptions_summary() == {"moler.cmd.unix.ls.Ls": {"CommandTimeout": 99}}
+    active_exceptions = ConnectionObserver.get_unraised_exceptions(True)
+    assert active_exceptions == [cmd._exception for cmd in commands[1:-1]]
+    assert ConnectionObserver.get_unraised_exceptions_summary() == {}
+
+
 # --------------------------- resources ---------------------------
 
 
@@ -6,7 +6,7 @@ Event is a type of ConnectionObserver.
 """
 
 __author__ = 'Michal Ernst, Marcin Usielski'
-__copyright__ = 'Copyright (C) 2018-2025, Nokia'
+__copyright__ = 'Copyright (C) 2018-2026, Nokia'
 __email__ = 'michal.ernst@nokia.com, marcin.usielski@nokia.com'
 
 import importlib
@@ -178,6 +178,62 @@ def test_event_unicode_error(buffer_connection):
     assert occurrence == dict_output
 
 
+def test_event_stores_last_occurrences_only(buffer_connection):
+    from moler.events.unix.wait4prompt import Wait4prompt
+    event = Wait4prompt(connection=buffer_connection.moler_connection, prompt="bash", till_occurs_times=5)
+    event.set_occurrences_retention(max_stored=2)
+    for nr in range(5):
+        event.event_occurred(event_data={'nr': nr})
+    assert event.done() is True
+    assert event.occurrences_count == 5
+    assert event.result() == [{'nr': 3}, {'nr': 4}]
+    assert event.get_last_occurrence() == {'nr': 4}
+
+
+def test_event_counts_occurrences_only_and_streams_them(buffer_connection):
+    from moler.events.unix.wait4prompt import Wait4prompt
+    streamed = []
+    event = Wait4prompt(connection=buffer_connection.moler_connection, prompt="bash", till_occurs_times=3)
+    event.set_occurrences_retention(max_stored=0, stream_callback=streamed.append)
+    for nr in range(3):
+        event.event_occurred(event_data={'nr': nr})
+    assert event.done() is True
+    assert event.occurrences_count == 3
+    assert event.result() == []
+    assert event.get_last_occurrence() == {'nr': 2}
+    assert streamed == [{'nr': 0}, {'nr': 1}, {'nr': 2}]
+
+
+def test_event_wrong_occurrences_retention(buffer_connection):
+    from moler.events.unix.wait4prompt import Wait4prompt
+    event = Wait4prompt(connection=buffer_connection.moler_connection, prompt="bash")
+    with pytest.raises(MolerException):
+        event.set_occurrences_retention(max_stored=-1)
+
+
+def test_event_matches_tail_of_long_not_full_line(buffer_connection):
+    from moler.events.unix.wait4prompt import Wait4prompt
+    event = Wait4prompt(connection=buffer_connection.moler_connection, prompt="bash$", till_occurs_times=1)
+    event.partial_line_window = 20
+    for _ in range(1000):
+        event.data_received("0123456789", datetime.datetime.now())
+    assert event.done() is False
+    event.data_received("bash", datetime.datetime.now())
+    assert event.done() is True
+    assert event.get_last_occurrence()['line'] == "01234567890123456789bash"
+
+
+def test_event_passes_too_long_not_full_line_as_full_line(buffer_connection):
+    from moler.events.unix.wait4prompt import Wait4prompt
+    event = Wait4prompt(connection=buffer_connection.moler_connection, prompt="^bash$", till_occurs_times=1)
+    event.max_partial_line_length = 20
+    event.data_received("0123456789" * 3, datetime.datetime.now())
+    assert event._partial_line.is_empty() is True  # pylint: disable=protected-access
+    event.data_received("bash", datetime.datetime.now())
+    assert event.done() is True
+    assert event.get_last_occurrence()['line'] == "bash"
+
+
 def test_get_not_supported_parser():
     le = LineEvent(connection=None, detect_patterns=['Sample pattern'], match='not_supported_value')
     le._get_parser()
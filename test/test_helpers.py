@@ -103,6 +103,25 @@ def test_converterhelper_bytes():
     assert 'b' == unit
 
 
+def test_converterhelper_parse_date_learns_format():
+    import datetime
+    from moler.util.converterhelper import ConverterHelper
+    assert ConverterHelper.parse_date("Thu Nov 23 10:38:17 2017") == datetime.datetime(2017, 11, 23, 10, 38, 17)
+    assert ConverterHelper._learned_date_formats["aaa aaa 00 00:00:00 0000"] == "%a %b %d %H:%M:%S %Y"
+    with mock.patch("moler.util.converterhelper.parser.parse") as dateutil_parse:
+        assert ConverterHelper.parse_date("Fri Dec 24 11:39:18 2017") == datetime.datetime(2017, 12, 24, 11, 39, 18)
+    assert dateutil_parse.called is False
+
+
+def test_converterhelper_parse_date_falls_back_to_dateutil():
+    import datetime
+    from moler.util.converterhelper import ConverterHelper
+    date = ConverterHelper.parse_date("Sun Jan  6 13:42:05 UTC+2 2019")
+    assert date.utcoffset() == datetime.timedelta(hours=-2)
+    assert ConverterHelper.parse_date("Sun Jan  7 13:42:05 UTC+2 2019").day == 7
+    assert ConverterHelper.parse_date("2019-01-30 10:00:01.5") == datetime.datetime(2019, 1, 30, 10, 0, 1, 500000)
+
+
 def test_copy_list():
     from moler.helpers import copy_list
     src = [1]
@@ -4,7 +4,7 @@ Testing connection observer runner
 """
 
 __author__ = 'Grzegorz Latuszek'
-__copyright__ = 'Copyright (C) 2019, Nokia'
+__copyright__ = 'Copyright (C) 2019-2026, Nokia'
 __email__ = 'grzegorz.latuszek@nokia.com'
 
 import time
@@ -153,6 +153,20 @@ def test_ThreadPoolExecutorRunner_logs_about_reused_executor():
     external_executor.shutdown()
 
 
+def test_ThreadPoolExecutorRunner_notifies_about_running_state_without_polling(connection_observer, observer_runner):
+    with observer_runner:
+        with mock.patch.object(observer_runner, "is_connection_observer_running") as polled_check:
+            assert observer_runner.wait_for_running_state(connection_observer, running=True, timeout=0.05) is False
+        polled_check.assert_not_called()
+        connection_observer.runner = observer_runner
+        connection_observer.start()
+        assert observer_runner.wait_for_running_state(connection_observer, running=True, timeout=2) is True
+        assert observer_runner.is_connection_observer_running(connection_observer) is True
+        connection_observer.cancel()
+        assert observer_runner.wait_for_running_state(connection_observer, running=False, timeout=2) is True
+        assert observer_runner.is_connection_observer_running(connection_observer) is False
+
+
 # --------------------------- resources ---------------------------
 
 
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for table stored by columns.
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+from array import array
+
+import pytest
+
+from moler.util.columnar_table import ColumnarTable
+
+
+def test_columnar_table_infers_types_of_columns():
+    table = ColumnarTable(columns=["PID", "CPU", "SZ", "CMD"])
+    table.append(["1", "0.5", "-", "init"])
+    table.append(["20", "1.", "42", "[kthreadd]"])
+    assert table.column("PID") == array('q', [1, 20])
+    assert table.column("CPU") == array('d', [0.5, 1.0])
+    assert table.column("SZ") == ["-", 42]
+    assert table.column("CMD") == ["init", "[kthreadd]"]
+    assert table[1] == {"PID": 20, "CPU": 1.0, "SZ": 42, "CMD": "[kthreadd]"}
+    assert table == [{"PID": 1, "CPU": 0.5, "SZ": "-", "CMD": "init"},
+                     {"PID": 20, "CPU": 1.0, "SZ": 42, "CMD": "[kthreadd]"}]
+
+
+def test_columnar_table_rows_with_missing_cells_and_new_rows_after_read():
+    table = ColumnarTable(columns=["PID", "CMD"])
+    table.append(["1", "init", "ignored"])
+    assert table[0] == {"PID": 1, "CMD": "init"}
+    table.append(["2"])
+    assert table[-1] == {"PID": 2}
+    assert table.column("PID") == [1, 2]
+    with pytest.raises(IndexError):
+        table[2]
+
+
+def test_columnar_table_without_conversion():
+    table = ColumnarTable(columns=["PID", "NAME"], convert_numbers=False)
+    table.append(["1", None])
+    assert table[0] == {"PID": "1", "NAME": None}
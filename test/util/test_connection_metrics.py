@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for metrics of connections.
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+import datetime
+import json
+import time
+
+import pytest
+
+from moler.exceptions import WrongUsage
+from moler.threaded_moler_connection import ThreadedMolerConnection
+from moler.util.connection_metrics import LatencyHistogram, MetricsExporter
+
+
+def test_latency_histogram_percentiles_within_precision():
+    histogram = LatencyHistogram()
+    for value_us in range(1, 10001):
+        histogram.record(value_us / 1000000.)
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 10000
+    assert snapshot["min"] == 0.000001
+    assert snapshot["max"] == 0.01
+    assert snapshot["p50"] == pytest.approx(0.005, rel=0.07)
+    assert snapshot["p99"] == pytest.approx(0.0099, rel=0.07)
+    assert histogram.percentile(100) == 0.01
+    histogram.reset()
+    assert histogram.snapshot()["count"] == 0
+    assert histogram.percentile(50) == 0.0
+
+
+def test_connection_counts_data_in_and_out(metrics_connection):
+    received = []
+
+    def observer(data, recv_time):
+        received.append(data)
+
+    metrics_connection.subscribe(observer, lambda: None)
+    for _ in range(3):
+        metrics_connection.data_received(b"line 1\nline 2\n", datetime.datetime.now())
+    metrics_connection.sendline("ls")
+    _wait_for(lambda: len(received) == 3)
+
+    metrics = metrics_connection.get_metrics()
+    assert metrics["connection"] == metrics_connection.name
+    assert metrics["bytes_in"] == 42
+    assert metrics["chunks_in"] == 3
+    assert metrics["lines_in"] == 6
+    assert metrics["bytes_out"] == 3
+    assert metrics["chunks_out"] == 1
+    assert metrics["dispatch_latency"]["count"] == 3
+    assert metrics["queue_high_water_mark"] >= 1
+    assert len(metrics["observers"]) == 1
+    assert metrics["observers"][0]["queue_depth"] == 0
+
+
+def test_connection_keeps_queue_high_water_mark_of_unsubscribed_observer(metrics_connection):
+    def observer(data, recv_time):
+        time.sleep(0.05)
+
+    metrics_connection.subscribe(observer, lambda: None)
+    for _ in range(4):
+        metrics_connection.data_received(b"data\n", datetime.datetime.now())
+    metrics_connection.unsubscribe(observer, lambda: None)
+    metrics = metrics_connection.get_metrics()
+    assert metrics["observers"] == []
+    assert metrics["queue_high_water_mark"] >= 2
+
+
+@pytest.mark.parametrize("file_format", ["json", "openmetrics"])
+def test_metrics_exporter_writes_metrics_of_connections(metrics_connection, tmp_path, file_format):
+    metrics_connection.data_received(b"data\n", datetime.datetime.now())
+    path = str(tmp_path / "metrics.txt")
+    exporter = MetricsExporter(path=path, interval=0.05, file_format=file_format)
+    exporter.start()
+    exporter.stop()
+    with open(path) as metrics_file:
+        content = metrics_file.read()
+    if file_format == "json":
+        metrics = [snapshot for snapshot in json.loads(content) if snapshot["connection"] == metrics_connection.name]
+        assert metrics[0]["bytes_in"] == 5
+    else:
+        assert f'moler_connection_bytes_in_total{{connection="{metrics_connection.name}"}} 5' in content
+        assert content.endswith("# EOF\n")
+
+
+def test_metrics_exporter_rejects_unknown_format(tmp_path):
+    with pytest.raises(WrongUsage):
+        MetricsExporter(path=str(tmp_path / "metrics.txt"), file_format="xml")
+
+
+def _wait_for(condition, timeout=2.0):
+    start_time = time.monotonic()
+    while not condition() and time.monotonic() - start_time < timeout:
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def metrics_connection(request):
+    connection = ThreadedMolerConnection(how2send=lambda data: None, encoder=lambda data: data.encode("utf-8"),
+                                         decoder=lambda data: data.decode("utf-8"), name=request.node.name)
+    yield connection
+    connection.shutdown()
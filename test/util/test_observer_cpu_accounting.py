@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for accounting of CPU time of observers.
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+import datetime
+import time
+
+import pytest
+
+from moler.threaded_moler_connection import ThreadedMolerConnection
+from moler.util.observer_cpu_accounting import ObserverCpuAccounting
+
+
+def test_connection_accounts_cpu_time_of_observers_per_class(accounting_connection):
+    observer = SlowObserver()
+    accounting_connection.enable_observers_cpu_accounting(warning_threshold=0.02)
+    accounting_connection.subscribe(observer.data_received, lambda: None)
+    accounting_connection.data_received(b"fast\n", datetime.datetime.now())
+    accounting_connection.data_received(b"slow\n", datetime.datetime.now())
+    _wait_for(lambda: len(observer.received) == 2)
+    time.sleep(0.05)
+
+    usage = accounting_connection.get_observers_cpu_usage()
+    name = f"{SlowObserver.__module__}.SlowObserver"
+    assert usage[name]["calls"] == 2
+    assert usage[name]["slow_calls"] == 1
+    assert usage[name]["max_wall_time"] >= 0.03
+    assert usage[name]["wall_time"] >= usage[name]["max_wall_time"]
+    assert usage[name]["cpu_time"] >= 0
+
+    accounting_connection.disable_observers_cpu_accounting()
+    assert accounting_connection.get_observers_cpu_usage() == {}
+
+
+def test_command_cpu_time_accounted_under_class_of_command(buffer_connection):
+    from moler.cmd.unix.pwd import Pwd, COMMAND_OUTPUT, COMMAND_KWARGS
+    buffer_connection.moler_connection.enable_observers_cpu_accounting()
+    pwd = Pwd(connection=buffer_connection.moler_connection, **COMMAND_KWARGS)
+    buffer_connection.remote_inject_response([COMMAND_OUTPUT])
+    pwd(timeout=2)
+    usage = buffer_connection.moler_connection.get_observers_cpu_usage()
+    assert usage["moler.cmd.unix.pwd.Pwd"]["calls"] >= 1
+
+
+def test_cpu_accounting_enabled_globally_by_config(accounting_connection):
+    from moler.config import load_observers_cpu_accounting_from_config
+    observer = SlowObserver()
+    try:
+        load_observers_cpu_accounting_from_config({"OBSERVERS_CPU_ACCOUNTING": {"WARNING_THRESHOLD": None}})
+        assert ObserverCpuAccounting.global_accounting.warning_threshold is None
+        accounting_connection.subscribe(observer.data_received, lambda: None)
+        accounting_connection.data_received(b"slow\n", datetime.datetime.now())
+        _wait_for(lambda: len(observer.received) == 1)
+        time.sleep(0.05)
+        usage = accounting_connection.get_observers_cpu_usage()
+        assert usage[f"{SlowObserver.__module__}.SlowObserver"]["slow_calls"] == 0
+    finally:
+        ObserverCpuAccounting.disable_globally()
+    assert accounting_connection.get_observers_cpu_usage() == {}
+
+
+class SlowObserver:
+    def __init__(self):
+        self.received = []
+
+    def data_received(self, data, recv_time):
+        if "slow" in data:
+            time.sleep(0.03)
+        self.received.append(data)
+
+
+def _wait_for(condition, timeout=2.0):
+    start_time = time.monotonic()
+    while not condition() and time.monotonic() - start_time < timeout:
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def accounting_connection(request):
+    connection = ThreadedMolerConnection(how2send=lambda data: None, encoder=lambda data: data.encode("utf-8"),
+                                         decoder=lambda data: data.decode("utf-8"), name=request.node.name)
+    yield connection
+    connection.shutdown()
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for detector of observers leaked in subscriptions of moler connections.
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+import gc
+import threading
+
+import pytest
+
+from moler.connection_observer import ConnectionObserver
+from moler.moler_connection_for_single_thread_runner import MolerConnectionForSingleThreadRunner
+from moler.runner import ThreadPoolExecutorRunner
+from moler.threaded_moler_connection import ThreadedMolerConnection
+from moler.util.observers_leak_detector import ObserversLeakDetector
+
+
+def test_observers_with_dead_references_are_unsubscribed(leak_detector):
+    connection = ThreadedMolerConnection(name="leak_dead_reference")
+
+    def alive_receiver(data, recv_time):
+        pass
+
+    def dead_receiver(data, recv_time):
+        pass
+
+    connection.subscribe(alive_receiver, connection_closed_handler)
+    connection.subscribe(dead_receiver, connection_closed_handler)
+    wrapper = list(connection._observer_wrappers.values())[1]
+    del dead_receiver
+    gc.collect()
+
+    assert leak_detector.audit() == {"dead_reference": 1}
+    assert connection.get_subscribed_observers_count() == 1
+    assert wrapper._t is None  # Thread of observer stopped.
+    diagnostics = leak_detector.get_diagnostics()
+    assert diagnostics["audits"] == 1
+    assert diagnostics["removed"] == {"dead_reference": 1}
+    assert diagnostics["removed_per_connection"] == {"leak_dead_reference": {"dead_reference": 1}}
+    assert diagnostics["subscribed_observers"]["leak_dead_reference"] == 1
+    connection.shutdown()
+
+
+def test_done_and_cancelled_connection_observers_are_unsubscribed(leak_detector):
+    connection = MolerConnectionForSingleThreadRunner(name="leak_done")
+    running, done, cancelled = (DoNothingObserver(connection=connection) for _ in range(3))
+    for observer in (running, done, cancelled):
+        connection.subscribe_connection_observer(observer)
+    done.set_result(None)
+    cancelled.cancel()
+
+    assert leak_detector.audit() == {"done": 1, "cancelled": 1}
+    assert connection._connection_observers == [running]
+    assert connection.get_subscribed_observers_count() == 1
+    assert leak_detector.audit() == {}
+    connection.unsubscribe_connection_observer(done)  # Late unsubscribe of runner does nothing.
+    assert connection.get_subscribed_observers_count() == 1
+    connection.shutdown()
+
+
+@pytest.mark.parametrize("reason", ["done", "cancelled"])
+def test_done_and_cancelled_observers_fed_by_thread_pool_runner_are_unsubscribed(leak_detector, reason):
+    connection = ThreadedMolerConnection(name=f"leak_runner_{reason}")
+    runner = ThreadPoolExecutorRunner()
+    observer = DoNothingObserver(connection=connection, runner=runner)
+    data_receiver = runner._start_feeding(observer, threading.Lock())  # pylint: disable=protected-access
+    assert data_receiver.connection_observer is observer
+    assert leak_detector.audit() == {}
+    if reason == "done":
+        observer.set_result(None)
+    else:
+        observer.cancel()
+
+    assert leak_detector.audit() == {reason: 1}
+    assert connection.get_subscribed_observers_count() == 0
+    connection.shutdown()
+    runner.shutdown()
+
+
+def test_connection_observers_are_removed_under_observers_lock(leak_detector):
+    connection = MolerConnectionForSingleThreadRunner(name="leak_locked")
+    done = DoNothingObserver(connection=connection)
+    connection.subscribe_connection_observer(done)
+    done.set_result(None)
+    audit = threading.Thread(target=leak_detector.audit)
+    with connection._observers_lock:  # pylint: disable=protected-access
+        audit.start()
+        audit.join(timeout=0.2)
+        assert audit.is_alive() is True  # Waits for lock held i.e. by notify_observers.
+        assert connection._connection_observers == [done]  # pylint: disable=protected-access
+    audit.join(timeout=2)
+    assert connection._connection_observers == []  # pylint: disable=protected-access
+    connection.shutdown()
+
+
+def test_periodic_audit_is_run_once_per_interval(leak_detector):
+    leak_detector.audit_interval = 1000.0
+    assert leak_detector.audit_if_due() == {}
+    assert leak_detector.audit_if_due() is None
+    assert leak_detector.get_diagnostics()["audits"] == 1
+
+
+class DoNothingObserver(ConnectionObserver):
+    def data_received(self, data, recv_time):
+        pass
+
+
+def connection_closed_handler():
+    pass
+
+
+@pytest.fixture
+def leak_detector():
+    audit_interval = ObserversLeakDetector.audit_interval
+    ObserversLeakDetector.audit_interval = None  # No audits of runners during test.
+    ObserversLeakDetector.reset()
+    yield ObserversLeakDetector
+    ObserversLeakDetector.audit_interval = audit_interval
+    ObserversLeakDetector.reset()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for benchmark of parsers.
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+import os
+
+import pytest
+
+from moler.util.parsers_benchmark import (
+    benchmark_parsers,
+    compare_with_baseline,
+    format_benchmark_results,
+    load_benchmark_results,
+    save_benchmark_results,
+    ParserBenchmarkResult,
+)
+
+
+def test_benchmark_parsers_measures_commands(cmd_path):
+    results = benchmark_parsers(path2cmds=cmd_path, repetitions=2, name_filter="moler.cmd.unix.uname.")
+    assert len(results) == 1
+    result = results[0]
+    assert result.name == "moler.cmd.unix.uname.Uname"
+    assert result.error is None
+    assert result.variants >= 1
+    assert result.lines > 0
+    assert result.lines_per_second > 0
+    assert result.bytes_per_second > result.lines_per_second
+
+
+def test_benchmark_parsers_measures_events(events_path):
+    results = benchmark_parsers(path2cmds=events_path, repetitions=2, name_filter=".wait4prompt.")
+    assert [result.name for result in results] == ["moler.events.unix.wait4prompt.Wait4prompt"]
+    assert results[0].error is None
+    assert results[0].lines_per_second > 0
+
+
+def test_benchmark_results_compared_with_saved_baseline(tmp_path):
+    baseline_results = [_result(name="Fast", lines_per_second=1000.0), _result(name="Slow", lines_per_second=1000.0)]
+    baseline_path = str(tmp_path / "baseline.json")
+    save_benchmark_results(baseline_results, baseline_path)
+    baseline = load_benchmark_results(baseline_path)
+
+    results = [_result(name="Fast", lines_per_second=900.0), _result(name="Slow", lines_per_second=500.0),
+               _result(name="New", lines_per_second=10.0)]
+    regressions = compare_with_baseline(results, baseline, tolerance=0.2)
+    assert [regression.name for regression in regressions] == ["Slow"]
+    assert regressions[0].ratio == 0.5
+    report = format_benchmark_results(results, baseline=baseline)
+    assert report.splitlines()[1].startswith("New")
+    assert "0.50x" in report
+
+
+def _result(name, lines_per_second):
+    return ParserBenchmarkResult(name=name, variants=1, lines=10, bytes=100, seconds=10 / lines_per_second,
+                                 lines_per_second=lines_per_second, bytes_per_second=10 * lines_per_second,
+                                 error=None)
+
+
+def _moler_path(*parts):
+    repo_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(repo_path, "moler", *parts)
+
+
+@pytest.fixture
+def cmd_path():
+    return _moler_path("cmd")
+
+
+@pytest.fixture
+def events_path():
+    return _moler_path("events")
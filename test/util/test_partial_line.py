@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for accumulator of not full line.
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+from moler.util.partial_line import PartialLine
+
+
+def test_partial_line_joins_all_chunks():
+    partial_line = PartialLine()
+    assert partial_line.is_empty() is True
+    for number in range(1000):
+        partial_line.append(str(number % 10))
+    assert len(partial_line) == 1000
+    assert len(partial_line._chunks) < 300  # pylint: disable=protected-access
+    assert partial_line.get_line() == "0123456789" * 100
+    assert partial_line.pop_line() == "0123456789" * 100
+    assert partial_line.is_empty() is True
+    assert len(partial_line) == 0
+    assert partial_line.pop_line() == ""
+
+
+def test_partial_line_returns_tail():
+    partial_line = PartialLine()
+    for chunk in ("abc", "def", "ghij"):
+        partial_line.append(chunk)
+    assert partial_line.get_tail(2) == "ij"
+    assert partial_line.get_tail(5) == "fghij"
+    assert partial_line.get_tail(7) == "defghij"
+    assert partial_line.get_tail(100) == "abcdefghij"
+    partial_line.set("xyz")
+    assert partial_line.get_line() == "xyz"
+    assert len(partial_line) == 3
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for profiler of regular expressions of RegexHelper.
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+import re
+
+import pytest
+
+from moler.cmd import RegexHelper
+
+
+def test_regex_helper_profiles_patterns_per_owner(regex_profiler):
+    regex_helper = RegexHelper(owner=Parser())
+    compiled = re.compile(r"(\d+) packets")
+    for line in ("10 packets", "no data", "5 packets"):
+        regex_helper.search_compiled(compiled, line)
+    assert regex_helper.group(1) == "5"
+    regex_helper.match(r"no", "no data")
+    assert regex_helper.search(r"(\w+) data", "no data").group(1) == "no"
+    RegexHelper().match_compiled(compiled, "12 packets")
+
+    statistics = regex_profiler.get_statistics(owner="Parser")
+    assert len(statistics) == 3
+    search_stats = [item for item in statistics if item["pattern"] == r"(\w+) data"][0]
+    assert (search_stats["calls"], search_stats["hits"]) == (1, 1)
+    compiled_stats = [item for item in statistics if item["pattern"] == compiled.pattern][0]
+    assert compiled_stats["owner"] == f"{Parser.__module__}.Parser"
+    assert compiled_stats["calls"] == 3
+    assert compiled_stats["hits"] == 2
+    assert compiled_stats["hit_ratio"] == pytest.approx(2 / 3)
+    assert compiled_stats["max_time"] <= compiled_stats["total_time"]
+    assert [item["owner"] for item in regex_profiler.get_statistics(owner=None)].count(None) == 1
+    assert "3 calls" in regex_profiler.format_report()
+
+
+def test_regex_profiler_flags_catastrophic_backtracking(regex_profiler):
+    regex_helper = RegexHelper(owner=Parser())
+    backtracking = re.compile(r"^(a+)+b$")
+    linear = re.compile(r"a+b")
+    regex_profiler.long_line_length = 15
+    for line in ("a" * 10, "a" * 12, "a" * 20):
+        regex_helper.search_compiled(backtracking, line)
+        regex_helper.search_compiled(linear, line)
+    assert [item["pattern"] for item in regex_profiler.get_backtracking_candidates()] == [backtracking.pattern]
+    assert "BACKTRACKING?" in regex_profiler.format_report(top=1)
+    regex_profiler.reset()
+    assert regex_profiler.get_statistics() == []
+
+
+def test_regex_helper_does_not_profile_when_profiling_is_disabled(regex_profiler):
+    assert RegexHelper.disable_profiling() is regex_profiler
+    regex_helper = RegexHelper(owner=Parser())
+    assert regex_helper.search(r"\d+", "abc 123").group(0) == "123"
+    assert RegexHelper.profiler is None
+    assert regex_profiler.get_statistics() == []
+
+
+class Parser:
+    pass
+
+
+@pytest.fixture
+def regex_profiler():
+    profiler = RegexHelper.enable_profiling()
+    yield profiler
+    RegexHelper.disable_profiling()
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for binary recording of sessions.
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+import datetime
+import logging
+
+import pytest
+
+from moler.config.loggers import RAW_DATA, SessionRecordingHandler
+from moler.exceptions import WrongUsage
+from moler.threaded_moler_connection import ThreadedMolerConnection
+from moler.util.session_recording import SessionRecordingReader, SessionRecordingWriter
+
+
+def test_recording_is_read_lazily_and_seeks_to_time(recording_path):
+    with SessionRecordingWriter(recording_path, index_interval=2) as writer:
+        for number in range(7):
+            writer.write(direction=">" if number % 2 else "<", data=f"data {number}\n".encode("utf-8"),
+                         timestamp=number * 10.0)
+
+    with SessionRecordingReader(recording_path) as reader:
+        records = list(reader)
+        assert [record.data for record in records] == [f"data {number}\n".encode("utf-8") for number in range(7)]
+        assert [record.direction for record in records[:3]] == ["<", ">", "<"]
+        assert [entry[0] for entry in reader.index] == [0.0, 20.0, 40.0, 60.0]
+        assert [record.time for record in reader.seek(35.0)] == [40.0, 50.0, 60.0]
+        assert [record.time for record in reader.seek(-1.0)][0] == 0.0
+        assert list(reader.seek(61.0)) == []
+        assert reader.get_last_record().data == b"data 6\n"
+
+
+def test_recording_appended_after_interrupted_record(recording_path):
+    with SessionRecordingWriter(recording_path, index_interval=1) as writer:
+        writer.write(direction="<", data=b"first", timestamp=1.0)
+        start_time = writer.start_time
+    with open(recording_path, "ab") as recording_file:
+        recording_file.write(b"\x10\x00")  # Header of record cut by crash.
+
+    with SessionRecordingReader(recording_path) as reader:
+        assert [record.data for record in reader] == [b"first"]
+    with SessionRecordingWriter(recording_path, index_interval=1, mode="a") as writer:
+        writer.write(direction=">", data=b"second")
+        assert writer.start_time == start_time
+
+    with SessionRecordingReader(recording_path) as reader:
+        records = list(reader)
+        assert [record.data for record in records] == [b"first", b"second"]
+        assert records[1].time >= 1.0
+        assert [entry[1] for entry in reader.index] == [record.offset for record in records]
+
+
+def test_recording_rejects_wrong_file_and_direction(recording_path):
+    with open(recording_path, "wb") as not_recording:
+        not_recording.write(b"- 1536862639.4494998: {time: '20:17:19.449'}\n")
+    with pytest.raises(WrongUsage):
+        SessionRecordingReader(recording_path)
+    with SessionRecordingWriter(recording_path) as writer:
+        with pytest.raises(WrongUsage):
+            writer.write(direction=".", data=b"data")
+
+
+def test_session_recording_handler_records_data_of_connection(recording_path):
+    connection = ThreadedMolerConnection(how2send=lambda data: None, encoder=lambda data: data.encode("utf-8"),
+                                         decoder=lambda data: data.decode("utf-8"), name="session_recording")
+    logger = logging.getLogger("moler.test.session_recording")
+    logger.setLevel(RAW_DATA)
+    logger.propagate = False
+    handler = SessionRecordingHandler(filename=recording_path, mode="w")
+    logger.addHandler(handler)
+    connection.set_data_logger(logger)
+    try:
+        connection.sendline("uname")
+        connection.data_received(b"uname\nLinux\n", datetime.datetime.now())
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+        connection.shutdown()
+
+    with SessionRecordingReader(recording_path) as reader:
+        records = list(reader)
+    assert [(record.direction, record.data) for record in records] == [(">", b"uname\n"), ("<", b"uname\nLinux\n")]
+    assert records[0].time <= records[1].time
+
+
+@pytest.fixture
+def recording_path(tmp_path):
+    return str(tmp_path / "session.raw.rec")
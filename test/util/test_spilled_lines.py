@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for lines spilled to temporary file.
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+import pytest
+
+from moler.util.spilled_lines import SpilledLines
+
+
+def test_spilled_lines_kept_in_memory_below_limit():
+    lines = SpilledLines(max_bytes_in_memory=100, lines=["first", "second"])
+    assert lines.spilled is False
+    assert lines == ["first", "second"]
+    assert lines[-1] == "second"
+
+
+def test_spilled_lines_moved_to_file_over_limit():
+    expected = [f"line {nr} ą" for nr in range(1000)]
+    lines = SpilledLines(max_bytes_in_memory=100)
+    lines.extend(expected)
+    assert lines.spilled is True
+    assert len(lines) == 1000
+    assert lines[0] == "line 0 ą"
+    assert lines[-1] == "line 999 ą"
+    assert lines[10:13] == expected[10:13]
+    assert lines == expected
+    lines.append("the last one")
+    assert lines[1000] == "the last one"
+    with pytest.raises(IndexError):
+        lines[1001]
+    lines.close()
+    assert len(lines) == 0
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for recorder of trace events.
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+import json
+import threading
+import time
+
+import pytest
+
+from moler.connection_observer import ConnectionObserver
+from moler.exceptions import ConnectionObserverTimeout
+from moler.threaded_moler_connection import ThreadedMolerConnection
+from moler.util.trace_recorder import TraceRecorder
+
+
+def test_recorder_saves_events_in_trace_event_format(tmp_path):
+    recorder = TraceRecorder(max_events=3)
+    start_time = time.monotonic()
+    recorder.instant(name="dropped", category="test")
+    recorder.complete(name="span", category="test", start_time=start_time, end_time=start_time + 0.5,
+                      args={"key": "value"})
+    recorder.async_begin(name="observer", category="test", async_id=17)
+    recorder.async_end(name="observer", category="test", async_id=17)
+    path = str(tmp_path / "trace.json")
+    recorder.save(path)
+
+    with open(path) as trace_file:
+        trace = json.load(trace_file)
+    events = trace["traceEvents"]
+    assert [event["ph"] for event in events] == ["X", "b", "e", "M"]
+    assert events[0]["dur"] == pytest.approx(500000)
+    assert events[0]["args"] == {"key": "value"}
+    assert events[0]["tid"] == threading.get_native_id()
+    assert events[1]["id"] == events[2]["id"] == "0x11"
+    assert events[3]["args"]["name"] == threading.current_thread().name
+    recorder.clear()
+    assert [event["ph"] for event in recorder.get_events()] == ["M"]
+
+
+def test_command_and_io_traced_when_recording_is_on(buffer_connection):
+    from moler.cmd.unix.pwd import Pwd, COMMAND_OUTPUT, COMMAND_KWARGS
+    recorder = TraceRecorder.start()
+    try:
+        pwd = Pwd(connection=buffer_connection.moler_connection, **COMMAND_KWARGS)
+        buffer_connection.remote_inject_response([COMMAND_OUTPUT])
+        pwd(timeout=2)
+        _wait_for(lambda: len(_events_of(recorder, "observer", "e")) == 1)
+    finally:
+        assert TraceRecorder.stop() is recorder
+
+    begins = _events_of(recorder, "observer", "b")
+    ends = _events_of(recorder, "observer", "e")
+    assert begins[0]["name"] == ends[0]["name"] == "Pwd"
+    assert begins[0]["id"] == ends[0]["id"]
+    assert begins[0]["args"]["connection"] == "buffer"
+    reads = _events_of(recorder, "io", "X")
+    assert sum(event["args"]["bytes"] for event in reads) == len(COMMAND_OUTPUT)
+
+
+def test_feed_loop_and_timeout_traced_in_thread_pool_runner():
+    from moler.runner import ThreadPoolExecutorRunner
+    runner = ThreadPoolExecutorRunner()
+    observer = NeverDoneObserver(connection=ThreadedMolerConnection(), runner=runner)
+    recorder = TraceRecorder.start()
+    try:
+        observer.start(timeout=0.2)
+        with pytest.raises(ConnectionObserverTimeout):
+            observer.await_done()
+        _wait_for(lambda: len(_events_of(recorder, "observer", "X")) == 1)
+    finally:
+        TraceRecorder.stop()
+        runner.shutdown()
+
+    assert _events_of(recorder, "observer", "i")[0]["name"] == "timeout NeverDoneObserver"
+    feed_span = _events_of(recorder, "observer", "X")[0]
+    assert feed_span["name"] == "feed NeverDoneObserver"
+    assert feed_span["tid"] != threading.get_native_id()
+
+
+def test_nothing_recorded_when_recording_is_off(buffer_connection):
+    from moler.cmd.unix.pwd import Pwd, COMMAND_OUTPUT, COMMAND_KWARGS
+    recorder = TraceRecorder.start()
+    TraceRecorder.stop()
+    pwd = Pwd(connection=buffer_connection.moler_connection, **COMMAND_KWARGS)
+    buffer_connection.remote_inject_response([COMMAND_OUTPUT])
+    pwd(timeout=2)
+    assert TraceRecorder.active is None
+    assert recorder.get_events() == []
+
+
+class NeverDoneObserver(ConnectionObserver):
+    def data_received(self, data, recv_time):
+        pass
+
+
+def _events_of(recorder, category, phase):
+    return [event for event in recorder.get_events() if event.get("cat") == category and event["ph"] == phase]
+
+
+def _wait_for(condition, timeout=2.0):
+    start_time = time.monotonic()
+    while not condition() and time.monotonic() - start_time < timeout:
+        time.sleep(0.01)
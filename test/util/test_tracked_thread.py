@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for inventory of threads and sampling of stacks.
+"""
+
+__author__ = 'Marcin Usielski'
+__copyright__ = 'Copyright (C) 2026, Nokia'
+__email__ = 'marcin.usielski@nokia.com'
+
+import os
+import signal
+import threading
+import time
+
+import pytest
+
+from moler.util import tracked_thread
+
+
+def test_threads_are_registered_with_roles(busy_thread):
+    from moler.io.raw.memory import ThreadedFifoBuffer
+    from moler.threaded_moler_connection import ThreadedMolerConnection
+    connection = ThreadedFifoBuffer(moler_connection=ThreadedMolerConnection(name="tracked_fifo"))
+    with connection.open():
+        assert tracked_thread.get_thread_role(connection.pulling_thread) == tracked_thread.ROLE_IO_PULLER
+        assert connection.pulling_thread in tracked_thread.get_threads(role=tracked_thread.ROLE_IO_PULLER)
+        counts = tracked_thread.get_role_counts()
+        assert counts[tracked_thread.ROLE_IO_PULLER] >= 1
+        assert counts["test_busy"] == 1
+        assert counts[tracked_thread.ROLE_UNREGISTERED] >= 1  # Main thread of pytest.
+    assert tracked_thread.get_thread_role() is None
+
+
+def test_sampled_stacks_are_folded_per_role(busy_thread):
+    stacks = tracked_thread.sample_stacks(duration=0.2, interval=0.005, role="test_busy")
+    assert stacks
+    assert all(stack.startswith("test_busy;") for stack in stacks)
+    assert any(stack.endswith("test_tracked_thread.py:_spin") for stack in stacks)
+    assert sum(stacks.values()) >= 10
+    folded = tracked_thread.format_folded_stacks(stacks)
+    stack, count = folded.splitlines()[0].rsplit(" ", 1)
+    assert stacks[stack] == int(count) == max(stacks.values())
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR2"), reason="SIGUSR2 is not available on this system")
+def test_signal_triggers_sampling_into_file(busy_thread, tmp_path):
+    previous_handler = tracked_thread.install_stacks_sampling_signal_handler(directory=str(tmp_path), duration=0.1)
+    try:
+        os.kill(os.getpid(), signal.SIGUSR2)
+        sampler = [thread for thread in threading.enumerate() if thread.name == "StacksSampler"][0]
+        sampler.join(timeout=5)
+    finally:
+        signal.signal(signal.SIGUSR2, previous_handler)
+    stacks_files = list(tmp_path.glob("moler.stacks.*.folded"))
+    assert len(stacks_files) == 1
+    assert "test_busy;" in stacks_files[0].read_text()
+
+
+def _spin(stop):
+    while not stop.is_set():
+        sum(range(100))
+
+
+@pytest.fixture
+def busy_thread():
+    stop = threading.Event()
+    thread = threading.Thread(target=_spin, args=(stop,), name="TestBusy")
+    thread.daemon = True
+    tracked_thread.register_thread(role="test_busy", thread=thread)
+    thread.start()
+    time.sleep(0.01)
+    yield thread
+    stop.set()
+    thread.join()